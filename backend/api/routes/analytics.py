@@ -2,13 +2,14 @@
 Analytics API routes
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import func, select, desc
 from pydantic import BaseModel
 import logging
 from datetime import datetime, timedelta
 
-from backend.database import get_db
+from backend.database import get_async_db
 from backend.models import Lead, Call, Meeting, CallOutcome, LeadStatus, MeetingStatus
 
 logger = logging.getLogger(__name__)
@@ -46,34 +47,34 @@ class VoicePerformanceStats(BaseModel):
 
 
 @router.get("/overview", response_model=AnalyticsOverview)
-async def get_analytics_overview(db: Session = Depends(get_db)):
+async def get_analytics_overview(db: AsyncSession = Depends(get_async_db)):
     """Get overall analytics overview"""
     try:
         # Total counts
-        total_leads = db.query(func.count(Lead.id)).scalar()
-        total_calls = db.query(func.count(Call.id)).scalar()
-        total_meetings = db.query(func.count(Meeting.id)).filter(
+        total_leads = await db.scalar(select(func.count(Lead.id)))
+        total_calls = await db.scalar(select(func.count(Call.id)))
+        total_meetings = await db.scalar(select(func.count(Meeting.id)).where(
             Meeting.status == MeetingStatus.SCHEDULED
-        ).scalar()
+        ))
 
         # Today's counts
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        calls_today = db.query(func.count(Call.id)).filter(
+        calls_today = await db.scalar(select(func.count(Call.id)).where(
             Call.started_at >= today_start
-        ).scalar()
+        ))
 
-        meetings_today = db.query(func.count(Meeting.id)).filter(
+        meetings_today = await db.scalar(select(func.count(Meeting.id)).where(
             Meeting.created_at >= today_start,
             Meeting.status == MeetingStatus.SCHEDULED
-        ).scalar()
+        ))
 
         # Conversion rate (meetings / calls)
         conversion_rate = (total_meetings / total_calls * 100) if total_calls > 0 else 0.0
 
         # Average call duration
-        avg_duration = db.query(func.avg(Call.duration)).filter(
+        avg_duration = await db.scalar(select(func.avg(Call.duration)).where(
             Call.duration.isnot(None)
-        ).scalar() or 0.0
+        )) or 0.0
 
         return AnalyticsOverview(
             total_leads=total_leads or 0,
@@ -91,13 +92,15 @@ async def get_analytics_overview(db: Session = Depends(get_db)):
 
 
 @router.get("/call-outcomes")
-async def get_call_outcomes(db: Session = Depends(get_db)):
+async def get_call_outcomes(db: AsyncSession = Depends(get_async_db)):
     """Get call outcome distribution"""
     try:
-        outcomes = db.query(
-            Call.outcome,
-            func.count(Call.id).label('count')
-        ).group_by(Call.outcome).all()
+        outcomes = (await db.execute(
+            select(
+                Call.outcome,
+                func.count(Call.id).label('count')
+            ).group_by(Call.outcome)
+        )).all()
 
         return {
             "outcomes": [
@@ -112,15 +115,17 @@ async def get_call_outcomes(db: Session = Depends(get_db)):
 
 
 @router.get("/language-distribution")
-async def get_language_distribution(db: Session = Depends(get_db)):
+async def get_language_distribution(db: AsyncSession = Depends(get_async_db)):
     """Get language distribution of calls"""
     try:
-        languages = db.query(
-            Call.language,
-            func.count(Call.id).label('count')
-        ).filter(
-            Call.language.isnot(None)
-        ).group_by(Call.language).all()
+        languages = (await db.execute(
+            select(
+                Call.language,
+                func.count(Call.id).label('count')
+            ).where(
+                Call.language.isnot(None)
+            ).group_by(Call.language)
+        )).all()
 
         return {
             "languages": [
@@ -137,16 +142,18 @@ async def get_language_distribution(db: Session = Depends(get_db)):
 
 
 @router.get("/lead-status-distribution")
-async def get_lead_status_distribution(db: Session = Depends(get_db)):
+async def get_lead_status_distribution(db: AsyncSession = Depends(get_async_db)):
     """
     Get lead status distribution
     Returns count of leads in each status
     """
     try:
-        statuses = db.query(
-            Lead.status,
-            func.count(Lead.id).label('count')
-        ).group_by(Lead.status).all()
+        statuses = (await db.execute(
+            select(
+                Lead.status,
+                func.count(Lead.id).label('count')
+            ).group_by(Lead.status)
+        )).all()
 
         # Calculate total for percentage
         total_leads = sum(count for _, count in statuses)
@@ -169,15 +176,19 @@ async def get_lead_status_distribution(db: Session = Depends(get_db)):
 
 
 @router.get("/recent-activity")
-async def get_recent_activity(limit: int = 10, db: Session = Depends(get_db)):
+async def get_recent_activity(limit: int = 10, db: AsyncSession = Depends(get_async_db)):
     """Get recent activity from calls, meetings, and leads"""
     try:
         activities = []
 
-        # Get recent calls
-        recent_calls = db.query(Call).join(Lead, Call.lead_id == Lead.id).order_by(
-            Call.started_at.desc()
-        ).limit(limit).all()
+        # Get recent calls (lead loaded eagerly - no lazy loads on AsyncSession)
+        recent_calls = (await db.scalars(
+            select(Call).join(Lead, Call.lead_id == Lead.id).options(
+                selectinload(Call.lead)
+            ).order_by(
+                Call.started_at.desc()
+            ).limit(limit)
+        )).all()
 
         for call in recent_calls:
             if call.started_at:
@@ -197,9 +208,13 @@ async def get_recent_activity(limit: int = 10, db: Session = Depends(get_db)):
                 })
 
         # Get recent meetings
-        recent_meetings = db.query(Meeting).join(Lead, Meeting.lead_id == Lead.id).order_by(
-            Meeting.created_at.desc()
-        ).limit(limit).all()
+        recent_meetings = (await db.scalars(
+            select(Meeting).join(Lead, Meeting.lead_id == Lead.id).options(
+                selectinload(Meeting.lead)
+            ).order_by(
+                Meeting.created_at.desc()
+            ).limit(limit)
+        )).all()
 
         for meeting in recent_meetings:
             activities.append({
@@ -213,8 +228,9 @@ async def get_recent_activity(limit: int = 10, db: Session = Depends(get_db)):
 
         # Get recent lead imports (count leads created in batches within 5 minutes)
         # This is a simple approach - group leads by creation time rounded to 5 min intervals
-        from sqlalchemy import desc
-        recent_leads = db.query(Lead).order_by(desc(Lead.created_at)).limit(limit * 5).all()
+        recent_leads = (await db.scalars(
+            select(Lead).order_by(desc(Lead.created_at)).limit(limit * 5)
+        )).all()
 
         lead_batches = {}
         for lead in recent_leads:
@@ -251,14 +267,16 @@ async def get_recent_activity(limit: int = 10, db: Session = Depends(get_db)):
 
 
 @router.get("/active-campaigns")
-async def get_active_campaigns(db: Session = Depends(get_db)):
+async def get_active_campaigns(db: AsyncSession = Depends(get_async_db)):
     """Get active campaigns status"""
     try:
         # Count leads by status to show campaign progress
-        status_counts = db.query(
-            Lead.status,
-            func.count(Lead.id).label('count')
-        ).group_by(Lead.status).all()
+        status_counts = (await db.execute(
+            select(
+                Lead.status,
+                func.count(Lead.id).label('count')
+            ).group_by(Lead.status)
+        )).all()
 
         status_dict = {status.value: count for status, count in status_counts}
 
@@ -297,7 +315,7 @@ async def get_active_campaigns(db: Session = Depends(get_db)):
 
 
 @router.get("/voice-performance", response_model=list[VoicePerformanceStats])
-async def get_voice_performance(db: Session = Depends(get_db)):
+async def get_voice_performance(db: AsyncSession = Depends(get_async_db)):
     """
     Get voice performance statistics.
 
@@ -310,20 +328,22 @@ async def get_voice_performance(db: Session = Depends(get_db)):
     try:
         # Query calls grouped by voice_id
         # Only include calls that have a voice_id set
-        voice_stats = db.query(
-            Call.voice_id,
-            Call.voice_name,
-            func.count(Call.id).label('total_calls'),
-            func.count(Meeting.id).label('meetings_booked'),
-            func.avg(Call.duration).label('avg_duration')
-        ).outerjoin(
-            Meeting, Call.id == Meeting.call_id
-        ).filter(
-            Call.voice_id.isnot(None)
-        ).group_by(
-            Call.voice_id,
-            Call.voice_name
-        ).all()
+        voice_stats = (await db.execute(
+            select(
+                Call.voice_id,
+                Call.voice_name,
+                func.count(Call.id).label('total_calls'),
+                func.count(Meeting.id).label('meetings_booked'),
+                func.avg(Call.duration).label('avg_duration')
+            ).outerjoin(
+                Meeting, Call.id == Meeting.call_id
+            ).where(
+                Call.voice_id.isnot(None)
+            ).group_by(
+                Call.voice_id,
+                Call.voice_name
+            )
+        )).all()
 
         results = []
         for stat in voice_stats:
@@ -0,0 +1,167 @@
+"""
+Internal API routes - process-level diagnostics (metrics)
+
+Metrics are per worker process; query each worker (or scrape them all)
+to get the full picture.
+"""
+from fastapi import APIRouter
+import os
+import time
+
+from backend.services.async_calendar import get_blocking_pool_stats
+from backend.services.freebusy_cache import get_freebusy_cache
+from backend.services.llm_resilience import get_hedge_stats, get_llm_circuit_breaker
+from backend.services.openai_client import get_openai_connection_stats
+from backend.services.rate_governor import get_rate_governor
+from backend.services.service_registry import get_service_registry
+from backend.services.slot_holds import get_slot_holds
+from backend.services.slot_index import get_slot_index
+from backend.utils.latency_metrics import get_turn_metrics
+from backend.utils.llm_usage import get_llm_usage_stats
+
+router = APIRouter()
+
+
+@router.get("/metrics/turn-latency")
+async def get_turn_latency():
+    """
+    Latency percentiles for speech turns in this worker
+
+    Returns p50/p95/p99 (ms) per turn stage and per tool.
+    """
+    metrics = get_turn_metrics()
+    snapshot = metrics.snapshot()
+    return {
+        "pid": os.getpid(),
+        "window_seconds": round(time.time() - metrics.started_at, 1),
+        "stages": snapshot.get("stages", {}),
+        "tools": snapshot.get("tools", {}),
+    }
+
+
+@router.post("/metrics/turn-latency/reset")
+async def reset_turn_latency():
+    """Start a new measurement window"""
+    get_turn_metrics().reset()
+    return {"message": "Turn latency metrics reset"}
+
+
+@router.get("/metrics/llm-usage")
+async def get_llm_usage():
+    """
+    Prompt token usage in this worker
+
+    Includes how many prompt tokens were served from OpenAI's prompt cache,
+    overall and for recently finished calls.
+    """
+    return {"pid": os.getpid(), **get_llm_usage_stats().snapshot()}
+
+
+@router.get("/metrics/openai-connections")
+async def get_openai_connections():
+    """
+    OpenAI connection reuse in this worker
+
+    A healthy shared pool shows new_connections far below requests.
+    """
+    return get_openai_connection_stats()
+
+
+@router.get("/metrics/response-cache")
+async def get_response_cache_stats():
+    """
+    LLM response cache in this worker
+
+    Hit rate and the LLM latency the hits avoided.
+    """
+    return {"pid": os.getpid(), **get_service_registry().llm.response_cache.stats()}
+
+
+@router.get("/metrics/model-routes")
+async def get_model_routes():
+    """
+    Model routing in this worker
+
+    Per route: model, max_tokens, completions, latency percentiles
+    (whole completion, and time to first chunk for streamed turns), tokens
+    and estimated cost in USD.
+    """
+    return {"pid": os.getpid(), **get_service_registry().llm.router.snapshot()}
+
+
+@router.post("/metrics/model-routes/reset")
+async def reset_model_routes():
+    """Start a new measurement window"""
+    get_service_registry().llm.router.reset_stats()
+    return {"message": "Model route metrics reset"}
+
+
+@router.get("/metrics/llm-resilience")
+async def get_llm_resilience():
+    """
+    LLM circuit breaker and hedged requests in this worker
+
+    A high hedge_rate means the hedge delay (route p95) is too low for the
+    current latency; deadline_exceeded counts turns that got a canned reply.
+    """
+    return {
+        "pid": os.getpid(),
+        "circuit_breaker": get_llm_circuit_breaker().snapshot(),
+        "hedging": get_hedge_stats().snapshot(),
+    }
+
+
+@router.get("/metrics/openai-budget")
+async def get_openai_budget():
+    """
+    Shared OpenAI request/token budget as seen by this worker
+
+    Levels are the bucket contents after this worker's last request (the
+    buckets themselves are shared through Redis). live_overdrafts counts live
+    turns that went ahead without budget; background_deferred counts deferred summaries.
+    """
+    return {"pid": os.getpid(), **get_rate_governor().snapshot()}
+
+
+@router.get("/metrics/freebusy-cache")
+async def get_freebusy_cache_stats():
+    """
+    Freebusy cache in this worker
+
+    Day-level hit rate and how many Google freebusy queries were still needed.
+    """
+    return {"pid": os.getpid(), **get_freebusy_cache().stats()}
+
+
+@router.get("/metrics/calendar-pool")
+async def get_calendar_pool_stats():
+    """
+    Calendar and Zoom API thread pools in this worker
+
+    Queue time (waiting for a pool thread) and API time are reported
+    separately per operation; growing queue times mean the pool is too small
+    for the call volume, growing API times mean the provider is slow.
+    """
+    return {"pid": os.getpid(), "pools": get_blocking_pool_stats()}
+
+
+@router.get("/metrics/slot-index")
+async def get_slot_index_stats():
+    """
+    Free-slot index lookups in this worker
+
+    served counts availability checks answered without Google; stale and
+    unavailable ones fell back to freebusy (is the beat job running?).
+    """
+    return {"pid": os.getpid(), **get_slot_index().stats()}
+
+
+@router.get("/metrics/slot-holds")
+async def get_slot_holds_stats():
+    """
+    Slot holds in this worker
+
+    skipped counts offered-slot candidates passed over because another call
+    held them; claim_conflicts counts bookings refused for the same reason.
+    """
+    return {"pid": os.getpid(), **get_slot_holds().stats()}
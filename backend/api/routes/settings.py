@@ -11,6 +11,8 @@ import logging
 from backend.database import get_db
 from backend.models.setting import Setting
 from backend.services.cache_service import get_cache_service
+from backend.services.model_router import ROUTES_CACHE_KEY, ROUTES_SETTING_KEY, validate_routes
+from backend.services.service_registry import get_service_registry
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/settings", tags=["settings"])
@@ -108,6 +110,9 @@ def update_system_prompt(
         cache.delete("settings:system_prompt_en")
         logger.info("Cleared system prompt cache")
 
+        # Reload the shared LLM service in this process
+        get_service_registry().reload_settings()
+
         return SettingResponse(
             key=setting.key,
             value=setting.value,
@@ -146,6 +151,76 @@ def get_default_system_prompt():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/model_routes", response_model=SettingResponse)
+def get_model_routes(db: Session = Depends(get_db)):
+    """
+    Get the model route overrides.
+
+    Returns "{}" (all defaults) if the setting has not been created.
+    """
+    try:
+        setting = db.query(Setting).filter(Setting.key == ROUTES_SETTING_KEY).first()
+        if setting:
+            return SettingResponse(
+                key=setting.key,
+                value=setting.value,
+                updated_at=setting.updated_at.isoformat()
+            )
+        return SettingResponse(key=ROUTES_SETTING_KEY, value="{}", updated_at="N/A")
+
+    except Exception as e:
+        logger.error(f"Error fetching model routes: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.put("/model_routes", response_model=SettingResponse)
+def update_model_routes(
+    update: SettingUpdate,
+    db: Session = Depends(get_db)
+):
+    """
+    Update the model route overrides.
+
+    Value is a JSON object of route name -> {"model", "max_tokens"} (any
+    subset), e.g. {"tool": {"model": "gpt-4o"}}. Omitted routes use the
+    defaults.
+    """
+    try:
+        try:
+            validate_routes(update.value)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        setting = db.query(Setting).filter(Setting.key == ROUTES_SETTING_KEY).first()
+
+        if setting:
+            setting.value = update.value
+        else:
+            setting = Setting(key=ROUTES_SETTING_KEY, value=update.value)
+            db.add(setting)
+
+        db.commit()
+        db.refresh(setting)
+        logger.info("Updated model routes setting")
+
+        # Clear cache so the new routes are loaded immediately
+        get_cache_service().delete(ROUTES_CACHE_KEY)
+        get_service_registry().reload_settings()
+
+        return SettingResponse(
+            key=setting.key,
+            value=setting.value,
+            updated_at=setting.updated_at.isoformat()
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error updating model routes: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/cache/clear")
 def clear_settings_cache():
     """
@@ -157,6 +232,7 @@ def clear_settings_cache():
     try:
         cache = get_cache_service()
         count = cache.clear_pattern("settings:*")
+        get_service_registry().reload_settings()
 
         logger.info(f"Cleared {count} cache key(s)")
         return {"message": f"Cleared {count} cache key(s)", "success": True}
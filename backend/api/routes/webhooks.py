@@ -1,14 +1,29 @@
 """
 Webhooks API routes - for Twilio callbacks
 """
-from fastapi import APIRouter, Depends, Request, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Request, HTTPException, WebSocket, WebSocketDisconnect
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
+import json
 import logging
+import time
 from datetime import datetime
-
-from backend.database import get_db
-from backend.models import Call, CallOutcome, Lead, LeadStatus, Meeting, MeetingStatus
-from backend.services import TwilioService
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import get_settings
+from backend.database import get_async_db, AsyncSessionLocal
+from backend.models import Call, CallOutcome, Lead, LeadStatus, Meeting, MeetingStatus, SpeakerRole
+from backend.services import TwilioService, LLMService
+from backend.services.llm_resilience import canned_reply
+from backend.services.llm_service import ConversationIntent
+from backend.services.call_session_store import CallSession, get_call_session_store
+from backend.services.service_registry import get_llm_service
+from backend.services.slot_holds import get_slot_holds
+from backend.services.webhook_idempotency import get_webhook_replay_cache
+from backend.utils.latency_metrics import get_turn_metrics
+from backend.utils.llm_usage import get_llm_usage_stats
+from backend.utils.sentence_chunker import SentenceChunker
 from backend.workers.tasks import finalize_call
 
 logger = logging.getLogger(__name__)
@@ -16,8 +31,205 @@ router = APIRouter()
 twilio_service = TwilioService()
 
 
+async def _apply_turn_result(
+    db: AsyncSession,
+    session: CallSession,
+    intent: str,
+    ai_response: str,
+    tool_calls: Optional[List[Dict]]
+) -> bool:
+    """
+    Apply the result of an AI turn: save bookings, record the AI reply and
+    update call/lead outcome.
+
+    Shared by the Gather webhook and the media-stream websocket.
+
+    Args:
+        db: Async database session
+        session: Call session
+        intent: Conversation intent from LLMService
+        ai_response: Text the AI spoke
+        tool_calls: Tools executed during the turn
+
+    Returns:
+        True if the call should end after this response
+    """
+    outcome = CallOutcome(session.outcome) if session.outcome else None
+    call_updates = {}
+    lead_status = None
+    meeting_booked = False
+
+    # Handle tool calls (e.g., meeting booking)
+    if tool_calls:
+        for tool_call in tool_calls:
+            logger.info(f"Tool executed: {tool_call['tool']}")
+
+            # If meeting was booked, save to database
+            if tool_call['tool'] == 'book_meeting' and tool_call['result'].get('success'):
+                meeting_args = tool_call['args']
+                meeting_datetime = datetime.fromisoformat(meeting_args['datetime'])
+
+                # Get Zoom meeting link only
+                meeting_link = tool_call['result'].get('zoom_link')
+
+                meeting = Meeting(
+                    lead_id=session.lead_id,
+                    call_id=session.call_id,
+                    scheduled_time=meeting_datetime,
+                    guest_email=meeting_args['guest_email'],
+                    calendar_event_id=tool_call['result'].get('event_id'),
+                    duration=meeting_args.get('duration_minutes', 30),
+                    meeting_link=meeting_link,
+                    status=MeetingStatus.SCHEDULED
+                )
+                db.add(meeting)
+                meeting_booked = True
+
+                # Update call and lead
+                outcome = CallOutcome.INTERESTED  # Meeting scheduled = interested
+                lead_status = LeadStatus.MEETING_SCHEDULED
+
+                logger.info(f"✅ Meeting booked! Event ID: {meeting.calendar_event_id}, Link: {meeting_link}")
+
+    # Save AI response
+    get_call_session_store().append_turn(session, SpeakerRole.AI, ai_response)
+
+    # Determine if we should end the call and set outcome
+    end_call = False
+
+    if intent == ConversationIntent.MEETING_BOOKED:
+        logger.info("Meeting successfully booked, will end call after confirmation")
+        outcome = CallOutcome.INTERESTED  # Meeting scheduled = interested
+        end_call = True
+
+    elif intent == ConversationIntent.NOT_INTERESTED:
+        logger.info("User not interested, ending call")
+        outcome = CallOutcome.NOT_INTERESTED
+        lead_status = LeadStatus.NOT_INTERESTED
+        end_call = True
+
+    elif intent == ConversationIntent.END_CALL:
+        logger.info("Conversation complete, ending call")
+        # If no outcome set yet, mark as BUSY (interested but no meeting)
+        if outcome not in [CallOutcome.INTERESTED, CallOutcome.NOT_INTERESTED]:
+            outcome = CallOutcome.BUSY
+        call_updates["ended_at"] = datetime.utcnow()
+        end_call = True
+
+    elif intent in [ConversationIntent.INTERESTED, ConversationIntent.SCHEDULE_MEETING]:
+        # User shows interest or is scheduling - mark as BUSY for now
+        # Don't overwrite if meeting already booked (INTERESTED) or user declined (NOT_INTERESTED)
+        logger.info(f"User interested, continuing conversation with intent: {intent}")
+        if outcome not in [CallOutcome.INTERESTED, CallOutcome.NOT_INTERESTED]:
+            outcome = CallOutcome.BUSY  # Interested but no meeting yet
+        end_call = False
+
+    else:
+        # NEEDS_INFO - continue conversation
+        logger.info(f"Continuing conversation with intent: {intent}")
+        end_call = False
+
+    # Write only what changed (no read-modify-write of Call/Lead rows)
+    if outcome is not None and outcome.value != session.outcome:
+        call_updates["outcome"] = outcome
+        session.outcome = outcome.value
+
+    if call_updates:
+        await db.execute(update(Call).where(Call.id == session.call_id).values(**call_updates))
+    if lead_status:
+        await db.execute(update(Lead).where(Lead.id == session.lead_id).values(status=lead_status))
+    if call_updates or lead_status or meeting_booked:
+        with get_turn_metrics().span("commit"):
+            await db.commit()
+
+    return end_call
+
+
+# Slow turns handed off to the background, keyed by CallSid (this process only)
+_background_turns: Dict[str, asyncio.Task] = {}
+
+# Spoken while a slow turn finishes
+INTERIM_PHRASES = {
+    "en": "One moment, let me check that for you.",
+    "he": "רק רגע, אני בודקת.",
+    "fr": "Un instant, je vérifie.",
+    "es": "Un momento, déjame comprobarlo.",
+    "de": "Einen Moment, ich sehe kurz nach."
+}
+
+TECHNICAL_ISSUE_MESSAGE = "I apologize, but I encountered a technical issue. Please try calling back. Goodbye."
+
+
+async def _run_turn(llm_service: LLMService, session: CallSession, speech_result: str) -> Tuple[str, bool]:
+    """
+    Run one conversational turn: LLM + tools, then persist the result.
+
+    Uses its own database session so it can outlive the webhook request
+    when the reply is handed off to the continuation endpoint.
+
+    Args:
+        llm_service: Shared LLM service
+        session: Call session
+        speech_result: Caller's transcribed speech
+
+    Returns:
+        Tuple of (ai_response, end_call)
+    """
+    session_store = get_call_session_store()
+    turn_started = time.perf_counter()
+
+    # Save user message
+    session_store.append_turn(session, SpeakerRole.USER, speech_result)
+
+    # Get LLM response with tools (services come from the process-wide registry)
+    intent, ai_response, tool_calls = await llm_service.get_response_with_tools(
+        user_message=speech_result,
+        conversation_history=session.messages[:-1],
+        lead_info=session.lead_info,
+        session=session
+    )
+
+    logger.info(f"AI Intent: {intent}, Tools used: {len(tool_calls) if tool_calls else 0}")
+
+    # Persist booking/outcome and record the AI turn
+    async with AsyncSessionLocal() as db:
+        end_call = await _apply_turn_result(db, session, intent, ai_response, tool_calls)
+
+    session_store.save(session)
+    get_turn_metrics().record("turn_total", (time.perf_counter() - turn_started) * 1000)
+    return ai_response, end_call
+
+
+def _store_pending_reply(call_sid: str, task: asyncio.Task) -> None:
+    """Park a finished background turn's reply for the continuation"""
+    _background_turns.pop(call_sid, None)
+    if task.cancelled():
+        return
+
+    if task.exception() is not None:
+        logger.error(f"Background turn failed for {call_sid}: {task.exception()}")
+        reply = {"text": TECHNICAL_ISSUE_MESSAGE, "end_call": True}
+    else:
+        ai_response, end_call = task.result()
+        reply = {"text": ai_response, "end_call": end_call}
+    # _run_turn already saved the session; only the reply is handed over
+    get_call_session_store().put_pending_reply(call_sid, reply)
+
+
+def _interim_twiml(language: str, attempt: int) -> str:
+    """Filler phrase + redirect to the continuation endpoint"""
+    redirect_url = (
+        f"{get_settings().api_base_url}/api/webhooks/twilio/process-speech/continue?attempt={attempt}"
+    )
+    return twilio_service.generate_twiml_interim(
+        INTERIM_PHRASES.get(language, INTERIM_PHRASES["en"]),
+        redirect_url,
+        language
+    )
+
+
 @router.post("/twilio/status")
-async def twilio_status_callback(request: Request, db: Session = Depends(get_db)):
+async def twilio_status_callback(request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     Handle Twilio call status updates
     """
@@ -30,22 +242,39 @@ async def twilio_status_callback(request: Request, db: Session = Depends(get_db)
         logger.info(f"Twilio status callback: {call_sid} - {call_status}")
 
         # Find call in database
-        call = db.query(Call).filter(Call.twilio_call_sid == call_sid).first()
+        call = await db.scalar(select(Call).where(Call.twilio_call_sid == call_sid))
 
         if not call:
             logger.warning(f"Call not found: {call_sid}")
             return {"status": "ok"}
 
+        if call_status in ['completed', 'busy', 'no-answer', 'failed']:
+            # Call is over - keep its token usage, persist queued conversation
+            # turns and drop the session
+            session_store = get_call_session_store()
+            session = session_store.get(call_sid)
+            if session is not None and session.llm_completions:
+                get_llm_usage_stats().finish_call(
+                    call_sid,
+                    prompt_tokens=session.prompt_tokens,
+                    cached_prompt_tokens=session.cached_prompt_tokens,
+                    completions=session.llm_completions
+                )
+                logger.info(
+                    f"LLM usage for {call_sid}: {session.prompt_tokens} prompt tokens, "
+                    f"{session.cached_prompt_tokens} cached, {session.llm_completions} completions"
+                )
+            await session_store.end_session(call_sid)
+            # Slots offered on this call are free for other calls again
+            get_slot_holds().release_call(call_sid)
+
         # Update call based on status
         if call_status == 'completed':
             call.ended_at = datetime.utcnow()
             if call_duration:
                 call.duration = float(call_duration)
 
-            # Get recording URL if available
-            recording_url = twilio_service.get_call_recording_url(call_sid)
-            if recording_url:
-                call.recording_url = recording_url
+            # Recording URL arrives via /twilio/recording-status (no Twilio API call here)
 
             # Update call outcome if not already set
             # Only set default if no outcome was ever determined
@@ -53,12 +282,13 @@ async def twilio_status_callback(request: Request, db: Session = Depends(get_db)
                 call.outcome = CallOutcome.BUSY  # Default for completed calls
 
             # Update lead status
-            lead = db.query(Lead).filter(Lead.id == call.lead_id).first()
+            lead = await db.get(Lead, call.lead_id)
             if lead:
                 lead.status = LeadStatus.CONTACTED
 
             # Trigger finalization task to generate transcript and summary
-            finalize_call.delay(call.id)
+            # (short delay covers turns another worker is still flushing)
+            finalize_call.apply_async(args=[call.id], countdown=5)
             logger.info(f"Triggered finalize_call task for call {call.id}")
 
         elif call_status in ['busy', 'no-answer', 'failed']:
@@ -66,22 +296,58 @@ async def twilio_status_callback(request: Request, db: Session = Depends(get_db)
             call.outcome = CallOutcome.NO_ANSWER  # Map all technical failures to NO_ANSWER
 
             # Update lead
-            lead = db.query(Lead).filter(Lead.id == call.lead_id).first()
+            lead = await db.get(Lead, call.lead_id)
             if lead:
                 lead.status = LeadStatus.NO_ANSWER
 
-        db.commit()
+        await db.commit()
 
         return {"status": "ok"}
 
     except Exception as e:
         logger.error(f"Twilio status callback error: {str(e)}", exc_info=True)
-        db.rollback()
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/twilio/recording-status")
+async def twilio_recording_status_callback(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    Handle Twilio recording status updates (recordingStatusCallback)
+
+    Stores the recording URL once Twilio has finished processing it, so the
+    call status webhook never has to query the recordings API.
+    """
+    try:
+        form_data = await request.form()
+        call_sid = form_data.get('CallSid')
+        recording_sid = form_data.get('RecordingSid')
+        recording_status = form_data.get('RecordingStatus')
+
+        logger.info(f"Twilio recording callback: {call_sid} - {recording_status}")
+
+        if recording_status == 'completed' and call_sid and recording_sid:
+            await db.execute(
+                update(Call).where(Call.twilio_call_sid == call_sid).values(
+                    recording_url=twilio_service.build_recording_url(recording_sid)
+                )
+            )
+            await db.commit()
+
+        return {"status": "ok"}
+
+    except Exception as e:
+        logger.error(f"Twilio recording callback error: {str(e)}", exc_info=True)
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/twilio/voice")
-async def twilio_voice_callback(request: Request, db: Session = Depends(get_db)):
+async def twilio_voice_callback(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    llm_service: LLMService = Depends(get_llm_service)
+):
     """
     Handle Twilio voice callback (when call is answered).
 
@@ -96,7 +362,7 @@ async def twilio_voice_callback(request: Request, db: Session = Depends(get_db))
         logger.info(f"Twilio voice callback: {call_sid}")
 
         # Find the call
-        call = db.query(Call).filter(Call.twilio_call_sid == call_sid).first()
+        call = await db.scalar(select(Call).where(Call.twilio_call_sid == call_sid))
 
         if not call:
             # Return generic TwiML as fallback
@@ -106,50 +372,42 @@ async def twilio_voice_callback(request: Request, db: Session = Depends(get_db))
             return Response(content=twiml, media_type="application/xml")
 
         # Get lead and language
-        lead = db.query(Lead).filter(Lead.id == call.lead_id).first()
+        lead = await db.get(Lead, call.lead_id)
         language = call.language or 'en'
 
-        try:
-            # Import services
-            from backend.services import CalendarService, LLMService
-            from backend.services.zoom_service import ZoomService
-            from backend.models import ConversationHistory, SpeakerRole
-
-            # Generate personalized opening message
-            calendar_service = CalendarService()
-            zoom_service = ZoomService()
-            llm_service = LLMService(calendar_service=calendar_service, zoom_service=zoom_service)
+        # Seed per-call state so speech turns don't hit the database
+        session_store = get_call_session_store()
+        session = session_store.create(call_sid, call, lead)
 
+        try:
+            # Generate personalized opening message (shared LLM service from registry)
             opening_message = await llm_service.generate_opening_message(
-                lead_info={
-                    "name": lead.name if lead else "there",
-                    "email": lead.email if lead else ""
-                }
+                lead_info=session.lead_info
             )
 
-            # Save AI opening to conversation history
-            ai_turn = ConversationHistory(
-                call_id=call.id,
-                role=SpeakerRole.AI,
-                message=opening_message
-            )
-            db.add(ai_turn)
-            db.commit()
+            # Save AI opening to conversation history (persisted write-behind)
+            session_store.append_turn(session, SpeakerRole.AI, opening_message)
 
             logger.info(f"Generated personalized opening for {call_sid}: {opening_message[:50]}...")
 
-            # Return TwiML with personalized message (no generic greeting)
-            twiml = twilio_service.generate_twiml_response(
-                opening_message,
-                language,
-                end_call=False
-            )
+            if get_settings().twilio_media_stream_enabled:
+                # Streaming pipeline: opening is spoken as the websocket welcome greeting
+                twiml = twilio_service.generate_twiml_media_stream(opening_message, language)
+            else:
+                # Return TwiML with personalized message (no generic greeting)
+                twiml = twilio_service.generate_twiml_response(
+                    opening_message,
+                    language,
+                    end_call=False
+                )
 
         except Exception as e:
             logger.warning(f"Failed to generate opening message: {e}, falling back to generic greeting")
             # Fall back to generic greeting if LLM fails
             twiml = twilio_service.generate_twiml_greeting(language)
 
+        session_store.save(session)
+
         from fastapi.responses import Response
         return Response(content=twiml, media_type="application/xml")
 
@@ -161,179 +419,373 @@ async def twilio_voice_callback(request: Request, db: Session = Depends(get_db))
         return Response(content=error_twiml, media_type="application/xml")
 
 
+async def _replay_or_process(request: Request, handler):
+    """
+    Run a Gather webhook at most once per Twilio request.
+
+    Twilio retries slow webhooks; a retry gets the TwiML rendered for the
+    original request instead of re-running the turn (no duplicate LLM call,
+    no duplicate booking).
+
+    Args:
+        request: Incoming webhook request
+        handler: async (form_data) -> TwiML string
+
+    Returns:
+        XML response
+    """
+    from fastapi.responses import Response
+
+    with get_turn_metrics().span("form_parse"):
+        form_data = await request.form()
+    call_sid = form_data.get('CallSid')
+    replay_cache = get_webhook_replay_cache()
+    replay_key = replay_cache.make_key(call_sid, request.headers, form_data)
+
+    owner, twiml = await replay_cache.claim(replay_key)
+    if not owner:
+        if twiml is None:
+            # Original request is still running; don't start a second turn
+            logger.warning(f"Retried webhook for {call_sid} while original is still in flight")
+            session = get_call_session_store().get(call_sid) if call_sid else None
+            language = session.language if session else "en"
+            twiml = twilio_service.generate_twiml_response(
+                canned_reply(language, "retry"),
+                language,
+                end_call=False
+            )
+        else:
+            logger.info(f"Replaying cached TwiML for retried webhook from {call_sid}")
+        return Response(content=twiml, media_type="application/xml")
+
+    try:
+        twiml = await handler(form_data)
+    except BaseException:
+        replay_cache.release(replay_key)
+        raise
+    replay_cache.store(replay_key, twiml)
+    return Response(content=twiml, media_type="application/xml")
+
+
 @router.post("/twilio/process-speech")
-async def twilio_process_speech(request: Request, db: Session = Depends(get_db)):
+async def twilio_process_speech(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    llm_service: LLMService = Depends(get_llm_service)
+):
     """
     Process speech input from Twilio
     This is called after user speaks and processes the conversation with AI
+
+    Per-call state comes from the CallSessionStore, so a normal turn does no
+    database reads; only writes (meetings, outcome changes) touch the database.
+    Retries of the same request are answered from the webhook replay cache.
     """
+    return await _replay_or_process(
+        request, lambda form_data: _process_speech(form_data, db, llm_service)
+    )
+
+
+async def _process_speech(form_data, db: AsyncSession, llm_service: LLMService) -> str:
+    """Handle one Gather result and return the TwiML to speak"""
     try:
-        form_data = await request.form()
         call_sid = form_data.get('CallSid')
         speech_result = form_data.get('SpeechResult')
 
         logger.info(f"Speech received from {call_sid}: {speech_result}")
+        metrics = get_turn_metrics()
 
-        # Find call
-        call = db.query(Call).filter(Call.twilio_call_sid == call_sid).first()
+        # Find call state
+        session_store = get_call_session_store()
+        with metrics.span("session_lookup"):
+            session = session_store.get(call_sid)
 
-        if not call:
-            error_twiml = '<Response><Say>Error processing your response. Goodbye.</Say></Response>'
-            from fastapi.responses import Response
-            return Response(content=error_twiml, media_type="application/xml")
+            if session is None:
+                # Cold start (e.g. session evicted) - rebuild once from the database
+                await session_store.flush()
+                session = await session_store.load_from_db(db, call_sid)
+
+        if not session:
+            return '<Response><Say>Error processing your response. Goodbye.</Say></Response>'
+
+        # Get language
+        language = session.language
 
         if not speech_result or speech_result.strip() == '':
             # No speech detected, ask user to repeat
-            language = call.language or 'en'
             twiml = twilio_service.generate_twiml_response(
                 "I didn't catch that. Could you please repeat?",
                 language,
                 end_call=False
             )
-            from fastapi.responses import Response
-            return Response(content=twiml, media_type="application/xml")
-
-        # Import models and services
-        from backend.models import ConversationHistory, SpeakerRole, Lead
-        from backend.services import LLMService, CalendarService
-        from backend.services.zoom_service import ZoomService
-        from backend.services.llm_service import ConversationIntent
-
-        # Get language
-        language = call.language or 'en'
+            return twiml
 
         # Process conversation synchronously (since webhook needs immediate response)
         # We cannot use Celery here because Twilio needs TwiML response immediately
-        lead = db.query(Lead).filter(Lead.id == call.lead_id).first()
-
-        # Save user message
-        user_turn = ConversationHistory(
-            call_id=call.id,
-            role=SpeakerRole.USER,
-            message=speech_result
-        )
-        db.add(user_turn)
-        db.commit()
-
-        # Get conversation history
-        history = db.query(ConversationHistory).filter(
-            ConversationHistory.call_id == call.id
-        ).order_by(ConversationHistory.created_at).all()
-
-        conversation_messages = [
-            {
-                "role": "assistant" if turn.role == SpeakerRole.AI else "user",
-                "content": turn.message
-            }
-            for turn in history
-        ]
-
-        # Initialize services
-        calendar_service = CalendarService()
-        zoom_service = ZoomService()
-        llm_service = LLMService(calendar_service=calendar_service, zoom_service=zoom_service)
-
-        # Get LLM response with tools
-        intent, ai_response, tool_calls = await llm_service.get_response_with_tools(
-            user_message=speech_result,
-            conversation_history=conversation_messages[:-1],
-            lead_info={"name": lead.name if lead else "there", "email": lead.email if lead else ""}
-        )
-
-        logger.info(f"AI Intent: {intent}, Tools used: {len(tool_calls) if tool_calls else 0}")
-
-        # Handle tool calls (e.g., meeting booking)
-        if tool_calls:
-            for tool_call in tool_calls:
-                logger.info(f"Tool executed: {tool_call['tool']}")
-
-                # If meeting was booked, save to database
-                if tool_call['tool'] == 'book_meeting' and tool_call['result'].get('success'):
-                    meeting_args = tool_call['args']
-                    meeting_datetime = datetime.fromisoformat(meeting_args['datetime'])
-
-                    # Get Zoom meeting link only
-                    meeting_link = tool_call['result'].get('zoom_link')
-
-                    meeting = Meeting(
-                        lead_id=lead.id,
-                        call_id=call.id,
-                        scheduled_time=meeting_datetime,
-                        guest_email=meeting_args['guest_email'],
-                        calendar_event_id=tool_call['result'].get('event_id'),
-                        duration=meeting_args.get('duration_minutes', 30),
-                        meeting_link=meeting_link,
-                        status=MeetingStatus.SCHEDULED
-                    )
-                    db.add(meeting)
-
-                    # Update call and lead
-                    call.outcome = CallOutcome.INTERESTED  # Meeting scheduled = interested
-                    if lead:
-                        lead.status = LeadStatus.MEETING_SCHEDULED
-
-                    logger.info(f"✅ Meeting booked! Event ID: {meeting.calendar_event_id}, Link: {meeting_link}")
-
-        # Save AI response
-        ai_turn = ConversationHistory(
-            call_id=call.id,
-            role=SpeakerRole.AI,
-            message=ai_response
-        )
-        db.add(ai_turn)
-
-        # Determine if we should end the call and set outcome
-        end_call = False
+        turn_task = asyncio.create_task(_run_turn(llm_service, session, speech_result))
+
+        settings = get_settings()
+        if settings.interim_response_enabled:
+            done, _ = await asyncio.wait({turn_task}, timeout=settings.interim_latency_budget_ms / 1000)
+            if not done:
+                # Over budget: mask the latency with a filler phrase and pick up
+                # the finished reply on the continuation
+                logger.info(f"Turn for {call_sid} exceeded latency budget, sending interim response")
+                _background_turns[call_sid] = turn_task
+                turn_task.add_done_callback(lambda task: _store_pending_reply(call_sid, task))
+                twiml = _interim_twiml(language, attempt=1)
+                return twiml
+
+        ai_response, end_call = await turn_task
 
-        if intent == ConversationIntent.MEETING_BOOKED:
-            logger.info("Meeting successfully booked, will end call after confirmation")
-            call.outcome = CallOutcome.INTERESTED  # Meeting scheduled = interested
-            end_call = True
+        # Generate TwiML with AI response
+        # Using Twilio's built-in TTS (faster response time than ElevenLabs)
+        with metrics.span("twiml_render"):
+            twiml = twilio_service.generate_twiml_response(
+                ai_response,
+                language,
+                end_call=end_call
+            )
 
-        elif intent == ConversationIntent.NOT_INTERESTED:
-            logger.info("User not interested, ending call")
-            call.outcome = CallOutcome.NOT_INTERESTED
-            if lead:
-                lead.status = LeadStatus.NOT_INTERESTED
-            end_call = True
-
-        elif intent == ConversationIntent.END_CALL:
-            logger.info("Conversation complete, ending call")
-            # If no outcome set yet, mark as BUSY (interested but no meeting)
-            if call.outcome not in [CallOutcome.INTERESTED, CallOutcome.NOT_INTERESTED]:
-                call.outcome = CallOutcome.BUSY
-            call.ended_at = datetime.utcnow()
-            end_call = True
+        return twiml
 
-        elif intent in [ConversationIntent.INTERESTED, ConversationIntent.SCHEDULE_MEETING]:
-            # User shows interest or is scheduling - mark as BUSY for now
-            # Don't overwrite if meeting already booked (INTERESTED) or user declined (NOT_INTERESTED)
-            logger.info(f"User interested, continuing conversation with intent: {intent}")
-            if call.outcome not in [CallOutcome.INTERESTED, CallOutcome.NOT_INTERESTED]:
-                call.outcome = CallOutcome.BUSY  # Interested but no meeting yet
-            end_call = False
+    except Exception as e:
+        logger.error(f"Process speech error: {str(e)}", exc_info=True)
+        await db.rollback()
+        return f'<Response><Say>{TECHNICAL_ISSUE_MESSAGE}</Say><Hangup/></Response>'
 
+
+@router.post("/twilio/process-speech/continue")
+async def twilio_process_speech_continue(request: Request, attempt: int = 1):
+    """
+    Continuation for a turn that exceeded the latency budget.
+
+    Twilio lands here after speaking the filler phrase. Returns the finished
+    reply parked by the background turn, or another short filler + redirect if
+    the turn is still running. The reply is consumed when served, so retries
+    go through the replay cache too.
+    """
+    return await _replay_or_process(
+        request, lambda form_data: _process_speech_continue(form_data, attempt)
+    )
+
+
+async def _process_speech_continue(form_data, attempt: int) -> str:
+    """Return the parked reply (or another filler) for a continuation request"""
+    try:
+        call_sid = form_data.get('CallSid')
+        settings = get_settings()
+        budget = settings.interim_latency_budget_ms / 1000
+        session_store = get_call_session_store()
+
+        session = session_store.get(call_sid)
+        if session is None:
+            return '<Response><Say>Error processing your response. Goodbye.</Say></Response>'
+
+        # Turn running in this process: wake up as soon as it's done
+        local_task = _background_turns.get(call_sid)
+        if local_task is not None:
+            await asyncio.wait({local_task}, timeout=budget)
+            # Let the done-callback park the reply
+            await asyncio.sleep(0)
+
+        # Otherwise (or if it just finished) poll the shared handoff key
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (0 if local_task is not None else budget)
+        reply = session_store.pop_pending_reply(call_sid)
+        while reply is None and loop.time() < deadline:
+            await asyncio.sleep(0.1)
+            reply = session_store.pop_pending_reply(call_sid)
+
+        if reply is not None:
+            twiml = twilio_service.generate_twiml_response(
+                reply["text"],
+                session.language,
+                end_call=reply["end_call"]
+            )
+        elif attempt < settings.interim_max_redirects:
+            twiml = _interim_twiml(session.language, attempt=attempt + 1)
         else:
-            # NEEDS_INFO - continue conversation
-            logger.info(f"Continuing conversation with intent: {intent}")
-            end_call = False
+            logger.warning(f"Turn for {call_sid} still running after {attempt} redirects")
+            twiml = twilio_service.generate_twiml_response(
+                "Sorry, I lost you for a second. Could you say that again?",
+                session.language,
+                end_call=False
+            )
 
-        db.commit()
+        return twiml
 
-        # Generate TwiML with AI response
-        # Using Twilio's built-in TTS (faster response time than ElevenLabs)
-        twiml = twilio_service.generate_twiml_response(
-            ai_response,
-            language,
-            end_call=end_call
-        )
+    except Exception as e:
+        logger.error(f"Process speech continuation error: {str(e)}", exc_info=True)
+        return f'<Response><Say>{TECHNICAL_ISSUE_MESSAGE}</Say><Hangup/></Response>'
+
+
+async def _send_text(websocket: WebSocket, text: str, state: Dict[str, Any]) -> None:
+    """Send a response chunk to Twilio TTS unless the caller barged in"""
+    if state["muted"]:
+        return
+    await websocket.send_text(json.dumps({"type": "text", "token": text + " ", "last": False}))
+    state["sent"].append(text)
+
+
+async def _stream_turn(
+    websocket: WebSocket,
+    llm_service: LLMService,
+    session: CallSession,
+    prompt: str,
+    state: Dict[str, Any],
+    previous: Optional[asyncio.Task] = None
+) -> None:
+    """
+    Run one streamed conversational turn over the websocket.
+
+    Response tokens are grouped into sentences and sent as soon as each one
+    is complete, so TTS starts speaking while the model is still generating.
+
+    Args:
+        websocket: Twilio websocket
+        llm_service: Shared LLM service
+        session: Call session
+        prompt: Caller's transcribed speech
+        state: Per-turn state shared with the receive loop (barge-in handling)
+        previous: Earlier turn that must finish first (it was running tools)
+    """
+    if previous is not None:
+        await asyncio.gather(previous, return_exceptions=True)
 
-        from fastapi.responses import Response
-        return Response(content=twiml, media_type="application/xml")
+    session_store = get_call_session_store()
+    session_store.append_turn(session, SpeakerRole.USER, prompt)
+    turn = state["turn"]
+    chunker = SentenceChunker()
+
+    try:
+        async for token in llm_service.stream_response(
+            user_message=prompt,
+            conversation_history=session.messages[:-1],
+            lead_info=session.lead_info,
+            session=session,
+            turn=turn
+        ):
+            for chunk in chunker.feed(token):
+                await _send_text(websocket, chunk, state)
+
+        remaining = chunker.flush()
+        if remaining:
+            await _send_text(websocket, remaining, state)
+        if not state["muted"]:
+            await websocket.send_text(json.dumps({"type": "text", "token": "", "last": True}))
+
+        async with AsyncSessionLocal() as db:
+            end_call = await _apply_turn_result(
+                db, session, turn["intent"], turn["response"], turn["tool_calls"]
+            )
+        session_store.save(session)
+
+        if end_call:
+            await websocket.send_text(json.dumps({"type": "end"}))
+
+    except asyncio.CancelledError:
+        # Barge-in: keep only what the caller actually heard in the history
+        heard = state.get("heard") or " ".join(state["sent"])
+        if heard:
+            session_store.append_turn(session, SpeakerRole.AI, heard)
+        session_store.save(session)
+        logger.info(f"Turn interrupted by caller on {session.call_sid}")
+        raise
 
+
+def _interrupt_turn(task: Optional[asyncio.Task], state: Optional[Dict[str, Any]], heard: Optional[str] = None) -> bool:
+    """
+    Stop the AI speaking (barge-in)
+
+    Returns:
+        True if the turn was cancelled, False if it must finish (tools running)
+    """
+    if task is None or task.done():
+        return True
+    state["heard"] = heard
+    if state["turn"].get("tools_running"):
+        # Don't abandon a half-finished booking - finish silently instead
+        state["muted"] = True
+        return False
+    task.cancel()
+    return True
+
+
+@router.websocket("/twilio/media-stream")
+async def twilio_media_stream(websocket: WebSocket):
+    """
+    Streaming conversation websocket with token-streamed responses.
+
+    Speaks Twilio's ConversationRelay protocol: Twilio does speech-to-text and
+    TTS, this endpoint receives transcribed prompts and streams response text
+    back sentence by sentence.
+
+    Inbound messages:
+    - setup: stream connected (carries callSid)
+    - prompt: caller's transcribed speech (voicePrompt)
+    - interrupt: caller spoke over the AI (barge-in)
+
+    Outbound messages:
+    - text: response tokens for TTS (last=True closes the response)
+    - end: conversation finished, continue TwiML (hang up)
+    """
+    await websocket.accept()
+
+    llm_service = get_llm_service()
+    session_store = get_call_session_store()
+    session: Optional[CallSession] = None
+    current_task: Optional[asyncio.Task] = None
+    current_state: Optional[Dict[str, Any]] = None
+
+    try:
+        while True:
+            message = json.loads(await websocket.receive_text())
+            message_type = message.get("type")
+
+            if message_type == "setup":
+                call_sid = message.get("callSid")
+                session = session_store.get(call_sid)
+                if session is None:
+                    async with AsyncSessionLocal() as db:
+                        session = await session_store.load_from_db(db, call_sid)
+                if session is None:
+                    logger.warning(f"Media stream for unknown call {call_sid}, closing")
+                    await websocket.send_text(json.dumps({"type": "end"}))
+                    break
+                logger.info(f"Media stream connected: {call_sid}")
+
+            elif message_type == "prompt" and session is not None:
+                prompt = (message.get("voicePrompt") or "").strip()
+                if not prompt:
+                    continue
+
+                # Caller spoke again before the last reply finished
+                previous = None
+                if not _interrupt_turn(current_task, current_state):
+                    previous = current_task
+
+                current_state = {"turn": {}, "sent": [], "heard": None, "muted": False}
+                current_task = asyncio.create_task(
+                    _stream_turn(websocket, llm_service, session, prompt, current_state, previous)
+                )
+
+            elif message_type == "interrupt":
+                _interrupt_turn(current_task, current_state, message.get("utteranceUntilInterrupt"))
+
+            elif message_type == "error":
+                logger.error(f"Media stream error from Twilio: {message.get('description')}")
+
+    except WebSocketDisconnect:
+        logger.info(f"Media stream disconnected: {session.call_sid if session else 'unknown'}")
     except Exception as e:
-        logger.error(f"Process speech error: {str(e)}", exc_info=True)
-        db.rollback()
-        error_twiml = '<Response><Say>I apologize, but I encountered a technical issue. Please try calling back. Goodbye.</Say><Hangup/></Response>'
-        from fastapi.responses import Response
-        return Response(content=error_twiml, media_type="application/xml")
+        logger.error(f"Media stream error: {str(e)}", exc_info=True)
+    finally:
+        # Let a turn that is running tools finish; drop anything else
+        if current_task is not None and not current_task.done():
+            if current_state["turn"].get("tools_running"):
+                current_state["muted"] = True
+                await asyncio.gather(current_task, return_exceptions=True)
+            else:
+                current_task.cancel()
+
@@ -0,0 +1,6 @@
+"""
+Performance benchmarks
+
+Standalone scripts that measure hot-path costs. Run from the project root, e.g.:
+    python -m backend.benchmarks.bench_service_setup
+"""
@@ -0,0 +1,123 @@
+"""
+Benchmark: LLM deadlines, hedged requests and the circuit breaker
+
+Runs conversational turns through LLMService against the fake OpenAI
+server (backend/benchmarks/fake_openai_server.py) and reports:
+
+1. Tail latency with a slow minority of requests, hedging off vs on
+2. An injected outage: how quickly turns switch to canned replies once
+   the circuit opens, and that they recover afterwards
+
+Usage (from project root, with a configured .env):
+    python -m backend.benchmarks.bench_llm_resilience --turns 200 --concurrency 10
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+from typing import List, Tuple
+
+from backend.benchmarks.fake_openai_server import run_in_thread
+
+USER_MESSAGE = "Can you tell me a bit more about what your company actually does for businesses like mine?"
+
+
+def _report(label: str, timings: List[float], canned: int) -> None:
+    ordered = sorted(timings)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    print(
+        f"{label:<24} mean={statistics.mean(timings):8.1f} ms  p50={pct(0.50):8.1f} ms  "
+        f"p95={pct(0.95):8.1f} ms  p99={pct(0.99):8.1f} ms  canned={canned}"
+    )
+
+
+async def _run_turns(llm, turns: int, concurrency: int) -> Tuple[List[float], int]:
+    """Run `turns` turns, `concurrency` at a time; returns (latencies in ms, canned replies)"""
+    from backend.services.call_session_store import CallSession
+    from backend.services.llm_resilience import CANNED_REPLIES
+
+    canned_texts = {reply for replies in CANNED_REPLIES.values() for reply in replies.values()}
+    semaphore = asyncio.Semaphore(concurrency)
+    timings: List[float] = []
+    canned = 0
+
+    async def turn(i: int) -> None:
+        nonlocal canned
+        session = CallSession(call_sid=f"CABENCH{i}", call_id=i, lead_id=i)
+        async with semaphore:
+            start = time.perf_counter()
+            _, reply, _ = await llm.get_response_with_tools(USER_MESSAGE, [], None, session)
+            timings.append((time.perf_counter() - start) * 1000)
+            canned += reply in canned_texts
+
+    await asyncio.gather(*(turn(i) for i in range(turns)))
+    return timings, canned
+
+
+async def run(args: argparse.Namespace) -> None:
+    from backend.config import get_settings
+    from backend.services.llm_resilience import get_hedge_stats, get_llm_circuit_breaker
+    from backend.services.llm_service import LLMService
+
+    settings = get_settings()
+    settings.response_cache_enabled = False  # Every turn must reach the server
+
+    llm = LLMService()
+    faults = args.server.config.app.state.faults
+
+    # 1. Tail latency: a slow minority of requests
+    faults.update(latency_ms=args.latency_ms, slow_rate=args.slow_rate, slow_ms=args.slow_ms, error_rate=0.0)
+    await _run_turns(llm, 40, args.concurrency)  # Warm-up: route latency samples for the hedge delay
+
+    settings.llm_hedge_enabled = False
+    timings, canned = await _run_turns(llm, args.turns, args.concurrency)
+    _report("hedging off", timings, canned)
+
+    settings.llm_hedge_enabled = True
+    timings, canned = await _run_turns(llm, args.turns, args.concurrency)
+    _report("hedging on", timings, canned)
+    print(f"  hedges: {get_hedge_stats().snapshot()}")
+
+    # 2. Outage: every request fails, then the API recovers
+    faults.update(slow_rate=0.0, error_rate=1.0)
+    timings, canned = await _run_turns(llm, args.turns, args.concurrency)
+    _report("outage", timings, canned)
+    print(f"  breaker: {get_llm_circuit_breaker().snapshot()}")
+
+    faults.update(error_rate=0.0)
+    await asyncio.sleep(settings.llm_breaker_open_seconds)
+    await _run_turns(llm, 1, 1)  # Half-open probe closes the circuit
+    timings, canned = await _run_turns(llm, args.turns, args.concurrency)
+    _report("recovered", timings, canned)
+    print(f"  breaker: {get_llm_circuit_breaker().snapshot()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM resilience benchmark (fake OpenAI server)")
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=float, default=4000.0)
+    args = parser.parse_args()
+
+    # Failed turns log errors; keep output readable
+    logging.disable(logging.CRITICAL)
+
+    # The shared OpenAI client reads OPENAI_BASE_URL when it is first created
+    args.server = run_in_thread(args.port)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.port}/v1"
+    try:
+        asyncio.run(run(args))
+    finally:
+        args.server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: per-turn service setup cost
+
+Compares the old webhook path (build CalendarService, ZoomService and
+LLMService on every turn) with the process-wide ServiceRegistry.
+
+Usage (from project root, with a configured .env):
+    python -m backend.benchmarks.bench_service_setup --turns 50
+"""
+import argparse
+import logging
+import statistics
+import time
+from typing import Callable, List
+
+from backend.services.calendar_service import CalendarService
+from backend.services.llm_service import LLMService
+from backend.services.service_registry import ServiceRegistry
+from backend.services.zoom_service import ZoomService
+
+
+def _per_turn_construction() -> LLMService:
+    """What every webhook request used to do"""
+    calendar_service = CalendarService()
+    zoom_service = ZoomService()
+    return LLMService(calendar_service=calendar_service, zoom_service=zoom_service)
+
+
+def _measure(fn: Callable[[], object], turns: int) -> List[float]:
+    """Run fn `turns` times and return per-call durations in milliseconds"""
+    timings = []
+    for _ in range(turns):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[int(len(ordered) * 0.95) - 1] if len(ordered) > 1 else ordered[0]
+    print(
+        f"{label:<28} mean={statistics.mean(timings):9.3f} ms  "
+        f"p50={statistics.median(timings):9.3f} ms  p95={p95:9.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-turn service setup benchmark")
+    parser.add_argument("--turns", type=int, default=50, help="Simulated speech turns")
+    args = parser.parse_args()
+
+    # Service constructors log on every build; keep output readable
+    logging.disable(logging.WARNING)
+
+    registry = ServiceRegistry()
+    registry.warm_up()
+
+    before = _measure(_per_turn_construction, args.turns)
+    after = _measure(lambda: registry.llm, args.turns)
+
+    print(f"Per-turn service setup over {args.turns} turns")
+    _report("before (construct per turn)", before)
+    _report("after (service registry)", after)
+    print(f"speedup: {statistics.mean(before) / max(statistics.mean(after), 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: slot generation over large calendars
+
+Compares the previous slot loop (re-parses every busy interval for every
+candidate slot, O(slots x busy)) with the sweep-line engine in
+backend/services/slot_engine.py on synthetic calendars with thousands of
+events.
+
+Usage (from project root):
+    python -m backend.benchmarks.bench_slot_engine --events 500 2000 5000 --days 90
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+from backend.services.slot_engine import generate_slots, merge_busy
+
+
+def _legacy_slots(start_date: datetime, end_date: datetime, duration_minutes: int, busy_times: List[Dict[str, str]]) -> List[Dict]:
+    """The slot loop CalendarService used before the sweep-line engine"""
+    available_slots = []
+    current_time = start_date
+    if current_time.minute < 30:
+        current_time = current_time.replace(minute=30, second=0, microsecond=0)
+    elif current_time.minute > 30:
+        current_time = current_time.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    else:
+        current_time = current_time.replace(second=0, microsecond=0)
+
+    while current_time < end_date:
+        if current_time.hour < 9 or current_time.hour >= 17:
+            current_time += timedelta(hours=1)
+            continue
+        slot_end = current_time + timedelta(minutes=duration_minutes)
+        is_available = True
+        for busy in busy_times:
+            busy_start = datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
+            busy_end = datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
+            if current_time < busy_end and slot_end > busy_start:
+                is_available = False
+                current_time = busy_end
+                break
+        if is_available:
+            available_slots.append({
+                "start": current_time.isoformat(),
+                "end": slot_end.isoformat(),
+                "display": current_time.strftime("%A, %B %d at %I:%M %p")
+            })
+        current_time += timedelta(minutes=30)
+    return available_slots
+
+
+def _sweep_slots(start_date: datetime, end_date: datetime, duration_minutes: int, busy_times: List[Dict[str, str]]) -> List[Dict]:
+    """What CalendarService.compute_available_slots does now"""
+    return [
+        {
+            "start": slot_start.isoformat(),
+            "end": slot_end.isoformat(),
+            "display": slot_start.strftime("%A, %B %d at %I:%M %p")
+        }
+        for slot_start, slot_end in generate_slots(start_date, end_date, duration_minutes, merge_busy(busy_times))
+    ]
+
+
+def _calendar(events: int, start: datetime, days: int, seed: int = 7) -> List[Dict[str, str]]:
+    """Random events of 15-120 minutes, starting on 5-minute marks during working hours"""
+    rng = random.Random(seed)
+    busy = []
+    for _ in range(events):
+        event_start = start + timedelta(days=rng.randrange(days), hours=rng.randrange(8, 17), minutes=5 * rng.randrange(12))
+        event_end = event_start + timedelta(minutes=rng.choice([15, 30, 45, 60, 90, 120]))
+        busy.append({
+            "start": event_start.isoformat().replace('+00:00', 'Z'),
+            "end": event_end.isoformat().replace('+00:00', 'Z'),
+        })
+    return sorted(busy, key=lambda b: b["start"])
+
+
+def _measure(fn: Callable[[], List[Dict]], rounds: int) -> List[float]:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Slot generation benchmark")
+    parser.add_argument("--events", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--days", type=int, default=90, help="Calendar range in days")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    start = datetime(2026, 1, 5, 0, 0, tzinfo=timezone.utc)
+    end = start + timedelta(days=args.days)
+
+    print(f"Slot generation over {args.days} days, 30-minute slots ({args.rounds} rounds, median)")
+    print(f"{'events':>8} {'legacy ms':>12} {'sweep ms':>10} {'speedup':>8} {'slots (legacy/sweep)':>22}")
+    for events in args.events:
+        busy = _calendar(events, start, args.days)
+        legacy = statistics.median(_measure(lambda: _legacy_slots(start, end, 30, busy), args.rounds))
+        sweep = statistics.median(_measure(lambda: _sweep_slots(start, end, 30, busy), args.rounds))
+        counts = f"{len(_legacy_slots(start, end, 30, busy))}/{len(_sweep_slots(start, end, 30, busy))}"
+        print(f"{events:>8} {legacy:>12.1f} {sweep:>10.2f} {legacy / max(sweep, 1e-9):>7.0f}x {counts:>22}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: TwiML rendering per turn
+
+Compares building the VoiceResponse/Gather object tree on every turn with
+the precompiled templates used by TwilioService.generate_twiml_response.
+
+Usage (from project root, with a configured .env):
+    python -m backend.benchmarks.bench_twiml_render --iterations 20000
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from backend.services.twilio_service import TwilioService
+
+SAMPLE_TEXT = (
+    "Great, I have Tuesday at 10:30 AM or Wednesday at 2:00 PM. "
+    "Which one works better for you & your team?"
+)
+
+
+def _measure(fn: Callable[[], str], iterations: int, rounds: int = 5) -> List[float]:
+    """Return per-render durations in microseconds (mean of each round)"""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        timings.append((time.perf_counter() - start) * 1e6 / iterations)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TwiML render benchmark")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--end-call", action="store_true", help="Render the hangup variant")
+    args = parser.parse_args()
+
+    tree = lambda: TwilioService.build_twiml_response(SAMPLE_TEXT, "en", args.end_call)
+    compiled = lambda: TwilioService.generate_twiml_response(SAMPLE_TEXT, "en", args.end_call)
+
+    assert tree() == compiled(), "compiled template output differs from object tree"
+
+    before = _measure(tree, args.iterations)
+    after = _measure(compiled, args.iterations)
+
+    print(f"TwiML render, {args.iterations} iterations x 5 rounds (end_call={args.end_call})")
+    print(f"{'object tree':<20} best={min(before):8.2f} us  median={statistics.median(before):8.2f} us")
+    print(f"{'compiled template':<20} best={min(after):8.2f} us  median={statistics.median(after):8.2f} us")
+    print(f"speedup: {statistics.median(before) / max(statistics.median(after), 1e-9):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
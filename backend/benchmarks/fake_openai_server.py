@@ -0,0 +1,259 @@
+"""
+Fake OpenAI chat completions server with injectable latency and failures
+
+Serves /v1/chat/completions (plain, structured JSON-schema and streamed
+responses, with usage) so the live-call resilience code - deadlines,
+hedged requests, the circuit breaker - can be exercised without the real
+API. Faults can be changed while it runs via POST /control. A "script" of
+replies and tool calls can be queued for end-to-end tests of a call flow
+(backend/tests/test_webhook_flow.py).
+
+Usage (from project root):
+    python -m backend.benchmarks.fake_openai_server --port 8765 \\
+        --latency-ms 400 --slow-rate 0.05 --slow-ms 5000 --error-rate 0.02
+
+    # Point the app at it
+    OPENAI_BASE_URL=http://localhost:8765/v1 uvicorn backend.main:app
+
+    # Inject an outage, then recover
+    curl -X POST localhost:8765/control -H 'Content-Type: application/json' -d '{"error_rate": 1.0}'
+    curl -X POST localhost:8765/control -H 'Content-Type: application/json' -d '{"error_rate": 0.0}'
+"""
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+DEFAULT_REPLY = "Sure, happy to help. What would you like to know?"
+
+# Fault knobs (all adjustable through /control)
+DEFAULT_FAULTS: Dict[str, Any] = {
+    "latency_ms": 300.0,  # Median response latency
+    "latency_sigma": 0.25,  # Log-normal spread around the median
+    "slow_rate": 0.0,  # Fraction of requests that take slow_ms instead
+    "slow_ms": 5000.0,
+    "error_rate": 0.0,  # Fraction answered with HTTP 500
+    "rate_limit_rate": 0.0,  # Fraction answered with HTTP 429
+    "chunk_interval_ms": 20.0,  # Gap between streamed chunks
+    "reply": DEFAULT_REPLY,
+    # Scripted responses served in order before falling back to `reply`:
+    # {"reply", "intent", "end_call"} or {"tool_calls": [{"name", "arguments"}]}
+    "script": [],
+}
+
+
+def _latency_seconds(faults: Dict[str, Any]) -> float:
+    if random.random() < faults["slow_rate"]:
+        return faults["slow_ms"] / 1000
+    return faults["latency_ms"] * random.lognormvariate(0, faults["latency_sigma"]) / 1000
+
+
+def _content(body: Dict[str, Any], faults: Dict[str, Any], step: Optional[Dict[str, Any]] = None) -> str:
+    """Reply text, wrapped in the turn JSON if a json_schema format was requested"""
+    step = step or {}
+    reply = step.get("reply", faults["reply"])
+    if (body.get("response_format") or {}).get("type") == "json_schema":
+        return json.dumps({
+            "reply": reply,
+            "intent": step.get("intent", "NEEDS_INFO"),
+            "end_call": step.get("end_call", False),
+        })
+    return reply
+
+
+def _tool_calls(step: Dict[str, Any]) -> list:
+    """Scripted tool calls in the chat completions format"""
+    return [
+        {
+            "id": f"call_{uuid.uuid4().hex[:12]}",
+            "type": "function",
+            "function": {"name": call["name"], "arguments": call["arguments"]},
+        }
+        for call in step["tool_calls"]
+    ]
+
+
+def _usage(body: Dict[str, Any], content: str) -> Dict[str, Any]:
+    prompt_tokens = sum(len(str(m.get("content") or "")) for m in body.get("messages", [])) // 4 + 1
+    completion_tokens = len(content) // 4 + 1
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": 0},
+    }
+
+
+def create_app(faults: Optional[Dict[str, Any]] = None) -> FastAPI:
+    """
+    Build the fake server
+
+    Args:
+        faults: Overrides for DEFAULT_FAULTS
+
+    Returns:
+        FastAPI app
+    """
+    app = FastAPI(title="Fake OpenAI")
+    app.state.faults = {**DEFAULT_FAULTS, **(faults or {})}
+    app.state.faults["script"] = list(app.state.faults["script"])
+    app.state.counters = {"requests": 0, "errors": 0, "rate_limited": 0, "slow": 0}
+
+    @app.get("/control")
+    async def get_control():
+        return {"faults": app.state.faults, "counters": app.state.counters}
+
+    @app.post("/control")
+    async def update_control(request: Request):
+        updates = await request.json()
+        unknown = set(updates) - set(DEFAULT_FAULTS)
+        if unknown:
+            return JSONResponse({"error": f"unknown fault(s): {sorted(unknown)}"}, status_code=400)
+        app.state.faults.update(updates)
+        app.state.faults["script"] = list(app.state.faults["script"])
+        return {"faults": app.state.faults}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        faults = app.state.faults
+        counters = app.state.counters
+        counters["requests"] += 1
+
+        latency = _latency_seconds(faults)
+        if latency > faults["latency_ms"] * 3 / 1000:
+            counters["slow"] += 1
+        await asyncio.sleep(latency)
+
+        roll = random.random()
+        if roll < faults["error_rate"]:
+            counters["errors"] += 1
+            return JSONResponse(
+                {"error": {"message": "Injected server error", "type": "server_error"}}, status_code=500
+            )
+        if roll < faults["error_rate"] + faults["rate_limit_rate"]:
+            counters["rate_limited"] += 1
+            return JSONResponse(
+                {"error": {"message": "Injected rate limit", "type": "requests"}}, status_code=429
+            )
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+        model = body.get("model", "gpt-4o-mini")
+        step = faults["script"].pop(0) if faults["script"] else None
+
+        if step is not None and step.get("tool_calls"):
+            # Scripted tool calls are served non-streamed only
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": None, "tool_calls": _tool_calls(step)},
+                    "finish_reason": "tool_calls",
+                }],
+                "usage": _usage(body, ""),
+            }
+
+        content = _content(body, faults, step)
+        if not body.get("stream"):
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": _usage(body, content),
+            }
+
+        async def events():
+            def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+                payload = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                }
+                return f"data: {json.dumps(payload)}\n\n"
+
+            yield chunk({"role": "assistant", "content": ""})
+            for word in content.split(" "):
+                await asyncio.sleep(faults["chunk_interval_ms"] / 1000)
+                yield chunk({"content": word + " "})
+            yield chunk({}, finish_reason="stop")
+            if (body.get("stream_options") or {}).get("include_usage"):
+                usage = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": _usage(body, content),
+                }
+                yield f"data: {json.dumps(usage)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def run_in_thread(port: int, faults: Optional[Dict[str, Any]] = None) -> uvicorn.Server:
+    """
+    Start the fake server in a background thread (for benchmarks)
+
+    Args:
+        port: Port to listen on (localhost)
+        faults: Overrides for DEFAULT_FAULTS
+
+    Returns:
+        The running uvicorn server (set `should_exit = True` to stop it);
+        its app is `server.config.app`, faults at `server.config.app.state.faults`
+    """
+    config = uvicorn.Config(create_app(faults), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake OpenAI server with injectable faults")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=DEFAULT_FAULTS["latency_ms"])
+    parser.add_argument("--latency-sigma", type=float, default=DEFAULT_FAULTS["latency_sigma"])
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-ms", type=float, default=DEFAULT_FAULTS["slow_ms"])
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    faults = {
+        "latency_ms": args.latency_ms,
+        "latency_sigma": args.latency_sigma,
+        "slow_rate": args.slow_rate,
+        "slow_ms": args.slow_ms,
+        "error_rate": args.error_rate,
+        "rate_limit_rate": args.rate_limit_rate,
+    }
+    uvicorn.run(create_app(faults), host="127.0.0.1", port=args.port, log_level="info")
+
+
+if __name__ == "__main__":
+    main()
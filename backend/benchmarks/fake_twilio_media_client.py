@@ -0,0 +1,84 @@
+"""
+Fake Twilio client for the media-stream websocket
+
+Plays the Twilio side of the streaming protocol against a local API:
+sends setup + prompt messages, measures time to the first spoken chunk and
+to the end of the response, and can barge in part-way through a reply.
+
+Usage (from project root; the CallSid must have a live call session,
+e.g. created by posting to /api/webhooks/twilio/voice first):
+    python -m backend.benchmarks.fake_twilio_media_client --call-sid CA123 \\
+        --prompt "What times do you have next week?" --prompt "Tuesday works"
+
+    # Interrupt the first reply 300 ms after its first chunk
+    python -m backend.benchmarks.fake_twilio_media_client --call-sid CA123 --barge-in-ms 300
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import List, Optional
+
+import websockets
+
+
+async def _run_prompt(ws, prompt: str, barge_in_ms: Optional[int]) -> None:
+    """Send one prompt and consume the streamed response"""
+    sent_at = time.perf_counter()
+    first_chunk_at = None
+    chunks: List[str] = []
+
+    await ws.send(json.dumps({"type": "prompt", "voicePrompt": prompt, "last": True}))
+
+    while True:
+        timeout = None
+        if barge_in_ms is not None and first_chunk_at is not None:
+            timeout = max(0.0, barge_in_ms / 1000 - (time.perf_counter() - first_chunk_at))
+        try:
+            raw = await asyncio.wait_for(ws.recv(), timeout=timeout)
+        except asyncio.TimeoutError:
+            heard = " ".join(chunks)
+            await ws.send(json.dumps({"type": "interrupt", "utteranceUntilInterrupt": heard}))
+            print(f"  barge-in after {len(chunks)} chunk(s): heard {heard!r}")
+            return
+
+        message = json.loads(raw)
+        if message["type"] == "end":
+            print("  server ended the conversation")
+            return
+        if message["type"] != "text":
+            continue
+        if message.get("token"):
+            if first_chunk_at is None:
+                first_chunk_at = time.perf_counter()
+            chunks.append(message["token"].strip())
+            print(f"  [{(time.perf_counter() - sent_at) * 1000:7.1f} ms] {message['token'].strip()}")
+        if message.get("last"):
+            break
+
+    total_ms = (time.perf_counter() - sent_at) * 1000
+    first_ms = (first_chunk_at - sent_at) * 1000 if first_chunk_at else total_ms
+    print(f"  time to first chunk: {first_ms:.1f} ms, full response: {total_ms:.1f} ms")
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with websockets.connect(args.url) as ws:
+        await ws.send(json.dumps({"type": "setup", "callSid": args.call_sid}))
+        for i, prompt in enumerate(args.prompt or ["Hi, who is this?"]):
+            print(f"> {prompt}")
+            # Only barge in on the first reply
+            await _run_prompt(ws, prompt, args.barge_in_ms if i == 0 else None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Twilio media-stream client")
+    parser.add_argument("--url", default="ws://localhost:8000/api/webhooks/twilio/media-stream")
+    parser.add_argument("--call-sid", required=True)
+    parser.add_argument("--prompt", action="append", help="Caller utterance (repeatable)")
+    parser.add_argument("--barge-in-ms", type=int, default=None,
+                        help="Interrupt the first reply this long after its first chunk")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
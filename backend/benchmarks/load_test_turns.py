@@ -0,0 +1,97 @@
+"""
+Load test: concurrent speech turns per uvicorn worker
+
+Fires concurrent Twilio-style form posts at a running API and reports
+throughput and latency percentiles. Run it against a single worker
+(`uvicorn backend.main:app --workers 1`) to measure per-worker capacity,
+once on the sync-session build and once on the async-session build.
+
+Usage (from project root):
+    python -m backend.benchmarks.load_test_turns \\
+        --base-url http://localhost:8000 --call-sids CA123,CA456 \\
+        --concurrency 50 --requests 500
+
+    # Read-only endpoints work too:
+    python -m backend.benchmarks.load_test_turns --path /api/analytics/overview --method GET
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from typing import List
+
+import httpx
+
+DEFAULT_PATH = "/api/webhooks/twilio/process-speech"
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    args: argparse.Namespace,
+    call_sids: "itertools.cycle",
+    remaining: List[int],
+    latencies: List[float],
+    errors: List[int]
+) -> None:
+    while remaining[0] > 0:
+        remaining[0] -= 1
+        start = time.perf_counter()
+        try:
+            if args.method == "GET":
+                response = await client.get(args.path)
+            else:
+                response = await client.post(args.path, data={
+                    "CallSid": next(call_sids),
+                    "SpeechResult": args.speech,
+                })
+            if response.status_code >= 400:
+                errors[0] += 1
+        except httpx.HTTPError:
+            errors[0] += 1
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run(args: argparse.Namespace) -> None:
+    call_sids = itertools.cycle(args.call_sids.split(",") if args.call_sids else ["CA-load-test"])
+    remaining = [args.requests]
+    latencies: List[float] = []
+    errors = [0]
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            _worker(client, args, call_sids, remaining, latencies, errors)
+            for _ in range(args.concurrency)
+        ])
+        elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    print(f"{args.method} {args.path} - {len(latencies)} requests, concurrency {args.concurrency}")
+    print(f"throughput: {len(latencies) / elapsed:8.1f} req/s   errors: {errors[0]}")
+    print(
+        f"latency ms: mean={statistics.mean(latencies):.1f} "
+        f"p50={pct(0.50):.1f} p95={pct(0.95):.1f} p99={pct(0.99):.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent turn load test")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default=DEFAULT_PATH)
+    parser.add_argument("--method", default="POST", choices=["GET", "POST"])
+    parser.add_argument("--call-sids", default="", help="Comma-separated CallSids with live sessions")
+    parser.add_argument("--speech", default="Sure, what times do you have next week?")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
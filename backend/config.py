@@ -22,6 +22,11 @@ class Settings(BaseSettings):
 
     # OpenAI
     openai_api_key: str
+    openai_max_connections: int = 100  # Shared connection pool per process
+    openai_max_keepalive_connections: int = 20
+    openai_keepalive_expiry_seconds: float = 120.0
+    openai_timeout_seconds: float = 30.0
+    openai_http2: bool = False  # Requires the 'h2' package (pip install httpx[http2])
 
     # Google Calendar
     google_calendar_credentials_file: str = "credentials.json"
@@ -42,7 +47,99 @@ class Settings(BaseSettings):
     # Call Settings
     max_concurrent_calls: int = 50
     call_timeout_seconds: int = 300
-    max_conversation_turns: int = 20
+    max_conversation_turns: int = 20  # Most recent turns (lead message + AI reply) sent to the LLM verbatim
+    history_token_budget: int = 2000  # Token cap for the verbatim turns (estimated)
+    history_summary_enabled: bool = True  # Fold older turns into a running summary
+
+    # Call session state
+    call_session_ttl_seconds: int = 3600  # Redis TTL for per-call state
+    call_session_local_max: int = 1000  # Local LRU size per worker
+    conversation_flush_interval_seconds: float = 0.5  # Write-behind interval for ConversationHistory
+
+    # Streaming voice pipeline (websocket instead of Gather/Say per turn)
+    twilio_media_stream_enabled: bool = False
+
+    # Interim responses for slow turns (filler phrase + <Redirect> to a continuation)
+    interim_response_enabled: bool = False
+    interim_latency_budget_ms: int = 2500  # Reply with a filler if the turn takes longer
+    interim_max_redirects: int = 4  # Continuation attempts before asking the caller to repeat
+
+    # Webhook replay cache (Twilio retries of slow webhooks)
+    webhook_replay_ttl_seconds: int = 120  # How long rendered TwiML is kept for replay
+    webhook_replay_wait_seconds: float = 10.0  # How long a retry waits for the in-flight original
+
+    # LLM
+    system_prompt_refresh_seconds: int = 300  # How often a long-lived LLMService re-reads the prompt
+    tool_concurrency_limit: int = 4  # Tool calls from one response executed at once
+    structured_output_enabled: bool = True  # JSON-schema reply with intent/end_call (Gather path)
+
+    # Model routing (model/max_tokens per turn; routes live in the llm_model_routes setting)
+    model_routing_enabled: bool = True  # False = every turn uses the "conversation" route
+    small_talk_max_words: int = 12  # Utterances up to this long go to the small_talk route
+
+    # LLM resilience on the live call path (deadline, hedged requests, circuit breaker)
+    llm_deadline_seconds: float = 6.0  # Per completion; slower turns get a canned reply
+    llm_hedge_enabled: bool = True
+    llm_hedge_quantile: float = 0.95  # Route latency quantile after which a hedge is sent
+    llm_hedge_min_samples: int = 20  # Fewer route samples -> llm_hedge_default_delay_ms
+    llm_hedge_default_delay_ms: float = 2000.0
+    llm_hedge_min_delay_ms: float = 300.0
+    llm_breaker_window_seconds: float = 30.0
+    llm_breaker_min_requests: int = 10
+    llm_breaker_error_rate: float = 0.5  # Error rate in the window that opens the circuit
+    llm_breaker_open_seconds: float = 20.0  # Canned replies only, then one probe request
+    llm_max_fallback_replies: int = 2  # Canned "say that again" replies in a row before a polite hang-up
+
+    # OpenAI budget governor (token buckets in Redis shared by API workers and Celery)
+    openai_governor_enabled: bool = True
+    openai_rpm_limit: int = 5000  # Account requests per minute (per model)
+    openai_tpm_limit: int = 2000000  # Account tokens per minute (per model)
+    openai_background_reserve: float = 0.2  # Bucket fraction background work must leave for live calls
+    openai_live_max_wait_ms: float = 250.0  # Longest a live turn waits for budget before going anyway
+
+    # Response cache for stock utterances ("who is this?", "send me an email")
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 3600
+    response_cache_max_entries: int = 2000  # LRU bound per worker
+    response_cache_max_words: int = 12  # Longer utterances are never cached
+
+    # Slot generation (UTC)
+    calendar_slot_granularity_minutes: int = 30  # Offered slots start on these boundaries
+    calendar_working_hours_start: int = 9
+    calendar_working_hours_end: int = 17  # Slots must end by this hour
+
+    # Free-slot index (busy-cell bitmap per calendar in Redis, kept current by Celery beat)
+    slot_index_enabled: bool = True
+    slot_index_days: int = 14  # Days indexed after today
+    slot_index_refresh_seconds: int = 60  # Beat interval (incremental events sync)
+    slot_index_max_age_seconds: int = 300  # Older indexes aren't used for lookups
+    slot_index_calendar_ids: str = ""  # Comma-separated; defaults to google_calendar_id
+
+    # Slot holds (offered slots held in Redis so concurrent calls don't offer/book the same time)
+    slot_holds_enabled: bool = True
+    slot_hold_ttl_seconds: int = 300  # How long an offer stays reserved for the call
+    slot_hold_booked_ttl_seconds: int = 900  # Booked marker; covers freebusy cache, slot index and prefetch lag
+    slot_hold_candidates: int = 30  # Candidate slots computed so offers can skip held ones
+
+    # Calendar/Zoom API pools (blocking SDK calls run off the event loop)
+    calendar_pool_workers: int = 8  # Concurrent API calls per integration per worker
+    calendar_pool_max_queue: int = 32  # Calls waiting for a pool thread beyond this are rejected
+    calendar_read_timeout_seconds: float = 5.0  # Availability lookups (queue + API)
+    calendar_write_timeout_seconds: float = 15.0  # Bookings; also the socket timeout for Google requests
+    zoom_timeout_seconds: float = 10.0
+
+    # Freebusy cache (busy intervals per calendar and UTC day, shared via Redis)
+    freebusy_cache_enabled: bool = True
+    freebusy_cache_ttl_seconds: int = 60  # Bookings invalidate immediately; this bounds outside edits
+
+    # Speculative calendar prefetch (started when the lead sounds interested)
+    calendar_prefetch_enabled: bool = True
+    calendar_prefetch_days: int = 14  # Freebusy range fetched ahead of check_calendar_availability
+    calendar_prefetch_ttl_seconds: int = 300  # Prefetched busy times older than this are re-fetched
+
+    # Speak check_calendar_availability results from a local template instead
+    # of a second LLM completion
+    local_slot_reply_enabled: bool = False
 
     # Monitoring
     sentry_dsn: Optional[str] = None
@@ -15,8 +15,10 @@ import logging
 import sentry_sdk
 
 from backend.config import get_settings
-from backend.database import init_db
-from backend.api.routes import leads, calls, meetings, campaigns, analytics, webhooks, partners
+from backend.database import init_db, async_engine
+from backend.services.call_session_store import get_call_session_store
+from backend.services.service_registry import get_service_registry
+from backend.api.routes import leads, calls, meetings, campaigns, analytics, webhooks, partners, internal
 from backend.api.routes import settings as settings_routes
 
 # Configure logging
@@ -60,6 +62,7 @@ app.include_router(analytics.router, prefix="/api/analytics", tags=["analytics"]
 app.include_router(webhooks.router, prefix="/api/webhooks", tags=["webhooks"])
 app.include_router(settings_routes.router, prefix="/api", tags=["settings"])
 app.include_router(partners.router, prefix="/api/partners", tags=["partners"])
+app.include_router(internal.router, prefix="/internal", tags=["internal"])
 
 
 @app.on_event("startup")
@@ -69,6 +72,19 @@ async def startup_event():
     # Initialize database
     init_db()
     logger.info("Database initialized")
+    # Build shared services once per process (webhooks reuse them every turn)
+    get_service_registry().warm_up()
+    # Persist conversation turns write-behind
+    get_call_session_store().start_flusher()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown"""
+    await get_call_session_store().stop_flusher()
+    await async_engine.dispose()
+    await get_service_registry().close()
+    logger.info("Service registry closed")
 
 
 @app.get("/")
@@ -0,0 +1,256 @@
+"""
+Async facade over the blocking calendar and Zoom SDKs
+
+The Google API client and the Zoom client are synchronous. Live-call tools
+used to run them with asyncio.to_thread, which shares the loop's default
+executor with everything else and puts no bound on how long a turn waits.
+
+Blocking calls now run in dedicated, bounded thread pools (one per
+integration, so a slow Zoom can't starve calendar lookups):
+
+- max_workers caps concurrent API calls; at most max_queue more may wait
+  for a worker, further calls are rejected immediately
+- every call has a timeout covering queueing and the API call; a call that
+  times out while still queued never runs
+- queue time (waiting for a worker) and API time are recorded separately
+
+A thread can't be interrupted, so a call that times out mid-request keeps
+its worker until the SDK's own socket timeout fires.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.config import get_settings
+from backend.utils.latency_metrics import LatencyMetrics
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class BlockingCallTimeout(TimeoutError):
+    """A pooled call didn't finish within its timeout"""
+
+
+class BlockingPoolSaturated(RuntimeError):
+    """Too many calls are already waiting for a pool worker"""
+
+
+class BlockingCallPool:
+    """
+    Bounded thread pool for one blocking integration.
+
+    Attributes:
+        name: Integration name ("calendar", "zoom")
+        pending: Calls submitted but not yet started
+        running: Calls currently on a worker
+        metrics: "queue" and "api" latency histograms per operation
+    """
+
+    def __init__(self, name: str, max_workers: int = None, max_queue: int = None):
+        self.name = name
+        self.max_workers = max_workers or settings.calendar_pool_workers
+        self.max_queue = max_queue if max_queue is not None else settings.calendar_pool_max_queue
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"{name}-api")
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.metrics = LatencyMetrics()
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, operation: str, field: str) -> None:
+        with self._lock:
+            counters = self.counters.setdefault(
+                operation, {"calls": 0, "errors": 0, "timeouts": 0, "rejected": 0, "late_completions": 0}
+            )
+            counters[field] += 1
+
+    async def run(self, operation: str, fn: Callable[..., Any], *args, timeout: float, **kwargs) -> Any:
+        """
+        Run a blocking call on the pool
+
+        Args:
+            operation: Name for metrics (e.g. "get_busy_times")
+            fn: Blocking callable
+            *args: Positional arguments for fn
+            timeout: Seconds to wait, including time queued for a worker
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            fn's return value
+
+        Raises:
+            BlockingPoolSaturated: The wait queue is full
+            BlockingCallTimeout: The call didn't finish in time
+        """
+        with self._lock:
+            if self.pending >= self.max_queue:
+                saturated = True
+            else:
+                saturated = False
+                self.pending += 1
+        if saturated:
+            self._count(operation, "rejected")
+            raise BlockingPoolSaturated(f"{self.name} API pool is saturated ({self.max_queue} calls waiting)")
+
+        submitted = time.perf_counter()
+        timed_out = False
+
+        def call() -> Any:
+            started = time.perf_counter()
+            with self._lock:
+                self.pending -= 1
+                self.running += 1
+            self.metrics.record(operation, (started - submitted) * 1000, group="queue")
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.metrics.record(operation, (time.perf_counter() - started) * 1000, group="api")
+                with self._lock:
+                    self.running -= 1
+
+        def done(future: Future) -> None:
+            if future.cancelled():
+                # Timed out while queued - call() never ran
+                with self._lock:
+                    self.pending -= 1
+            elif timed_out:
+                self._count(operation, "late_completions")
+                logger.warning(f"⚠️ {self.name}.{operation} finished after its timeout (result discarded)")
+
+        self._count(operation, "calls")
+        future = self._executor.submit(call)
+        future.add_done_callback(done)
+        try:
+            # Cancelling the wrapper cancels the pool future if it hasn't started
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            self._count(operation, "timeouts")
+            raise BlockingCallTimeout(f"{self.name}.{operation} timed out after {timeout:.1f}s") from None
+        except Exception:
+            self._count(operation, "errors")
+            raise
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Pool occupancy, counters and queue/API latency per operation"""
+        latency = self.metrics.snapshot()
+        with self._lock:
+            operations = {
+                operation: {
+                    **counters,
+                    "queue": latency.get("queue", {}).get(operation),
+                    "api": latency.get("api", {}).get(operation),
+                }
+                for operation, counters in self.counters.items()
+            }
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self.running,
+                "pending": self.pending,
+                "operations": operations,
+            }
+
+
+# Global pools, one per integration
+_pools: Dict[str, BlockingCallPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_blocking_pool(name: str) -> BlockingCallPool:
+    """
+    Get or create the process-wide pool for an integration.
+
+    Args:
+        name: Integration name ("calendar", "zoom")
+
+    Returns:
+        BlockingCallPool instance
+    """
+    pool = _pools.get(name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(name)
+            if pool is None:
+                pool = _pools[name] = BlockingCallPool(name)
+    return pool
+
+
+def get_blocking_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Snapshots of every pool created in this process"""
+    return {name: pool.snapshot() for name, pool in sorted(_pools.items())}
+
+
+class AsyncCalendarService:
+    """
+    Awaitable CalendarService calls on the "calendar" pool.
+
+    Reads use settings.calendar_read_timeout_seconds and bookings
+    settings.calendar_write_timeout_seconds. A booking that times out may
+    still be created by Google; callers should say so rather than retry blindly.
+    """
+
+    def __init__(self, calendar_service, pool: BlockingCallPool = None):
+        """
+        Args:
+            calendar_service: CalendarService instance
+            pool: Pool to run on (defaults to the shared "calendar" pool)
+        """
+        self.sync = calendar_service
+        self.pool = pool or get_blocking_pool("calendar")
+
+    async def get_available_slots(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int = 30,
+        calendar_id: str = None,
+        limit: int = 10
+    ) -> List[Dict]:
+        """See CalendarService.get_available_slots"""
+        return await self.pool.run(
+            "get_available_slots",
+            self.sync.get_available_slots,
+            start_date=start_date,
+            end_date=end_date,
+            duration_minutes=duration_minutes,
+            calendar_id=calendar_id,
+            limit=limit,
+            timeout=settings.calendar_read_timeout_seconds
+        )
+
+    async def get_busy_times(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_id: str = None,
+        use_cache: bool = True
+    ) -> Optional[List[Dict[str, str]]]:
+        """See CalendarService.get_busy_times"""
+        return await self.pool.run(
+            "get_busy_times",
+            self.sync.get_busy_times,
+            start_date,
+            end_date,
+            calendar_id,
+            use_cache,
+            timeout=settings.calendar_read_timeout_seconds
+        )
+
+    async def create_meeting(self, **kwargs) -> Optional[dict]:
+        """See CalendarService.create_meeting"""
+        return await self.pool.run(
+            "create_meeting",
+            self.sync.create_meeting,
+            timeout=settings.calendar_write_timeout_seconds,
+            **kwargs
+        )
+
+    def compute_available_slots(self, *args, **kwargs) -> List[Dict]:
+        """Pure computation - runs inline (see CalendarService.compute_available_slots)"""
+        return self.sync.compute_available_slots(*args, **kwargs)
@@ -8,14 +8,19 @@ from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+import google_auth_httplib2
+import httplib2
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import logging
 from pathlib import Path
 import pickle
 import os
+import threading
 
 from backend.config import get_settings
+from backend.services.freebusy_cache import days_between, get_freebusy_cache, split_by_day
+from backend.services.slot_engine import format_slots, generate_slots, merge_busy
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -24,6 +29,10 @@ settings = get_settings()
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
 
+class SyncTokenExpired(Exception):
+    """Google rejected an events sync token (410 Gone); a full sync is needed"""
+
+
 class CalendarService:
     """
     Service for Google Calendar operations
@@ -36,8 +45,20 @@ class CalendarService:
     def __init__(self):
         self.creds = None
         self.service = None
+        # httplib2 connections aren't thread-safe; each pool thread gets its own
+        self._thread_local = threading.local()
         self._authenticate()
 
+    def _http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Authorized HTTP transport for the calling thread (bounded socket timeout)"""
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(
+                self.creds, http=httplib2.Http(timeout=settings.calendar_write_timeout_seconds)
+            )
+            self._thread_local.http = http
+        return http
+
     def _is_service_account(self) -> bool:
         """
         Check if using service account authentication
@@ -144,7 +165,8 @@ class CalendarService:
         start_date: datetime,
         end_date: datetime,
         duration_minutes: int = 30,
-        calendar_id: str = None
+        calendar_id: str = None,
+        limit: int = 10
     ) -> List[Dict]:
         """
         Get available time slots in calendar
@@ -154,23 +176,106 @@ class CalendarService:
             end_date: End of search range
             duration_minutes: Meeting duration
             calendar_id: Calendar ID (uses default if None)
+            limit: Maximum number of slots
 
         Returns:
             List of available slots with start/end times
         """
-        if not self.service:
-            logger.error("Calendar service not initialized")
+        # Ensure start_date and end_date are timezone-aware (UTC) before API call
+        if start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=timezone.utc)
+        if end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=timezone.utc)
+
+        busy_times = self.get_busy_times(start_date, end_date, calendar_id)
+        if busy_times is None:
             return []
 
+        available_slots = self.compute_available_slots(start_date, end_date, duration_minutes, busy_times, limit=limit)
+        logger.info(f"Found {len(available_slots)} available slots")
+        return available_slots
+
+    def get_busy_times(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_id: str = None,
+        use_cache: bool = True
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Get busy intervals for a time range
+
+        Served per UTC day from the shared freebusy cache; days that are
+        missing or were invalidated by a booking are fetched from Google in
+        one freebusy query.
+
+        Args:
+            start_date: Start of range (timezone-aware)
+            end_date: End of range (timezone-aware)
+            calendar_id: Calendar ID (uses default if None)
+            use_cache: False to always ask Google
+
+        Returns:
+            List of {"start", "end"} busy intervals (RFC 3339) overlapping
+            the range, or None on error
+        """
         calendar_id = calendar_id or settings.google_calendar_id or 'primary'
 
-        try:
-            # Ensure start_date and end_date are timezone-aware (UTC) before API call
-            if start_date.tzinfo is None:
-                start_date = start_date.replace(tzinfo=timezone.utc)
-            if end_date.tzinfo is None:
-                end_date = end_date.replace(tzinfo=timezone.utc)
+        if not use_cache or not settings.freebusy_cache_enabled:
+            return self._query_busy_times(start_date, end_date, calendar_id)
+
+        cache = get_freebusy_cache()
+        days = days_between(start_date, end_date)
+        busy_by_day, misses = cache.get_days(calendar_id, days)
+
+        if misses:
+            # One query spanning all missing days (whole UTC days, so they can be cached)
+            fetch_start = datetime.combine(min(misses), datetime.min.time(), tzinfo=timezone.utc)
+            fetch_end = datetime.combine(max(misses) + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc)
+            fetched = self._query_busy_times(fetch_start, fetch_end, calendar_id)
+            if fetched is None:
+                return None
+            fetched_by_day = split_by_day(fetched, misses.keys())
+            cache.put_days(calendar_id, fetched_by_day, misses)
+            busy_by_day.update(fetched_by_day)
+
+        # Intervals spanning midnight are stored under each day they touch
+        busy_times = []
+        seen = set()
+        for day in days:
+            for busy in busy_by_day[day]:
+                key = (busy['start'], busy['end'])
+                if key in seen:
+                    continue
+                seen.add(key)
+                busy_start = datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
+                busy_end = datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
+                if busy_start < end_date and busy_end > start_date:
+                    busy_times.append(busy)
+        return busy_times
+
+    def _query_busy_times(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        calendar_id: str
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Query Google freebusy for a time range
 
+        Args:
+            start_date: Start of range (timezone-aware)
+            end_date: End of range (timezone-aware)
+            calendar_id: Calendar ID
+
+        Returns:
+            List of {"start", "end"} busy intervals (RFC 3339), or None on error
+        """
+        if not self.service:
+            logger.error("Calendar service not initialized")
+            return None
+
+        try:
             # Get busy times - format datetimes correctly for Google API
             # Convert timezone-aware datetime to RFC 3339 format with 'Z' suffix
             body = {
@@ -179,56 +284,98 @@ class CalendarService:
                 "items": [{"id": calendar_id}]
             }
 
-            events_result = self.service.freebusy().query(body=body).execute()
-            busy_times = events_result['calendars'][calendar_id]['busy']
-
-            # Generate available slots
-            available_slots = []
-            current_time = start_date
-
-            # Round current_time to next half-hour boundary (00 or 30 minutes)
-            if current_time.minute < 30:
-                current_time = current_time.replace(minute=30, second=0, microsecond=0)
-            elif current_time.minute > 30:
-                current_time = current_time.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-            else:
-                current_time = current_time.replace(second=0, microsecond=0)
-
-            # Define working hours (9 AM - 5 PM)
-            while current_time < end_date:
-                # Skip non-working hours
-                if current_time.hour < 9 or current_time.hour >= 17:
-                    current_time += timedelta(hours=1)
-                    continue
+            events_result = self.service.freebusy().query(body=body).execute(http=self._http())
+            return events_result['calendars'][calendar_id]['busy']
 
-                slot_end = current_time + timedelta(minutes=duration_minutes)
+        except HttpError as error:
+            logger.error(f"Calendar API error: {error}")
+            return None
 
-                # Check if slot overlaps with busy time
-                is_available = True
-                for busy in busy_times:
-                    busy_start = datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
-                    busy_end = datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
+    def list_event_changes(
+        self,
+        calendar_id: str,
+        sync_token: Optional[str] = None,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """
+        List events, or only the events changed since a sync token
 
-                    if (current_time < busy_end and slot_end > busy_start):
-                        is_available = False
-                        current_time = busy_end
-                        break
+        Without a sync token this is a full listing of [time_min, time_max);
+        with one, Google returns only events created, changed or cancelled
+        since it was issued (cancelled events have status "cancelled").
 
-                if is_available:
-                    available_slots.append({
-                        "start": current_time.isoformat(),
-                        "end": slot_end.isoformat(),
-                        "display": current_time.strftime("%A, %B %d at %I:%M %p")
-                    })
+        Args:
+            calendar_id: Calendar ID
+            sync_token: nextSyncToken from a previous listing (incremental)
+            time_min: Range start for a full listing (timezone-aware)
+            time_max: Range end for a full listing (timezone-aware)
 
-                current_time += timedelta(minutes=30)  # Check every 30 minutes
+        Returns:
+            Tuple of (events, next sync token)
 
-            logger.info(f"Found {len(available_slots)} available slots")
-            return available_slots[:10]  # Return first 10 slots
+        Raises:
+            SyncTokenExpired: Google invalidated the token (do a full listing)
+            HttpError: Other API errors
+        """
+        if not self.service:
+            raise RuntimeError("Calendar service not initialized")
 
-        except HttpError as error:
-            logger.error(f"Calendar API error: {error}")
-            return []
+        params = {"calendarId": calendar_id, "singleEvents": True, "maxResults": 2500}
+        if sync_token:
+            params["syncToken"] = sync_token
+        else:
+            params["timeMin"] = time_min.isoformat().replace('+00:00', 'Z')
+            params["timeMax"] = time_max.isoformat().replace('+00:00', 'Z')
+
+        events: List[Dict] = []
+        while True:
+            try:
+                page = self.service.events().list(**params).execute(http=self._http())
+            except HttpError as error:
+                if error.resp.status == 410:
+                    raise SyncTokenExpired(calendar_id) from error
+                raise
+            events.extend(page.get('items', []))
+            if not page.get('nextPageToken'):
+                return events, page.get('nextSyncToken')
+            params["pageToken"] = page['nextPageToken']
+
+    @staticmethod
+    def compute_available_slots(
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int,
+        busy_times: List[Dict[str, str]],
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Build free slots from busy intervals (no API call)
+
+        Slots start on settings.calendar_slot_granularity_minutes boundaries
+        and fit inside the working hours (UTC) of their day.
+
+        Args:
+            start_date: Start of search range (timezone-aware)
+            end_date: End of search range (timezone-aware)
+            duration_minutes: Meeting duration
+            busy_times: Busy intervals from get_busy_times()
+            limit: Stop after this many slots (None = all)
+
+        Returns:
+            Available slots in the range, in order
+        """
+        slots = generate_slots(
+            start_date,
+            end_date,
+            duration_minutes,
+            merge_busy(busy_times),
+            granularity_minutes=settings.calendar_slot_granularity_minutes,
+            work_start_hour=settings.calendar_working_hours_start,
+            work_end_hour=settings.calendar_working_hours_end,
+            limit=limit
+        )
+        return format_slots(slots)
 
     def create_meeting(
         self,
@@ -297,10 +444,13 @@ class CalendarService:
                 'sendUpdates': 'none'  # No attendees, so no updates to send
             }
 
-            event_result = self.service.events().insert(**insert_params).execute()
+            event_result = self.service.events().insert(**insert_params).execute(http=self._http())
 
             event_id = event_result['id']
 
+            # Other calls must see the new event on their next availability lookup
+            get_freebusy_cache().invalidate(calendar_id, start_time, end_time)
+
             logger.info(f"Meeting created: {event_id} at {start_time}")
 
             return {
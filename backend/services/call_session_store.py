@@ -0,0 +1,625 @@
+"""
+Per-call conversation state keyed by Twilio CallSid.
+
+Holds everything a speech turn needs (lead info, language, OpenAI-formatted
+messages, offered slots) so the webhook doesn't re-query Call, Lead and the
+full ConversationHistory on every turn.
+
+- Local LRU for the fast path, Redis as the cross-worker source of truth
+- ConversationHistory rows are persisted write-behind by a background flusher;
+  rows whose write fails go back on the shared Redis queue, so any worker
+  can retry them
+"""
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, asdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.config import get_settings
+from backend.database import AsyncSessionLocal
+from backend.models import Call, Lead, ConversationHistory, SpeakerRole
+from backend.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SESSION_KEY_PREFIX = "call_session:"
+PENDING_TURNS_KEY = "call_session:pending_turns"
+PENDING_REPLY_KEY_PREFIX = "call_session:pending_reply:"  # Finished slow turn waiting for the continuation webhook
+SAVE_ATTEMPTS = 3
+
+# Written by background tasks as their own hash fields next to the session
+# JSON, so they never race a turn's save; they override the copy in the JSON
+PREFETCH_FIELD = "prefetched_availability"
+SUMMARY_FIELD = "summary"
+SUMMARIZED_COUNT_FIELD = "summarized_count"
+
+# KEYS[1]: session hash
+# ARGV: expected version ("" when the key shouldn't exist), new version, data, ttl seconds
+# Returns 1 if written, 0 if another worker saved first
+SAVE_SCRIPT = """
+local current = redis.call("HGET", KEYS[1], "version")
+if (current or "") ~= ARGV[1] then
+    return 0
+end
+redis.call("HSET", KEYS[1], "version", ARGV[2], "data", ARGV[3])
+redis.call("EXPIRE", KEYS[1], ARGV[4])
+return 1
+"""
+
+# KEYS[1]: session hash
+# ARGV: field, JSON value ("" deletes the field)
+# Only touches live sessions, so a late write can't recreate an ended call
+SET_FIELD_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+if ARGV[2] == "" then
+    redis.call("HDEL", KEYS[1], ARGV[1])
+else
+    redis.call("HSET", KEYS[1], ARGV[1], ARGV[2])
+end
+return 1
+"""
+
+# KEYS[1]: session hash
+# ARGV: summary, summarized count
+# Keeps whichever summary covers more messages; only touches live sessions
+SUMMARY_SCRIPT = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+local current = tonumber(redis.call("HGET", KEYS[1], "summarized_count")) or 0
+if current >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call("HSET", KEYS[1], "summary", ARGV[1], "summarized_count", ARGV[2])
+return 1
+"""
+
+
+@dataclass
+class CallSession:
+    """Conversation state for one live call"""
+    call_sid: str
+    call_id: int
+    lead_id: int
+    lead_name: str = "there"
+    lead_email: str = ""
+    language: str = "en"
+    outcome: Optional[str] = None  # Mirrors Call.outcome so turns don't re-read it
+    messages: List[Dict[str, str]] = field(default_factory=list)  # OpenAI chat format
+    offered_slots: List[Dict[str, str]] = field(default_factory=list)  # From check_calendar_availability
+    offered_at: int = 0  # len(messages) when offered_slots were set (the offer turn's user message is last)
+    prefetched_availability: Optional[Dict[str, Any]] = None  # Speculative freebusy fetch (start, end, busy, fetched_at)
+    booking_failed: bool = False  # Last book_meeting attempt failed (routes the next turn to a stronger model)
+    llm_fallbacks: int = 0  # Consecutive turns answered with a canned reply (LLM unavailable)
+    llm_completions: int = 0
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0  # Prompt tokens served from OpenAI's prompt cache
+    summary: str = ""  # Running summary of turns older than the prompt window
+    summarized_count: int = 0  # Messages covered by summary
+    version: str = ""  # Token of the last save; unique per save so workers can't collide
+
+    @property
+    def lead_info(self) -> Dict[str, str]:
+        """Lead info in the shape LLMService expects"""
+        return {"name": self.lead_name, "email": self.lead_email}
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "CallSession":
+        data = json.loads(raw)
+        known = {f.name for f in fields(cls)}
+        session = cls(**{name: value for name, value in data.items() if name in known})
+        session.version = str(session.version)
+        return session
+
+
+class CallSessionStore:
+    """
+    Two-level store for CallSession objects.
+
+    Local entries are reused only while their version matches the one in
+    Redis, so a turn routed to a different worker never sees stale history.
+    Saves are compare-and-set on that version: a save that lost a race to
+    another worker is merged onto the newer copy and retried.
+    When Redis is unavailable the store degrades to process-local state.
+    """
+
+    def __init__(self, max_local_sessions: int = None, ttl: int = None):
+        self.cache = get_cache_service()
+        self.max_local_sessions = max_local_sessions or settings.call_session_local_max
+        self.ttl = ttl or settings.call_session_ttl_seconds
+
+        self._local: "OrderedDict[str, CallSession]" = OrderedDict()
+        self._base: Dict[str, str] = {}  # call_sid -> JSON of the copy last read from / written to Redis
+        self._scripts: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+        # Used for write-behind and reply handoff when Redis is unavailable
+        self._local_pending: List[Dict[str, Any]] = []
+        self._local_replies: Dict[str, Dict[str, Any]] = {}
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    @property
+    def redis(self):
+        return self.cache.redis_client
+
+    # ------------------------------------------------------------------
+    # Session access
+    # ------------------------------------------------------------------
+
+    def _remember(self, session: CallSession, raw: Optional[str] = None) -> None:
+        """
+        Put session in the local LRU, evicting the oldest entry if full
+
+        Args:
+            session: Session to keep
+            raw: Its JSON as stored in Redis (the base for merging a conflicting save)
+        """
+        with self._lock:
+            self._local[session.call_sid] = session
+            self._local.move_to_end(session.call_sid)
+            if raw is not None:
+                self._base[session.call_sid] = raw
+            while len(self._local) > self.max_local_sessions:
+                evicted, _ = self._local.popitem(last=False)
+                self._base.pop(evicted, None)
+
+    def _script(self, name: str, source: str, keys: List[str], args: List[Any]) -> int:
+        if name not in self._scripts:
+            self._scripts[name] = self.redis.register_script(source)
+        # The client can be swapped after registration (cache service reconnect)
+        return int(self._scripts[name](keys=keys, args=args, client=self.redis))
+
+    def get(self, call_sid: str) -> Optional[CallSession]:
+        """
+        Get session for a call
+
+        Args:
+            call_sid: Twilio Call SID
+
+        Returns:
+            CallSession or None if the call has no session
+        """
+        with self._lock:
+            local = self._local.get(call_sid)
+            if local is not None:
+                self._local.move_to_end(call_sid)
+
+        if not self.redis:
+            return local
+
+        key = f"{SESSION_KEY_PREFIX}{call_sid}"
+        try:
+            remote_version, prefetched, summary, summarized_count = self.redis.hmget(
+                key, "version", PREFETCH_FIELD, SUMMARY_FIELD, SUMMARIZED_COUNT_FIELD
+            )
+            if local is not None and remote_version is not None and remote_version == local.version:
+                session = local
+            else:
+                raw = self.redis.hget(key, "data")
+                if raw is None:
+                    return local
+                session = CallSession.from_json(raw)
+                self._remember(session, raw)
+            if prefetched is not None:
+                session.prefetched_availability = json.loads(prefetched)
+            if summarized_count is not None and int(summarized_count) > session.summarized_count:
+                session.summary = summary or ""
+                session.summarized_count = int(summarized_count)
+            return session
+        except Exception as e:
+            logger.error(f"Call session get error for {call_sid}: {e}")
+            return local
+
+    def _rebase(self, session: CallSession, remote: CallSession, base_raw: Optional[str]) -> None:
+        """
+        Merge our unsaved changes onto the copy another worker saved
+
+        Fields we didn't change since base take the remote value; messages
+        we appended since base go after the remote's messages.
+
+        Args:
+            session: Our copy, updated in place
+            remote: Copy currently in Redis
+            base_raw: JSON of the copy our changes started from, if known
+        """
+        base = json.loads(base_raw) if base_raw else None
+        ours = asdict(session)
+        for name, theirs in asdict(remote).items():
+            if name in ("messages", "version"):
+                continue
+            if base is not None and ours[name] == base.get(name):
+                setattr(session, name, theirs)
+
+        if base is not None:
+            shared = len(base.get("messages", []))
+        else:
+            shared = 0
+            for mine, other in zip(session.messages, remote.messages):
+                if mine != other:
+                    break
+                shared += 1
+        session.messages = remote.messages + session.messages[shared:]
+        session.version = remote.version
+
+    def save(self, session: CallSession) -> bool:
+        """
+        Store session locally and in Redis
+
+        The Redis write only succeeds if nobody saved since our copy was
+        read; otherwise our changes are merged onto the newer copy and the
+        write is retried.
+
+        Args:
+            session: Session to store (gets a new version token)
+
+        Returns:
+            True if stored, False if Redis rejected or failed the write
+        """
+        if not self.redis:
+            session.version = uuid.uuid4().hex
+            self._remember(session)
+            return True
+
+        key = f"{SESSION_KEY_PREFIX}{session.call_sid}"
+        for _ in range(SAVE_ATTEMPTS):
+            expected = session.version
+            session.version = uuid.uuid4().hex
+            raw = session.to_json()
+            try:
+                if self._script("save", SAVE_SCRIPT, [key], [expected, session.version, raw, self.ttl]):
+                    self._remember(session, raw)
+                    return True
+
+                session.version = expected
+                remote_raw = self.redis.hget(key, "data")
+            except Exception as e:
+                logger.error(f"Call session save error for {session.call_sid}: {e}")
+                self._remember(session)
+                return False
+
+            if remote_raw is None:
+                # Expired or ended under us: write ours as a fresh copy
+                session.version = ""
+                continue
+            with self._lock:
+                base_raw = self._base.get(session.call_sid)
+            self._rebase(session, CallSession.from_json(remote_raw), base_raw)
+            with self._lock:
+                self._base[session.call_sid] = remote_raw
+            logger.info(f"🔀 Call session {session.call_sid} was saved by another worker, merging and retrying")
+
+        logger.error(f"Call session save for {session.call_sid} kept conflicting, gave up")
+        self._remember(session)
+        return False
+
+    def save_prefetch(self, session: CallSession, prefetched: Optional[Dict[str, Any]]) -> None:
+        """
+        Store the speculative freebusy fetch without re-saving the session
+
+        Args:
+            session: Call session
+            prefetched: Busy times (start, end, busy, fetched_at), or None to clear them
+        """
+        session.prefetched_availability = prefetched
+        if not self.redis:
+            return
+
+        key = f"{SESSION_KEY_PREFIX}{session.call_sid}"
+        try:
+            value = json.dumps(prefetched) if prefetched is not None else ""
+            self._script("set_field", SET_FIELD_SCRIPT, [key], [PREFETCH_FIELD, value])
+        except Exception as e:
+            logger.error(f"Call session prefetch save error for {session.call_sid}: {e}")
+
+    def save_summary(self, session: CallSession, summary: str, summarized_count: int) -> None:
+        """
+        Store the running history summary without re-saving the session
+
+        A summary covering fewer messages than the stored one is ignored.
+
+        Args:
+            session: Call session
+            summary: Summary text
+            summarized_count: Number of session messages it covers
+        """
+        if summarized_count > session.summarized_count:
+            session.summary = summary
+            session.summarized_count = summarized_count
+        if not self.redis:
+            return
+
+        key = f"{SESSION_KEY_PREFIX}{session.call_sid}"
+        try:
+            self._script("summary", SUMMARY_SCRIPT, [key], [summary, summarized_count])
+        except Exception as e:
+            logger.error(f"Call session summary save error for {session.call_sid}: {e}")
+
+    def put_pending_reply(self, call_sid: str, reply: Dict[str, Any]) -> None:
+        """
+        Park a finished slow turn's reply for the continuation webhook
+
+        Kept under its own key rather than on the session, so it can't
+        overwrite (or be overwritten by) a session save.
+
+        Args:
+            call_sid: Twilio Call SID
+            reply: {"text", "end_call"}
+        """
+        if self.redis:
+            try:
+                self.redis.set(f"{PENDING_REPLY_KEY_PREFIX}{call_sid}", json.dumps(reply), ex=self.ttl)
+                return
+            except Exception as e:
+                logger.error(f"Failed to park reply in Redis for {call_sid}, keeping it locally: {e}")
+
+        with self._lock:
+            self._local_replies[call_sid] = reply
+
+    def pop_pending_reply(self, call_sid: str) -> Optional[Dict[str, Any]]:
+        """
+        Take the parked reply for a call, if it's ready
+
+        GETDEL hands it to exactly one continuation request.
+
+        Args:
+            call_sid: Twilio Call SID
+
+        Returns:
+            {"text", "end_call"} or None if the turn is still running
+        """
+        with self._lock:
+            reply = self._local_replies.pop(call_sid, None)
+        if reply is not None or not self.redis:
+            return reply
+
+        try:
+            raw = self.redis.getdel(f"{PENDING_REPLY_KEY_PREFIX}{call_sid}")
+        except Exception as e:
+            logger.error(f"Pending reply read error for {call_sid}: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def delete(self, call_sid: str) -> None:
+        """Remove a session from both levels"""
+        with self._lock:
+            self._local.pop(call_sid, None)
+            self._base.pop(call_sid, None)
+            self._local_replies.pop(call_sid, None)
+        if self.redis:
+            try:
+                self.redis.delete(f"{SESSION_KEY_PREFIX}{call_sid}", f"{PENDING_REPLY_KEY_PREFIX}{call_sid}")
+            except Exception as e:
+                logger.error(f"Call session delete error for {call_sid}: {e}")
+
+    async def load_from_db(self, db: AsyncSession, call_sid: str) -> Optional[CallSession]:
+        """
+        Rebuild a session from the database (cold start or Redis eviction)
+
+        Args:
+            db: Async database session
+            call_sid: Twilio Call SID
+
+        Returns:
+            CallSession or None if the call doesn't exist
+        """
+        call = await db.scalar(select(Call).where(Call.twilio_call_sid == call_sid))
+        if not call:
+            return None
+
+        lead = await db.get(Lead, call.lead_id)
+        history = (await db.scalars(
+            select(ConversationHistory).where(
+                ConversationHistory.call_id == call.id
+            ).order_by(ConversationHistory.created_at)
+        )).all()
+
+        session = self.create(
+            call_sid=call_sid,
+            call=call,
+            lead=lead,
+            messages=[
+                {
+                    "role": "assistant" if turn.role == SpeakerRole.AI else "user",
+                    "content": turn.message
+                }
+                for turn in history
+            ]
+        )
+        logger.info(f"Call session for {call_sid} rebuilt from database ({len(history)} turns)")
+        return session
+
+    def create(
+        self,
+        call_sid: str,
+        call: Call,
+        lead: Optional[Lead],
+        messages: Optional[List[Dict[str, str]]] = None
+    ) -> CallSession:
+        """Create (without saving) a session from ORM objects"""
+        return CallSession(
+            call_sid=call_sid,
+            call_id=call.id,
+            lead_id=call.lead_id,
+            lead_name=lead.name if lead else "there",
+            lead_email=(lead.email or "") if lead else "",
+            language=call.language or "en",
+            outcome=call.outcome.value if call.outcome else None,
+            messages=messages or []
+        )
+
+    # ------------------------------------------------------------------
+    # Write-behind conversation persistence
+    # ------------------------------------------------------------------
+
+    def append_turn(self, session: CallSession, role: SpeakerRole, message: str) -> None:
+        """
+        Append a turn to the session and queue it for persistence
+
+        The ConversationHistory row is written by the background flusher,
+        not on the request path. created_at is captured now so ordering is
+        preserved regardless of when the row is flushed.
+
+        Args:
+            session: Call session
+            role: Speaker role
+            message: Spoken text
+        """
+        session.messages.append({
+            "role": "assistant" if role == SpeakerRole.AI else "user",
+            "content": message
+        })
+
+        row = {
+            "call_id": session.call_id,
+            "role": role.value,
+            "message": message,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }
+
+        if self.redis:
+            try:
+                self.redis.rpush(PENDING_TURNS_KEY, json.dumps(row))
+                return
+            except Exception as e:
+                logger.error(f"Failed to queue turn in Redis, keeping it locally: {e}")
+
+        with self._lock:
+            self._local_pending.append(row)
+
+    def _drain_pending(self, batch_size: int = 500) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Pop queued rows from the local fallback queue and Redis
+
+        Returns:
+            Tuple of (local rows, raw Redis entries)
+        """
+        with self._lock:
+            local_rows, self._local_pending = self._local_pending, []
+
+        raw_rows: List[str] = []
+        if self.redis:
+            try:
+                pipe = self.redis.pipeline()
+                pipe.lrange(PENDING_TURNS_KEY, 0, batch_size - 1)
+                pipe.ltrim(PENDING_TURNS_KEY, batch_size, -1)
+                raw_rows, _ = pipe.execute()
+            except Exception as e:
+                logger.error(f"Failed to drain pending turns from Redis: {e}")
+
+        return local_rows, raw_rows
+
+    def _requeue(self, local_rows: List[Dict[str, Any]], raw_rows: List[str]) -> None:
+        """Put rows whose write failed back at the head of the queue they came from"""
+        if raw_rows and self.redis:
+            try:
+                # LPUSH prepends one by one, so push newest first to keep the order
+                self.redis.lpush(PENDING_TURNS_KEY, *reversed(raw_rows))
+                raw_rows = []
+            except Exception as e:
+                logger.error(f"Failed to re-queue turns in Redis, keeping them locally: {e}")
+        with self._lock:
+            self._local_pending = local_rows + [json.loads(raw) for raw in raw_rows] + self._local_pending
+
+    async def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Bulk insert ConversationHistory rows"""
+        async with AsyncSessionLocal() as db:
+            db.add_all([
+                ConversationHistory(
+                    call_id=row["call_id"],
+                    role=SpeakerRole(row["role"]),
+                    message=row["message"],
+                    created_at=datetime.fromisoformat(row["created_at"])
+                )
+                for row in rows
+            ])
+            await db.commit()
+
+    async def flush(self) -> int:
+        """
+        Persist all queued conversation turns
+
+        Returns:
+            Number of rows written
+        """
+        total = 0
+        while True:
+            local_rows, raw_rows = self._drain_pending()
+            rows = local_rows + [json.loads(raw) for raw in raw_rows]
+            if not rows:
+                return total
+            try:
+                await self._write_rows(rows)
+                total += len(rows)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(rows)} conversation turns, re-queueing: {e}")
+                self._requeue(local_rows, raw_rows)
+                return total
+
+    async def _flush_loop(self) -> None:
+        interval = settings.conversation_flush_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                written = await self.flush()
+                if written:
+                    logger.debug(f"Flushed {written} conversation turn(s)")
+            except Exception as e:
+                logger.error(f"Conversation flusher error: {e}")
+
+    def start_flusher(self) -> None:
+        """Start the background write-behind task (call from app startup)"""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.get_running_loop().create_task(self._flush_loop())
+            logger.info("✅ Conversation write-behind flusher started")
+
+    async def stop_flusher(self) -> None:
+        """Stop the background task and persist anything still queued"""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+        await self.flush()
+
+    async def end_session(self, call_sid: str) -> None:
+        """
+        Finish a call: persist queued turns, then drop the session
+
+        Args:
+            call_sid: Twilio Call SID
+        """
+        await self.flush()
+        self.delete(call_sid)
+
+
+# Global store instance
+_call_session_store = None
+
+
+def get_call_session_store() -> CallSessionStore:
+    """
+    Get or create global call session store instance.
+
+    Returns:
+        CallSessionStore instance
+    """
+    global _call_session_store
+    if _call_session_store is None:
+        _call_session_store = CallSessionStore()
+    return _call_session_store
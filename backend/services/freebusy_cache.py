@@ -0,0 +1,250 @@
+"""
+Shared freebusy cache for CalendarService
+
+Concurrent calls ask for availability on the same calendar and the same
+two-week window. Busy intervals are cached per calendar and UTC day in Redis
+(shared by web and Celery workers) for a short TTL, so most availability
+lookups skip the Google round trip.
+
+create_meeting invalidates the days it touches by bumping a per-day
+generation counter. Cached entries carry the generation they were fetched
+under and are ignored once it moves on, so a freebusy query that was
+already in flight when the event was inserted can't re-populate stale data.
+Falls back to an in-process dict when Redis is unavailable.
+"""
+import json
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from backend.config import get_settings
+from backend.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "freebusy:"
+GENERATION_PREFIX = "freebusy_gen:"
+
+
+def days_between(start: datetime, end: datetime) -> List[date]:
+    """
+    UTC days overlapped by [start, end)
+
+    Args:
+        start: Range start (timezone-aware)
+        end: Range end (timezone-aware)
+
+    Returns:
+        Dates in order
+    """
+    last = (end - timedelta(microseconds=1)).date()
+    days = []
+    day = start.date()
+    while day <= last:
+        days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def split_by_day(busy_times: Iterable[Dict[str, str]], days: Iterable[date]) -> Dict[date, List[Dict[str, str]]]:
+    """
+    Assign busy intervals to every UTC day they overlap (intervals are kept whole)
+
+    Args:
+        busy_times: {"start", "end"} intervals (RFC 3339)
+        days: Days to fill
+
+    Returns:
+        Dict of day -> intervals overlapping it (empty list for free days)
+    """
+    by_day: Dict[date, List[Dict[str, str]]] = {day: [] for day in days}
+    for busy in busy_times:
+        start, end = _parse(busy['start']), _parse(busy['end'])
+        for day in days_between(start, end):
+            if day in by_day:
+                by_day[day].append({"start": busy['start'], "end": busy['end']})
+    return by_day
+
+
+class FreebusyCache:
+    """
+    Busy intervals per (calendar, UTC day) with generation-based invalidation.
+
+    Attributes:
+        hits / misses: Day lookups served from / missing in the cache
+        fetches: Google freebusy queries made to fill misses
+        invalidations: Days invalidated by bookings
+    """
+
+    def __init__(self, ttl: int = None):
+        self.cache = get_cache_service()
+        self.ttl = ttl or settings.freebusy_cache_ttl_seconds
+        # Generations must outlive every entry fetched under them
+        self.generation_ttl = max(self.ttl * 10, 3600)
+
+        self._local: Dict[str, Tuple[str, float]] = {}
+        self._local_generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.invalidations = 0
+
+    @property
+    def redis(self):
+        return self.cache.redis_client
+
+    @staticmethod
+    def _keys(calendar_id: str, day: date) -> Tuple[str, str]:
+        suffix = f"{calendar_id}:{day.isoformat()}"
+        return f"{KEY_PREFIX}{suffix}", f"{GENERATION_PREFIX}{suffix}"
+
+    def _mget(self, keys: List[str]) -> List[Optional[str]]:
+        if self.redis:
+            try:
+                return self.redis.mget(keys)
+            except Exception as e:
+                logger.error(f"Freebusy cache get error: {e}")
+        now = time.monotonic()
+        with self._lock:
+            values = []
+            for key in keys:
+                if key.startswith(GENERATION_PREFIX):
+                    generation = self._local_generations.get(key)
+                    values.append(str(generation) if generation is not None else None)
+                else:
+                    entry = self._local.get(key)
+                    values.append(entry[0] if entry and entry[1] >= now else None)
+            return values
+
+    def get_days(self, calendar_id: str, days: List[date]) -> Tuple[Dict[date, List[Dict[str, str]]], Dict[date, int]]:
+        """
+        Look up cached busy intervals
+
+        Args:
+            calendar_id: Calendar ID
+            days: UTC days to look up
+
+        Returns:
+            Tuple of (day -> intervals for hits, day -> current generation for misses);
+            pass the generations to put_days() after fetching the misses
+        """
+        keys = [self._keys(calendar_id, day) for day in days]
+        raw = self._mget([value_key for value_key, _ in keys] + [gen_key for _, gen_key in keys])
+        values, generations = raw[:len(days)], raw[len(days):]
+
+        hits: Dict[date, List[Dict[str, str]]] = {}
+        misses: Dict[date, int] = {}
+        for day, value, generation in zip(days, values, generations):
+            current = int(generation or 0)
+            entry = json.loads(value) if value else None
+            if entry is not None and entry["gen"] == current:
+                hits[day] = entry["busy"]
+            else:
+                misses[day] = current
+
+        with self._lock:
+            self.hits += len(hits)
+            self.misses += len(misses)
+        return hits, misses
+
+    def put_days(self, calendar_id: str, busy_by_day: Dict[date, List[Dict[str, str]]], generations: Dict[date, int]) -> None:
+        """
+        Store freshly fetched days
+
+        Args:
+            calendar_id: Calendar ID
+            busy_by_day: Day -> busy intervals (from split_by_day)
+            generations: Generations returned by get_days() before the fetch
+        """
+        entries = {
+            self._keys(calendar_id, day)[0]: json.dumps({"gen": generations.get(day, 0), "busy": busy})
+            for day, busy in busy_by_day.items()
+        }
+        with self._lock:
+            self.fetches += 1
+        if not entries:
+            return
+        if self.redis:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, value in entries.items():
+                    pipe.set(key, value, ex=self.ttl)
+                pipe.execute()
+                return
+            except Exception as e:
+                logger.error(f"Freebusy cache set error: {e}")
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if len(self._local) > 10000:
+                now = time.monotonic()
+                self._local = {k: v for k, v in self._local.items() if v[1] >= now}
+            for key, value in entries.items():
+                self._local[key] = (value, expires_at)
+
+    def invalidate(self, calendar_id: str, start: datetime, end: datetime) -> None:
+        """
+        Invalidate the days an event covers (call after inserting it)
+
+        Args:
+            calendar_id: Calendar ID
+            start: Event start (timezone-aware)
+            end: Event end (timezone-aware)
+        """
+        days = days_between(start, end)
+        keys = [self._keys(calendar_id, day) for day in days]
+        with self._lock:
+            self.invalidations += len(days)
+        if self.redis:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for value_key, gen_key in keys:
+                    pipe.incr(gen_key)
+                    pipe.expire(gen_key, self.generation_ttl)
+                    pipe.delete(value_key)
+                pipe.execute()
+                return
+            except Exception as e:
+                logger.error(f"Freebusy cache invalidation error: {e}")
+        with self._lock:
+            for value_key, gen_key in keys:
+                self._local_generations[gen_key] = self._local_generations.get(gen_key, 0) + 1
+                self._local.pop(value_key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate and Google queries made"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "shared": self.redis is not None,
+                "ttl_seconds": self.ttl,
+                "day_hits": self.hits,
+                "day_misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "google_queries": self.fetches,
+                "invalidated_days": self.invalidations,
+            }
+
+
+# Global freebusy cache instance
+_freebusy_cache = None
+
+
+def get_freebusy_cache() -> FreebusyCache:
+    """
+    Get or create the process-wide freebusy cache.
+
+    Returns:
+        FreebusyCache instance
+    """
+    global _freebusy_cache
+    if _freebusy_cache is None:
+        _freebusy_cache = FreebusyCache()
+    return _freebusy_cache
@@ -0,0 +1,176 @@
+"""
+Conversation history windowing for LLM prompts
+
+Keeps per-turn prompt size bounded on long calls: only the most recent turns
+(lead message plus AI reply) are sent verbatim (at most
+settings.max_conversation_turns, within settings.history_token_budget), and
+older turns are folded into a running summary on the call session. The
+summary is updated incrementally in the background, so no turn waits for
+it, and saved through the call session store so other workers see it.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from openai import AsyncOpenAI
+
+from backend.config import get_settings
+from backend.services.call_session_store import CallSession, get_call_session_store
+from backend.services.model_router import ModelRouter
+from backend.services.rate_governor import estimate_request_tokens, get_rate_governor
+from backend.utils.llm_usage import estimate_tokens, get_llm_usage_stats
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+SUMMARY_PROMPT = (
+    "You maintain a running summary of a sales phone call between an AI assistant "
+    "and a lead. Update the summary with the new turns. Keep facts that matter for "
+    "the rest of the call: the lead's interest and objections, dates or times "
+    "discussed or offered, email confirmations and anything already booked. "
+    "Write at most 120 words in plain sentences."
+)
+
+
+class ConversationHistoryManager:
+    """
+    Builds the history part of the prompt for a call.
+
+    Session fields used:
+        summary: Running summary of turns that left the verbatim window
+        summarized_count: Number of session messages covered by the summary
+    """
+
+    def __init__(self, client: AsyncOpenAI, router: ModelRouter):
+        """
+        Args:
+            client: OpenAI client used for background summarization
+            router: Model router (summaries use the "history_summary" route)
+        """
+        self.client = client
+        self.router = router
+        self.max_turns = settings.max_conversation_turns
+        self.token_budget = settings.history_token_budget
+
+        # In-flight summary updates, keyed by CallSid
+        self._summary_tasks: Dict[str, asyncio.Task] = {}
+
+    def _window_start(self, history: List[Dict[str, Any]]) -> int:
+        """
+        Index of the oldest message that fits the turn and token limits
+
+        A turn is a lead message plus the AI reply to it, so the window
+        starts on a lead message (or the opening line).
+        """
+        start = len(history)
+        tokens = 0
+        turns = 0
+        while start > 0 and turns < self.max_turns:
+            message = history[start - 1]
+            tokens += estimate_tokens(message.get("content"))
+            if tokens > self.token_budget:
+                break
+            start -= 1
+            if message.get("role") == "user":
+                turns += 1
+        if start == 1 and history[0].get("role") == "assistant":
+            start = 0  # Keep the opening line rather than summarizing it alone
+        return start
+
+    def window(
+        self,
+        history: List[Dict[str, Any]],
+        session: Optional[CallSession] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the history messages to send for this turn
+
+        Args:
+            history: Full conversation so far (OpenAI format, oldest first)
+            session: Call session holding the running summary
+
+        Returns:
+            Messages: optional summary system message, then recent turns
+        """
+        start = self._window_start(history)
+        if start == 0:
+            return list(history)
+
+        if session is None or not settings.history_summary_enabled:
+            return history[start:]
+
+        # Turns that dropped out of the window but aren't summarized yet
+        covered = min(session.summarized_count, len(history))
+        if covered < start:
+            self._schedule_summary(session, history, start)
+            # Keep them verbatim until the summary catches up, within a hard cap
+            backlog = sum(estimate_tokens(m.get("content")) for m in history[covered:start])
+            if backlog <= self.token_budget:
+                start = covered
+
+        messages = []
+        if session.summary:
+            messages.append({
+                "role": "system",
+                "content": f"SUMMARY OF THE EARLIER CONVERSATION:\n{session.summary}"
+            })
+        messages.extend(history[start:])
+        return messages
+
+    def _schedule_summary(self, session: CallSession, history: List[Dict[str, Any]], upto: int) -> None:
+        """Start a background summary update unless one is already running"""
+        if session.call_sid in self._summary_tasks:
+            return
+
+        call_sid = session.call_sid
+        new_turns = history[session.summarized_count:upto]
+        task = asyncio.create_task(self._update_summary(session, new_turns, upto))
+        self._summary_tasks[call_sid] = task
+        task.add_done_callback(lambda _: self._summary_tasks.pop(call_sid, None))
+
+    async def _update_summary(self, session: CallSession, new_turns: List[Dict[str, Any]], upto: int) -> None:
+        """Fold new_turns into the session's running summary"""
+        transcript = "\n".join(
+            f"{'AI' if turn['role'] == 'assistant' else 'Lead'}: {turn.get('content') or ''}"
+            for turn in new_turns
+        )
+        route = self.router.route("history_summary")
+        messages = [
+            {"role": "system", "content": SUMMARY_PROMPT},
+            {
+                "role": "user",
+                "content": f"Current summary:\n{session.summary or '(none)'}\n\nNew turns:\n{transcript}"
+            }
+        ]
+
+        # Background work: skip while the shared OpenAI budget is tight (retried next turn)
+        governor = get_rate_governor()
+        estimated_tokens = estimate_request_tokens(messages, route.max_tokens)
+        if governor.reserve_background(route.model, estimated_tokens):
+            logger.info(f"History summary for {session.call_sid} deferred - OpenAI budget tight")
+            return
+
+        try:
+            started = time.perf_counter()
+            response = await self.client.chat.completions.create(
+                model=route.model,
+                messages=messages,
+                temperature=0.2,
+                max_tokens=route.max_tokens
+            )
+            self.router.record_latency(route, (time.perf_counter() - started) * 1000)
+            self.router.record_usage(route, response.usage)
+            governor.settle(route.model, estimated_tokens, getattr(response.usage, "total_tokens", None))
+            get_llm_usage_stats().record(response.usage)
+        except Exception as e:
+            logger.warning(f"History summary update failed for {session.call_sid}: {e}")
+            return
+
+        summary = (response.choices[0].message.content or "").strip()
+        if not summary:
+            return
+
+        # Stored on its own so it can't overwrite a turn saved meanwhile
+        get_call_session_store().save_summary(session, summary, upto)
+        logger.info(f"Summarized {upto} message(s) for {session.call_sid}")
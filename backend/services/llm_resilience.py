@@ -0,0 +1,322 @@
+"""
+Deadlines, hedged requests and a circuit breaker for live-call completions
+
+A slow completion is dead air on the phone, and a failed one used to end
+the call. Completions on the live call path therefore:
+
+- run under a deadline (settings.llm_deadline_seconds)
+- are hedged: if the first request hasn't answered after the route's p95
+  latency, an identical second request is sent and the first answer wins
+- go through a process-wide circuit breaker; when the recent error rate
+  spikes, turns are answered with canned per-language replies instead of
+  waiting on a failing API
+
+Usage:
+    breaker = get_llm_circuit_breaker()
+    if not breaker.allow():
+        raise LLMUnavailableError("circuit open")
+    response = await hedged_call(lambda: client.chat.completions.create(...),
+                                 hedge_delay=1.2, deadline=6.0)
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from openai import APIConnectionError, APIStatusError
+
+from backend.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+# Spoken when a turn can't get a completion: "retry" keeps the call going,
+# "callback" ends it after repeated failures, "booked" wraps up a call whose
+# booking went through before the reply failed
+CANNED_REPLIES: Dict[str, Dict[str, str]] = {
+    "en": {
+        "retry": "Sorry, I missed that. Could you say it again?",
+        "callback": "I'm sorry, we're having a technical issue on our side. We'll call you back shortly. Goodbye!",
+        "booked": "You're all set, the calendar invite is on its way. Thank you and have a great day. Goodbye!",
+    },
+    "he": {
+        "retry": "סליחה, לא שמעתי. אפשר לחזור על זה?",
+        "callback": "מצטערים, יש לנו תקלה טכנית. נחזור אליך בהקדם. להתראות!",
+        "booked": "הכל מסודר, ההזמנה ליומן בדרך אליך. תודה ויום טוב. להתראות!",
+    },
+    "fr": {
+        "retry": "Pardon, je n'ai pas bien saisi. Pouvez-vous répéter ?",
+        "callback": "Désolé, nous rencontrons un problème technique. Nous vous rappellerons très bientôt. Au revoir !",
+        "booked": "C'est noté, l'invitation est en route. Merci et bonne journée. Au revoir !",
+    },
+    "es": {
+        "retry": "Perdón, no le escuché bien. ¿Puede repetirlo?",
+        "callback": "Lo siento, tenemos un problema técnico. Le volveremos a llamar en breve. ¡Adiós!",
+        "booked": "Listo, la invitación del calendario va en camino. Gracias y que tenga un buen día. ¡Adiós!",
+    },
+    "de": {
+        "retry": "Entschuldigung, das habe ich nicht verstanden. Können Sie das wiederholen?",
+        "callback": "Entschuldigung, wir haben ein technisches Problem. Wir rufen Sie in Kürze zurück. Auf Wiedersehen!",
+        "booked": "Alles erledigt, die Kalendereinladung ist unterwegs. Vielen Dank und einen schönen Tag. Auf Wiedersehen!",
+    },
+}
+
+
+class LLMUnavailableError(Exception):
+    """Raised instead of calling the API while the circuit breaker is open"""
+
+
+def canned_reply(language: str, kind: str) -> str:
+    """
+    Get a canned reply
+
+    Args:
+        language: Call language code (falls back to English)
+        kind: "retry", "callback" or "booked"
+
+    Returns:
+        Reply text
+    """
+    return CANNED_REPLIES.get(language, CANNED_REPLIES["en"])[kind]
+
+
+def is_service_failure(error: BaseException) -> bool:
+    """
+    Whether an error says the API is unhealthy (counts against the breaker)
+
+    Timeouts, connection errors, 429 and 5xx do; request errors such as a
+    400 for an unsupported parameter don't.
+    """
+    if isinstance(error, (asyncio.TimeoutError, APIConnectionError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker over a sliding time window.
+
+    closed: calls go through; opens when at least `min_requests` outcomes
+        in the window have an error rate >= `error_rate`
+    open: calls are refused for `open_seconds`
+    half_open: one probe call is let through; success closes, failure re-opens
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = None,
+        min_requests: int = None,
+        error_rate: float = None,
+        open_seconds: float = None
+    ):
+        self.window_seconds = window_seconds or settings.llm_breaker_window_seconds
+        self.min_requests = min_requests or settings.llm_breaker_min_requests
+        self.error_rate = error_rate or settings.llm_breaker_error_rate
+        self.open_seconds = open_seconds or settings.llm_breaker_open_seconds
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[float, bool]] = deque()  # (monotonic time, ok)
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self.state = "closed"
+        self.times_opened = 0
+        self.rejected = 0
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may go to the API
+
+        Returns:
+            False while open (and while a half-open probe is in flight)
+        """
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self._opened_at >= self.open_seconds:
+                self.state = "half_open"
+                self._probe_in_flight = False
+                logger.info("🔌 LLM circuit half-open - sending a probe request")
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._outcomes.append((now, True))
+            self._trim(now)
+            if self.state == "half_open":
+                self.state = "closed"
+                self._outcomes.clear()
+                logger.info("✅ LLM circuit closed")
+
+    def record_cancelled(self) -> None:
+        """A call was abandoned by the caller (e.g. barge-in) - frees the half-open probe"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._outcomes.append((now, False))
+            self._trim(now)
+            if self.state == "half_open":
+                self._open(now)
+                return
+            if self.state == "closed" and len(self._outcomes) >= self.min_requests:
+                failures = sum(1 for _, ok in self._outcomes if not ok)
+                if failures / len(self._outcomes) >= self.error_rate:
+                    self._open(now)
+
+    def _open(self, now: float) -> None:
+        self.state = "open"
+        self._opened_at = now
+        self._probe_in_flight = False
+        self.times_opened += 1
+        logger.warning(f"⚠️ LLM circuit opened - canned replies for the next {self.open_seconds:.0f}s")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._trim(time.monotonic())
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            return {
+                "state": self.state,
+                "window_requests": len(self._outcomes),
+                "window_error_rate": round(failures / len(self._outcomes), 4) if self._outcomes else None,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class HedgeStats:
+    """How often hedged requests were sent and how often they won"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.deadline_exceeded = 0
+
+    def record(self, hedged: bool, hedge_won: bool = False, timed_out: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            self.hedges += hedged
+            self.hedge_wins += hedge_won
+            self.deadline_exceeded += timed_out
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedges": self.hedges,
+                "hedge_rate": round(self.hedges / self.calls, 4) if self.calls else None,
+                "hedge_wins": self.hedge_wins,
+                "deadline_exceeded": self.deadline_exceeded,
+            }
+
+
+async def hedged_call(
+    attempt: Callable[[], Awaitable[T]],
+    hedge_delay: Optional[float],
+    deadline: float,
+    stats: Optional[HedgeStats] = None
+) -> T:
+    """
+    Run attempt() with a deadline, sending a second attempt after hedge_delay
+
+    The first successful result wins and the other attempt is cancelled. If
+    one attempt fails while the other is still running, the other one is
+    awaited.
+
+    Args:
+        attempt: Factory for one request (must be safe to run twice)
+        hedge_delay: Seconds before the hedge is sent (None = don't hedge)
+        deadline: Seconds until the whole call gives up
+        stats: Optional counters to update
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        asyncio.TimeoutError: If no attempt succeeded within the deadline
+        Exception: The last attempt's error if all attempts failed
+    """
+    loop = asyncio.get_running_loop()
+    deadline_at = loop.time() + deadline
+    hedge_at = loop.time() + hedge_delay if hedge_delay is not None and hedge_delay < deadline else None
+
+    first = asyncio.ensure_future(attempt())
+    pending = {first}
+    hedge: Optional[asyncio.Future] = None
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            wake_at = hedge_at if hedge is None and hedge_at is not None else deadline_at
+            done, pending = await asyncio.wait(
+                pending, timeout=max(0.0, wake_at - loop.time()), return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is None:
+                    if stats is not None:
+                        stats.record(hedged=hedge is not None, hedge_won=future is hedge)
+                    return future.result()
+                error = future.exception()
+
+            if not done and hedge is None and hedge_at is not None and loop.time() < deadline_at:
+                hedge = asyncio.ensure_future(attempt())
+                pending.add(hedge)
+                logger.info(f"⏱️ No LLM answer after {hedge_delay * 1000:.0f} ms - sending hedged request")
+            elif not done and loop.time() >= deadline_at:
+                if stats is not None:
+                    stats.record(hedged=hedge is not None, timed_out=True)
+                raise asyncio.TimeoutError(f"LLM deadline of {deadline:.1f}s exceeded")
+
+        if stats is not None:
+            stats.record(hedged=hedge is not None)
+        raise error
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# Process-wide breaker and hedge counters (shared by every LLMService)
+_llm_circuit_breaker = None
+_hedge_stats = None
+
+
+def get_llm_circuit_breaker() -> CircuitBreaker:
+    """
+    Get or create the process-wide LLM circuit breaker.
+
+    Returns:
+        CircuitBreaker instance
+    """
+    global _llm_circuit_breaker
+    if _llm_circuit_breaker is None:
+        _llm_circuit_breaker = CircuitBreaker()
+    return _llm_circuit_breaker
+
+
+def get_hedge_stats() -> HedgeStats:
+    """
+    Get or create the process-wide hedged request counters.
+
+    Returns:
+        HedgeStats instance
+    """
+    global _hedge_stats
+    if _hedge_stats is None:
+        _hedge_stats = HedgeStats()
+    return _hedge_stats
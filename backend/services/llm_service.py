@@ -2,18 +2,46 @@
 LLM Service with OpenAI Function Calling (Tools)
 Enables the AI to check calendars, book meetings, and send emails during calls.
 """
-from openai import AsyncOpenAI
+from openai import BadRequestError
+import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, AsyncIterator
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 import json
+import re
+import time
 from sqlalchemy.orm import Session
 
 from backend.config import get_settings
 from backend.database import SessionLocal
+from backend.services.async_calendar import AsyncCalendarService, BlockingCallTimeout, get_blocking_pool
 from backend.models.setting import Setting
 from backend.services.cache_service import get_cache_service
+from backend.services.call_session_store import CallSession, get_call_session_store
+from backend.services.history_manager import ConversationHistoryManager
+from backend.services.llm_resilience import (
+    LLMUnavailableError,
+    canned_reply,
+    get_hedge_stats,
+    get_llm_circuit_breaker,
+    hedged_call,
+    is_service_failure,
+)
+from backend.services.model_router import ModelRouter, Route
+from backend.services.openai_client import get_openai_client
+from backend.services.rate_governor import (
+    RateBudgetExceeded,
+    estimate_request_tokens,
+    get_rate_governor,
+)
+from backend.services.response_cache import ResponseCache
+from backend.services.slot_holds import get_slot_holds
+from backend.services.slot_index import get_slot_index
+from backend.utils.latency_metrics import get_turn_metrics
+from backend.utils.intent_keywords import mentions
+from backend.utils.llm_usage import get_llm_usage_stats
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -29,6 +57,272 @@ class ConversationIntent:
     END_CALL = "END_CALL"
 
 
+TURN_INTENTS = [
+    ConversationIntent.INTERESTED,
+    ConversationIntent.NOT_INTERESTED,
+    ConversationIntent.NEEDS_INFO,
+    ConversationIntent.SCHEDULE_MEETING,
+    ConversationIntent.MEETING_BOOKED,
+    ConversationIntent.END_CALL,
+]
+
+# Structured turn reply: spoken text, intent and end-call flag in one completion
+TURN_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "turn_reply",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "reply": {
+                    "type": "string",
+                    "description": "What to say to the lead, exactly as it should be spoken"
+                },
+                "intent": {
+                    "type": "string",
+                    "enum": TURN_INTENTS,
+                    "description": "Where the conversation stands after this reply"
+                },
+                "end_call": {
+                    "type": "boolean",
+                    "description": "True if this reply ends the call (goodbye said)"
+                }
+            },
+            "required": ["reply", "intent", "end_call"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+# "reply" string of a structured reply, possibly cut off before its closing quote
+_REPLY_FIELD = re.compile(r'"reply"\s*:\s*"((?:[^"\\]|\\.)*)(")?', re.DOTALL)
+_COMPLETE_SENTENCES = re.compile(r'.*[.!?。](?=\s|$)', re.DOTALL)
+
+
+def _salvage_reply(content: Optional[str]) -> Optional[str]:
+    """
+    Spoken text from a completion that isn't a valid structured reply
+
+    Plain text is returned as is. For JSON (e.g. cut off by max_tokens) the
+    "reply" field is extracted leniently; if the string itself was cut off,
+    only its complete sentences are kept. Raw JSON is never returned.
+
+    Args:
+        content: Message content from the completion
+
+    Returns:
+        Text to speak, or None if nothing usable is left
+    """
+    text = (content or "").strip()
+    if not text.startswith("{"):
+        return text or None
+
+    match = _REPLY_FIELD.search(text)
+    if not match:
+        return None
+    raw = match.group(1)
+    reply = None
+    # A cut-off string may end inside an escape sequence ("\u05")
+    for cut in range(0, 6 if match.group(2) is None else 1):
+        try:
+            reply = json.loads(f'"{raw[:len(raw) - cut]}"')
+            break
+        except ValueError:
+            continue
+    if reply is None:
+        return None
+
+    if match.group(2) is None:
+        complete = _COMPLETE_SENTENCES.match(reply)
+        reply = complete.group(0) if complete else ""
+    return reply.strip() or None
+
+
+def _meeting_booked(tool_calls: Optional[List[Dict]]) -> bool:
+    """True if a book_meeting call succeeded this turn"""
+    return any(
+        tool_call["tool"] == "book_meeting" and tool_call["result"].get("success")
+        for tool_call in tool_calls or []
+    )
+
+
+# Appended to the system prompt. Static so the request prefix (system prompt,
+# tool instructions, tool schemas) is byte-identical across calls and leads.
+TOOL_INSTRUCTIONS = """
+
+IMPORTANT: You have access to these tools for real actions:
+
+1. check_calendar_availability - Check available meeting time slots
+2. book_meeting - Book a meeting on the calendar (automatically sends Google Calendar invitation to guest email)
+
+Use these tools when appropriate:
+- When user asks "When are you available?", use check_calendar_availability
+- When user agrees to a time, use book_meeting immediately
+
+🚨 CRITICAL EMAIL HANDLING:
+- Check the CONVERSATION CONTEXT for the lead's email address
+- If email is already provided in context, use it directly for booking WITHOUT asking again
+- Only ask for email if it's NOT available in the conversation context
+- When user says "you already have it", they're referring to the email in context - use it immediately
+
+⚠️ TOOL EXECUTION REQUIREMENT:
+- You MUST actually CALL the book_meeting tool - saying "I'll book it" is NOT enough
+- Only use past tense ("I've booked") AFTER successfully calling the tool
+- Never use future tense ("I'll book") as a substitute for calling the tool
+
+Google Calendar will automatically send the invitation and reminders when book_meeting is called.
+"""
+
+# Spoken replies for check_calendar_availability results (local fast path).
+# "slots" is the list joined with the language's separator and "or". Each slot
+# is spoken with "slot" (fields: weekday, day, month, hour, hour12, minute,
+# ampm) and the language's own day/month names, not the English display string.
+SLOT_REPLY_TEMPLATES = {
+    "en": {
+        "reply": "I have {slots}. Which works best for you?",
+        "or": "or",
+        "slot": "{weekday}, {month} {day} at {hour12}:{minute:02d} {ampm}",
+        "days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
+        "months": ["January", "February", "March", "April", "May", "June", "July",
+                   "August", "September", "October", "November", "December"],
+    },
+    "he": {
+        "reply": "יש לי {slots}. מה הכי נוח לך?",
+        "or": "או",
+        "slot": "יום {weekday}, {day} ב{month} בשעה {hour}:{minute:02d}",
+        "days": ["שני", "שלישי", "רביעי", "חמישי", "שישי", "שבת", "ראשון"],
+        "months": ["ינואר", "פברואר", "מרץ", "אפריל", "מאי", "יוני", "יולי",
+                   "אוגוסט", "ספטמבר", "אוקטובר", "נובמבר", "דצמבר"],
+    },
+    "fr": {
+        "reply": "J'ai {slots}. Qu'est-ce qui vous convient le mieux ?",
+        "or": "ou",
+        "slot": "{weekday} {day} {month} à {hour}h{minute:02d}",
+        "days": ["lundi", "mardi", "mercredi", "jeudi", "vendredi", "samedi", "dimanche"],
+        "months": ["janvier", "février", "mars", "avril", "mai", "juin", "juillet",
+                   "août", "septembre", "octobre", "novembre", "décembre"],
+    },
+    "es": {
+        "reply": "Tengo {slots}. ¿Cuál le viene mejor?",
+        "or": "o",
+        "slot": "el {weekday} {day} de {month} a las {hour}:{minute:02d}",
+        "days": ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"],
+        "months": ["enero", "febrero", "marzo", "abril", "mayo", "junio", "julio",
+                   "agosto", "septiembre", "octubre", "noviembre", "diciembre"],
+    },
+    "de": {
+        "reply": "Ich hätte {slots}. Was passt Ihnen am besten?",
+        "or": "oder",
+        "slot": "{weekday}, {day}. {month} um {hour}:{minute:02d} Uhr",
+        "days": ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"],
+        "months": ["Januar", "Februar", "März", "April", "Mai", "Juni", "Juli",
+                   "August", "September", "Oktober", "November", "Dezember"],
+    },
+}
+
+
+def _spoken_slot(start: datetime, template: Dict[str, Any]) -> str:
+    """
+    One offered slot in the template's language
+
+    Names come from the template rather than strftime, so the output doesn't
+    depend on the process locale.
+
+    Args:
+        start: Slot start
+        template: Entry of SLOT_REPLY_TEMPLATES
+
+    Returns:
+        Spoken slot, e.g. "mardi 3 novembre à 10h00"
+    """
+    return template["slot"].format(
+        weekday=template["days"][start.weekday()],
+        day=start.day,
+        month=template["months"][start.month - 1],
+        hour=start.hour,
+        hour12=start.hour % 12 or 12,
+        minute=start.minute,
+        ampm="AM" if start.hour < 12 else "PM"
+    )
+
+
+# Ask streamed completions to report usage in a final chunk
+STREAM_USAGE_OPTIONS = {"stream_options": {"include_usage": True}}
+
+# Tool schemas for OpenAI function calling (module constant: serialized
+# identically on every request)
+TOOLS_DEFINITION: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {
+            "name": "check_calendar_availability",
+            "description": "Check available meeting slots in the calendar. Use this when user asks about availability.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "preferred_date": {
+                        "type": "string",
+                        "description": "Preferred date (e.g., 'tomorrow', 'next Tuesday', '2025-01-10')"
+                    },
+                    "duration_minutes": {
+                        "type": "number",
+                        "description": "Meeting duration in minutes",
+                        "default": 30
+                    },
+                    "num_slots": {
+                        "type": "number",
+                        "description": "Number of alternative slots to return",
+                        "default": 3
+                    }
+                },
+                "required": ["preferred_date"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "book_meeting",
+            "description": "Book a meeting on the calendar. ONLY use after user confirms time and provides email.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "datetime": {
+                        "type": "string",
+                        "description": "Meeting datetime in ISO format (e.g., '2025-01-10T14:00:00')"
+                    },
+                    "duration_minutes": {
+                        "type": "number",
+                        "description": "Meeting duration in minutes",
+                        "default": 30
+                    },
+                    "guest_email": {
+                        "type": "string",
+                        "description": "Guest's email address"
+                    },
+                    "guest_name": {
+                        "type": "string",
+                        "description": "Guest's full name"
+                    },
+                    "meeting_title": {
+                        "type": "string",
+                        "description": "Meeting title/subject",
+                        "default": "Sales Meeting"
+                    },
+                    "description": {
+                        "type": "string",
+                        "description": "Meeting agenda or description (optional)"
+                    }
+                },
+                "required": ["datetime", "guest_email", "guest_name"]
+            }
+        }
+    }
+]
+
+
 class LLMService:
     """
     LLM service with function calling capabilities.
@@ -46,15 +340,62 @@ class LLMService:
             calendar_service: CalendarService instance for booking
             zoom_service: ZoomService instance for video links (optional)
         """
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
-        self.model = "gpt-4o-mini"  # Fast and cost-effective
-        self.recently_offered_slots = []  # Track slots from check_calendar_availability
-        self.system_prompt = self._load_system_prompt()
+        self.client = get_openai_client()  # Shared per process (warm connection pool)
+        # Picks model/max_tokens per turn (routes from the llm_model_routes setting)
+        self.router = ModelRouter()
 
-        # Services for executing tools
+        self._system_prompt = self._load_system_prompt()
+        self._system_prompt_loaded_at = time.monotonic()
+        self._static_prompt: Optional[str] = None
+        self._static_prompt_source: Optional[str] = None
+        self._prompt_version = ""
+
+        # Replies to short, stock utterances (keyed by prompt version)
+        self.response_cache = ResponseCache()
+
+        # Cleared if the API rejects response_format (e.g. model without json_schema support)
+        self._structured_output_supported = True
+
+        # Bounds the history sent per turn (recent turns + running summary)
+        self.history = ConversationHistoryManager(self.client, self.router)
+
+        # Services for executing tools (blocking SDKs - called through bounded pools)
         self.calendar_service = calendar_service
         self.zoom_service = zoom_service
 
+        # In-flight speculative freebusy fetches, keyed by CallSid
+        self._prefetch_tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def calendar_service(self):
+        """Synchronous CalendarService (None if not configured)"""
+        return self._calendar_service
+
+    @calendar_service.setter
+    def calendar_service(self, calendar_service) -> None:
+        # The registry swaps in a new CalendarService when credentials change
+        self._calendar_service = calendar_service
+        self.calendar = AsyncCalendarService(calendar_service) if calendar_service else None
+
+    @property
+    def system_prompt(self) -> str:
+        """
+        Current system prompt.
+
+        The service lives for the whole process, so the prompt is re-read
+        periodically to pick up updates made through another worker.
+        """
+        if time.monotonic() - self._system_prompt_loaded_at > settings.system_prompt_refresh_seconds:
+            self.reload_system_prompt()
+        return self._system_prompt
+
+    def reload_system_prompt(self) -> None:
+        """Reload the system prompt from cache/database/file"""
+        self._system_prompt = self._load_system_prompt()
+        self._system_prompt_loaded_at = time.monotonic()
+        # Replies generated under the old prompt must not be served again
+        self.response_cache.clear()
+
     def _load_system_prompt(self) -> str:
         """
         Load the base system prompt from database (with cache) or file fallback.
@@ -133,34 +474,23 @@ class LLMService:
             return f"Hi {lead_info.get('name', 'there')}, this is Alex from Alta AI. How are you doing today?"
 
     def _get_system_prompt_with_tools(self) -> str:
-        """Get system prompt enhanced with tool instructions"""
-        base_prompt = self.system_prompt
-
-        tool_instructions = """
-
-IMPORTANT: You have access to these tools for real actions:
-
-1. check_calendar_availability - Check available meeting time slots
-2. book_meeting - Book a meeting on the calendar (automatically sends Google Calendar invitation to guest email)
-
-Use these tools when appropriate:
-- When user asks "When are you available?", use check_calendar_availability
-- When user agrees to a time, use book_meeting immediately
+        """
+        Get system prompt enhanced with tool instructions
 
-🚨 CRITICAL EMAIL HANDLING:
-- Check the CONVERSATION CONTEXT for the lead's email address
-- If email is already provided in context, use it directly for booking WITHOUT asking again
-- Only ask for email if it's NOT available in the conversation context
-- When user says "you already have it", they're referring to the email in context - use it immediately
+        Cached per prompt so every request starts with the exact same string
+        (keeps the prefix eligible for OpenAI prompt caching).
+        """
+        base_prompt = self.system_prompt
+        if self._static_prompt_source is not base_prompt:
+            self._static_prompt = base_prompt + TOOL_INSTRUCTIONS
+            self._static_prompt_source = base_prompt
+            self._prompt_version = hashlib.sha256(self._static_prompt.encode()).hexdigest()[:16]
+        return self._static_prompt
 
-⚠️ TOOL EXECUTION REQUIREMENT:
-- You MUST actually CALL the book_meeting tool - saying "I'll book it" is NOT enough
-- Only use past tense ("I've booked") AFTER successfully calling the tool
-- Never use future tense ("I'll book") as a substitute for calling the tool
-
-Google Calendar will automatically send the invitation and reminders when book_meeting is called.
-"""
-        return base_prompt + tool_instructions
+    def _get_prompt_version(self, model: str) -> str:
+        """Short hash identifying the current prompt and model (response cache key part)"""
+        self._get_system_prompt_with_tools()
+        return f"{model}:{self._prompt_version}"
 
     def _get_tools_definition(self) -> List[Dict]:
         """
@@ -169,82 +499,21 @@ Google Calendar will automatically send the invitation and reminders when book_m
         Returns:
             List of tool definitions in OpenAI format
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "check_calendar_availability",
-                    "description": "Check available meeting slots in the calendar. Use this when user asks about availability.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "preferred_date": {
-                                "type": "string",
-                                "description": "Preferred date (e.g., 'tomorrow', 'next Tuesday', '2025-01-10')"
-                            },
-                            "duration_minutes": {
-                                "type": "number",
-                                "description": "Meeting duration in minutes",
-                                "default": 30
-                            },
-                            "num_slots": {
-                                "type": "number",
-                                "description": "Number of alternative slots to return",
-                                "default": 3
-                            }
-                        },
-                        "required": ["preferred_date"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "book_meeting",
-                    "description": "Book a meeting on the calendar. ONLY use after user confirms time and provides email.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "datetime": {
-                                "type": "string",
-                                "description": "Meeting datetime in ISO format (e.g., '2025-01-10T14:00:00')"
-                            },
-                            "duration_minutes": {
-                                "type": "number",
-                                "description": "Meeting duration in minutes",
-                                "default": 30
-                            },
-                            "guest_email": {
-                                "type": "string",
-                                "description": "Guest's email address"
-                            },
-                            "guest_name": {
-                                "type": "string",
-                                "description": "Guest's full name"
-                            },
-                            "meeting_title": {
-                                "type": "string",
-                                "description": "Meeting title/subject",
-                                "default": "Sales Meeting"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Meeting agenda or description (optional)"
-                            }
-                        },
-                        "required": ["datetime", "guest_email", "guest_name"]
-                    }
-                }
-            }
-        ]
+        return TOOLS_DEFINITION
 
-    async def _execute_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_tool(
+        self,
+        tool_name: str,
+        tool_args: Dict[str, Any],
+        session: Optional[CallSession] = None
+    ) -> Dict[str, Any]:
         """
         Execute a tool function
 
         Args:
             tool_name: Name of the tool to execute
             tool_args: Arguments for the tool
+            session: Call session the tool runs for (holds per-call state)
 
         Returns:
             Tool execution result
@@ -256,19 +525,22 @@ Google Calendar will automatically send the invitation and reminders when book_m
             logger.info("=" * 80)
 
             result = None
+            tool_started = time.perf_counter()
 
             if tool_name == "check_calendar_availability":
                 logger.info("📅 Executing: check_calendar_availability")
-                result = await self._check_calendar_availability(tool_args)
+                result = await self._check_calendar_availability(tool_args, session)
 
             elif tool_name == "book_meeting":
                 logger.info("📆 Executing: book_meeting")
-                result = await self._book_meeting(tool_args)
+                result = await self._book_meeting(tool_args, session)
 
             else:
                 logger.error(f"❌ Unknown tool requested: {tool_name}")
                 return {"error": f"Unknown tool: {tool_name}"}
 
+            get_turn_metrics().record(tool_name, (time.perf_counter() - tool_started) * 1000, group="tools")
+
             logger.info("=" * 80)
             logger.info(f"✅ TOOL RESULT: {tool_name}")
             logger.info(f"Result: {json.dumps(result, indent=2, default=str)}")
@@ -285,6 +557,92 @@ Google Calendar will automatically send the invitation and reminders when book_m
             logger.error("=" * 80)
             return {"error": str(e)}
 
+    async def _run_tool_calls(
+        self,
+        calls: List[Dict[str, str]],
+        messages: List[Dict[str, Any]],
+        session: Optional[CallSession] = None,
+        content: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Execute the tool calls from one model response
+
+        Independent tools run concurrently (bounded by
+        settings.tool_concurrency_limit). book_meeting runs afterwards, one
+        at a time, because it validates against slots that
+        check_calendar_availability stores on the session.
+
+        Appends a single assistant message carrying all tool calls, followed
+        by one tool message per call, to `messages`.
+
+        Args:
+            calls: Tool calls as {"id", "name", "arguments" (JSON string)}
+            messages: Conversation to extend with the tool exchange
+            session: Call session the tools run for
+            content: Assistant text that accompanied the tool calls
+
+        Returns:
+            List of {"tool", "args", "result"} in the model's order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        parsed_args: List[Dict[str, Any]] = []
+        invalid = set()
+        for index, call in enumerate(calls):
+            try:
+                args = json.loads(call["arguments"] or "{}")
+                if not isinstance(args, dict):
+                    raise ValueError("arguments must be a JSON object")
+            except ValueError as e:  # Includes json.JSONDecodeError
+                # Malformed (e.g. truncated) arguments fail only this call
+                logger.error(f"❌ Invalid arguments for {call['name']}: {e}")
+                args = {}
+                invalid.add(index)
+                results[index] = {
+                    "error": f"Invalid arguments for {call['name']}: {e}. Call the tool again with valid JSON."
+                }
+            parsed_args.append(args)
+        semaphore = asyncio.Semaphore(settings.tool_concurrency_limit)
+
+        async def run(index: int) -> None:
+            if results[index] is not None:
+                return
+            async with semaphore:
+                results[index] = await self._execute_tool(calls[index]["name"], parsed_args[index], session)
+
+        independent = [i for i, call in enumerate(calls) if call["name"] != "book_meeting"]
+        await asyncio.gather(*(run(i) for i in independent))
+        for i, call in enumerate(calls):
+            if call["name"] == "book_meeting":
+                await run(i)
+
+        messages.append({
+            "role": "assistant",
+            "content": content,
+            "tool_calls": [
+                {
+                    "id": call["id"],
+                    "type": "function",
+                    # Malformed arguments are echoed as {} so the request stays valid
+                    "function": {"name": call["name"], "arguments": "{}" if i in invalid else call["arguments"]}
+                }
+                for i, call in enumerate(calls)
+            ]
+        })
+        for call, result in zip(calls, results):
+            messages.append({
+                "role": "tool",
+                "tool_call_id": call["id"],
+                "content": json.dumps(result)
+            })
+            if call["name"] == "book_meeting" and session is not None:
+                # A failed booking sends the next turn to the recovery route
+                session.booking_failed = not (result or {}).get("success")
+
+        return [
+            {"tool": call["name"], "args": args, "result": result}
+            for call, args, result in zip(calls, parsed_args, results)
+        ]
+
     def _parse_date_string(self, date_str: str) -> datetime:
         """
         Parse natural language or ISO date string to datetime.
@@ -331,7 +689,7 @@ Google Calendar will automatically send the invitation and reminders when book_m
                 logger.warning(f"Could not parse date '{date_str}', defaulting to tomorrow")
                 return now + timedelta(days=1)
 
-    async def _check_calendar_availability(self, args: Dict) -> Dict:
+    async def _check_calendar_availability(self, args: Dict, session: Optional[CallSession] = None) -> Dict:
         """
         Check calendar availability and return free slots.
 
@@ -340,6 +698,7 @@ Google Calendar will automatically send the invitation and reminders when book_m
                 - preferred_date: Natural language date (e.g., "next week", "tomorrow")
                 - duration_minutes: Meeting duration (default: 30)
                 - num_slots: Number of slots to return (default: 3)
+            session: Call session the offered slots are stored on
 
         Returns:
             Dictionary with success status and available slots
@@ -372,19 +731,44 @@ Google Calendar will automatically send the invitation and reminders when book_m
             end_date = start_date + timedelta(days=14)
             logger.info(f"   - End date: {end_date.strftime('%A, %B %d, %Y')}")
 
-            # Get available slots from calendar service
-            logger.info("🔍 Querying calendar for available slots...")
-            slots = self.calendar_service.get_available_slots(
-                start_date=start_date,
-                end_date=end_date,
-                duration_minutes=duration
+            # Resolve from the precomputed slot index or the speculative prefetch
+            # when they cover the request, otherwise query the calendar. Extra
+            # candidates let the offer skip slots other calls are holding.
+            calendar_id = settings.google_calendar_id or 'primary'
+            candidates = max(num_slots, settings.slot_hold_candidates)
+            slots = get_slot_index().free_slots(
+                calendar_id,
+                start_date,
+                end_date,
+                duration,
+                limit=candidates,
+                min_slots=num_slots
             )
+            if slots is not None:
+                logger.info("⚡ Using the precomputed slot index")
+            else:
+                slots = await self._slots_from_prefetch(session, start_date, end_date, duration, num_slots)
+                if slots is None:
+                    logger.info("🔍 Querying calendar for available slots...")
+                    slots = await self.calendar.get_available_slots(
+                        start_date=start_date,
+                        end_date=end_date,
+                        duration_minutes=duration,
+                        limit=candidates
+                    )
+                else:
+                    logger.info("⚡ Using prefetched calendar availability")
 
             logger.info(f"✅ Calendar query complete - found {len(slots)} total slots")
 
-            # Store the actual slot objects for validation during booking
-            selected_slots = slots[:num_slots]
-            self.recently_offered_slots = selected_slots
+            # Hold the offered slots for this call (skipping ones other calls hold)
+            # and store them for validation during booking
+            if session is not None:
+                selected_slots = get_slot_holds().hold_offers(session.call_sid, calendar_id, slots, num_slots)
+                session.offered_slots = selected_slots
+                session.offered_at = len(session.messages)
+            else:
+                selected_slots = slots[:num_slots]
 
             # Extract just the display strings for the LLM
             display_slots = [slot['display'] for slot in selected_slots]
@@ -405,7 +789,100 @@ Google Calendar will automatically send the invitation and reminders when book_m
             logger.error(f"   - Full traceback:", exc_info=True)
             return {"success": False, "error": str(e)}
 
-    async def _book_meeting(self, args: Dict) -> Dict:
+    def _prefetch_availability(self, session: Optional[CallSession]) -> None:
+        """
+        Start a background freebusy fetch for the next few weeks.
+
+        Called when the lead sounds interested, so the likely
+        check_calendar_availability on a following turn resolves from memory
+        instead of paying for a Google round trip. The result is saved with the
+        call session.
+
+        Args:
+            session: Call session to store the busy times on
+        """
+        if session is None or not self.calendar_service or not settings.calendar_prefetch_enabled:
+            return
+        if session.call_sid in self._prefetch_tasks:
+            return
+        # check_calendar_availability will answer from the slot index
+        if get_slot_index().is_fresh(settings.google_calendar_id or 'primary'):
+            return
+
+        prefetched = session.prefetched_availability
+        if prefetched and time.time() - prefetched["fetched_at"] < settings.calendar_prefetch_ttl_seconds:
+            return
+
+        call_sid = session.call_sid
+        task = asyncio.create_task(self._fetch_busy_times(session))
+        self._prefetch_tasks[call_sid] = task
+        task.add_done_callback(lambda _: self._prefetch_tasks.pop(call_sid, None))
+
+    async def _fetch_busy_times(self, session: CallSession) -> None:
+        """Fetch freebusy off the event loop and save it with the call session"""
+        start = datetime.now(timezone.utc)
+        end = start + timedelta(days=settings.calendar_prefetch_days)
+        try:
+            busy = await self.calendar.get_busy_times(start, end)
+        except Exception as e:
+            logger.warning(f"Calendar prefetch failed for {session.call_sid}: {e}")
+            return
+        if busy is None:
+            return
+
+        prefetched = {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "busy": busy,
+            "fetched_at": time.time()
+        }
+        # Stored on its own so it can't overwrite a turn saved meanwhile;
+        # the next turn finds it on any worker
+        get_call_session_store().save_prefetch(session, prefetched)
+        logger.info(f"📅 Prefetched {len(busy)} busy interval(s) for {session.call_sid}")
+
+    async def _slots_from_prefetch(
+        self,
+        session: Optional[CallSession],
+        start_date: datetime,
+        end_date: datetime,
+        duration: int,
+        num_slots: int
+    ) -> Optional[List[Dict]]:
+        """
+        Compute slots from prefetched busy times
+
+        Returns:
+            Slots, or None if the prefetch is missing, stale or doesn't cover
+            enough of the requested range
+        """
+        if session is None:
+            return None
+
+        task = self._prefetch_tasks.get(session.call_sid)
+        if task is not None:
+            # Already in flight - cheaper to wait for it than to start another query
+            await asyncio.wait({task})
+
+        prefetched = session.prefetched_availability
+        if not prefetched or time.time() - prefetched["fetched_at"] >= settings.calendar_prefetch_ttl_seconds:
+            return None
+
+        covered_start = datetime.fromisoformat(prefetched["start"])
+        covered_end = datetime.fromisoformat(prefetched["end"])
+        if start_date < covered_start or start_date >= covered_end:
+            return None
+
+        window_end = min(end_date, covered_end)
+        slots = self.calendar_service.compute_available_slots(
+            start_date, window_end, duration, prefetched["busy"], limit=max(num_slots, settings.slot_hold_candidates)
+        )
+        # A truncated window is only trustworthy if it already yields enough slots
+        if window_end < end_date and len(slots) < num_slots:
+            return None
+        return slots
+
+    async def _book_meeting(self, args: Dict, session: Optional[CallSession] = None) -> Dict:
         """
         Book a meeting on Google Calendar with Zoom video conferencing.
 
@@ -422,6 +899,7 @@ Google Calendar will automatically send the invitation and reminders when book_m
                 - duration_minutes: Meeting duration (default: 30)
                 - meeting_title: Meeting title (default: "Sales Meeting")
                 - description: Meeting description (optional)
+            session: Call session (used to validate against offered slots)
 
         Returns:
             Dictionary with success status, event_id, zoom_link, and video_link
@@ -445,6 +923,9 @@ Google Calendar will automatically send the invitation and reminders when book_m
                 "error": "Calendar service is not configured. Please contact support."
             }
 
+        holds = get_slot_holds()
+        claimed = False  # Holding a booked marker that must be dropped if booking fails
+
         try:
             # Validate and parse datetime
             logger.info(f"📅 Parsing datetime: {args.get('datetime')}")
@@ -461,9 +942,10 @@ Google Calendar will automatically send the invitation and reminders when book_m
                 }
 
             # Validate that the datetime matches one of the recently offered slots
-            if self.recently_offered_slots:
+            offered_slots = session.offered_slots if session else []
+            if offered_slots:
                 logger.info("🔍 Validating datetime against recently offered slots...")
-                offered_datetimes = [slot['start'] for slot in self.recently_offered_slots]
+                offered_datetimes = [datetime.fromisoformat(slot['start']) for slot in offered_slots]
 
                 # Compare date and time (ignore timezone/microseconds)
                 matching_slot = None
@@ -480,8 +962,8 @@ Google Calendar will automatically send the invitation and reminders when book_m
                     logger.warning(f"⚠️ WARNING: Datetime does NOT match any offered slots!")
                     logger.warning(f"   - Requested: {meeting_datetime.strftime('%A, %B %d at %I:%M %p')}")
                     logger.warning(f"   - Offered slots were:")
-                    for i, slot in enumerate(self.recently_offered_slots, 1):
-                        logger.warning(f"      {i}. {slot['display']} ({slot['start'].strftime('%Y-%m-%d %H:%M')})")
+                    for i, slot in enumerate(offered_slots, 1):
+                        logger.warning(f"      {i}. {slot['display']} ({slot['start']})")
                     logger.warning("   - Proceeding with booking anyway, but AI may have selected wrong date!")
             else:
                 logger.info("ℹ️ No recently offered slots to validate against (first booking or cache cleared)")
@@ -499,12 +981,46 @@ Google Calendar will automatically send the invitation and reminders when book_m
             logger.info(f"   - Start: {meeting_datetime.isoformat()}")
             logger.info(f"   - End: {end_time.isoformat()}")
 
+            # Atomically claim the time against other calls' holds and bookings
+            calendar_id = settings.google_calendar_id or 'primary'
+            meeting_start = meeting_datetime if meeting_datetime.tzinfo else meeting_datetime.replace(tzinfo=timezone.utc)
+            meeting_end = meeting_start + timedelta(minutes=duration)
+            hold_owner = session.call_sid if session is not None else "unknown"
+            if not holds.claim(hold_owner, calendar_id, meeting_start, meeting_end):
+                logger.warning(f"⚠️ Slot {meeting_start.isoformat()} is held or booked by another call")
+                return {
+                    "success": False,
+                    "error": "That time was just taken by another booking. Apologize, check availability again and offer other times."
+                }
+            claimed = True
+
+            # Offers may come from the slot index or cached freebusy - confirm with Google
+            conflicts = await self.calendar.get_busy_times(meeting_start, meeting_end, use_cache=False)
+            if conflicts is None:
+                # API error or no calendar service - can't tell whether the time is free
+                logger.error(f"❌ Could not confirm {meeting_start.isoformat()} with Google Calendar")
+                holds.release_claim(hold_owner, calendar_id, meeting_start, meeting_end)
+                return {
+                    "success": False,
+                    "error": "Couldn't confirm the time with the calendar. Apologize and try booking again in a moment."
+                }
+            if conflicts:
+                logger.warning(f"⚠️ Slot {meeting_start.isoformat()} was taken since it was offered")
+                holds.release_claim(hold_owner, calendar_id, meeting_start, meeting_end)
+                return {
+                    "success": False,
+                    "error": "That time was just taken. Apologize, check availability again and offer other times."
+                }
+
             # Create Zoom meeting if service is available
             zoom_link = None
             if self.zoom_service:
                 logger.info("🎥 Zoom service available - attempting to create Zoom meeting")
                 try:
-                    zoom_meeting = self.zoom_service.create_meeting(
+                    zoom_meeting = await get_blocking_pool("zoom").run(
+                        "create_meeting",
+                        self.zoom_service.create_meeting,
+                        timeout=settings.zoom_timeout_seconds,
                         topic=meeting_title,
                         start_time=meeting_datetime,
                         duration=duration,
@@ -534,19 +1050,38 @@ Google Calendar will automatically send the invitation and reminders when book_m
             logger.info(f"   - Attendee: {args['guest_email']}")
             logger.info(f"   - Description length: {len(meeting_description)} chars")
 
-            result = self.calendar_service.create_meeting(
-                summary=meeting_title,
-                start_time=meeting_datetime,
-                end_time=end_time,
-                attendee_email=args["guest_email"],
-                description=meeting_description
-            )
+            try:
+                result = await self.calendar.create_meeting(
+                    summary=meeting_title,
+                    start_time=meeting_datetime,
+                    end_time=end_time,
+                    attendee_email=args["guest_email"],
+                    description=meeting_description
+                )
+            except BlockingCallTimeout as e:
+                # Google may still create the event - keep the claim and don't let the AI book it twice
+                claimed = False
+                logger.error(f"❌ {e}")
+                return {
+                    "success": False,
+                    "error": "The calendar didn't confirm in time. Tell the lead the invite will follow by email if it went through - do not book again."
+                }
 
             if not result:
                 logger.error("❌ Calendar service returned None - failed to create event")
+                holds.release_claim(hold_owner, calendar_id, meeting_start, meeting_end)
                 return {"success": False, "error": "Failed to create calendar event"}
 
             event_id = result['event_id']
+            claimed = False
+
+            # The prefetched busy times and the slot index don't include this meeting yet;
+            # the other offered slots are free for other calls again
+            if session is not None:
+                get_call_session_store().save_prefetch(session, None)
+                session.offered_slots = []
+            get_slot_index().mark_busy(calendar_id, event_id, meeting_start, meeting_end)
+            holds.release_call(hold_owner)
 
             logger.info("✅ MEETING BOOKED SUCCESSFULLY!")
             logger.info(f"   - Event ID: {event_id}")
@@ -566,6 +1101,8 @@ Google Calendar will automatically send the invitation and reminders when book_m
             }
 
         except Exception as e:
+            if claimed:
+                holds.release_claim(hold_owner, calendar_id, meeting_start, meeting_end)
             logger.error("=" * 80)
             logger.error(f"❌ MEETING BOOKING ERROR: {e}")
             logger.error(f"   - Error type: {type(e).__name__}")
@@ -573,37 +1110,45 @@ Google Calendar will automatically send the invitation and reminders when book_m
             logger.error("=" * 80)
             return {"success": False, "error": str(e)}
 
-    async def get_response_with_tools(
+    def _build_messages(
         self,
         user_message: str,
         conversation_history: List[Dict[str, str]],
-        lead_info: Optional[Dict] = None
-    ) -> Tuple[str, str, Optional[List[Dict]]]:
+        lead_info: Optional[Dict] = None,
+        session: Optional[CallSession] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Get AI response with tool calling support
+        Build the chat messages for a conversational turn
+
+        Layout is prefix-cache friendly: the static system prompt comes first
+        (identical for every call), then the conversation so far (stable
+        within a call), and only then the per-lead context and the new user
+        message.
 
         Args:
             user_message: User's spoken message
             conversation_history: Previous conversation turns
             lead_info: Lead information (name, email)
+            session: Call session (running summary of older turns)
 
         Returns:
-            Tuple of (intent, response_text, tool_calls)
+            Messages list in OpenAI format
         """
-        try:
-            # Build messages for API
-            messages = [
-                {"role": "system", "content": self._get_system_prompt_with_tools()}
-            ]
+        messages = [
+            {"role": "system", "content": self._get_system_prompt_with_tools()}
+        ]
+
+        # Add conversation history (recent turns, older ones summarized)
+        messages.extend(self.history.window(conversation_history, session))
 
-            # Add lead context if available
-            if lead_info:
-                lead_name = lead_info.get('name', 'Unknown')
-                lead_email = lead_info.get('email', '')
+        # Add lead context if available (after the shared prefix)
+        if lead_info:
+            lead_name = lead_info.get('name', 'Unknown')
+            lead_email = lead_info.get('email', '')
 
-                if lead_email:
-                    # Email is available - make it VERY clear to the AI
-                    context = f"""CONVERSATION CONTEXT:
+            if lead_email:
+                # Email is available - make it VERY clear to the AI
+                context = f"""CONVERSATION CONTEXT:
 You are speaking with: {lead_name}
 Their email address on file: {lead_email}
 
@@ -612,91 +1157,513 @@ Their email address on file: {lead_email}
 - DO NOT ask them to confirm it
 - USE IT IMMEDIATELY when booking the meeting
 - If they say "you already have it", they are correct - proceed with booking using {lead_email}"""
-                else:
-                    # Email not available - AI needs to ask for it
-                    context = f"""CONVERSATION CONTEXT:
+            else:
+                # Email not available - AI needs to ask for it
+                context = f"""CONVERSATION CONTEXT:
 You are speaking with: {lead_name}
 Their email address: NOT PROVIDED - you must ask for it before booking
 
 ⚠️ REQUIRED: You MUST ask for their email address before you can book a meeting."""
 
-                messages.append({"role": "system", "content": context})
+            messages.append({"role": "system", "content": context})
+
+        # Add current user message
+        messages.append({"role": "user", "content": user_message})
 
-            # Add conversation history
-            messages.extend(conversation_history)
+        return messages
 
-            # Add current user message
-            messages.append({"role": "user", "content": user_message})
+    async def get_response_with_tools(
+        self,
+        user_message: str,
+        conversation_history: List[Dict[str, str]],
+        lead_info: Optional[Dict] = None,
+        session: Optional[CallSession] = None
+    ) -> Tuple[str, str, Optional[List[Dict]]]:
+        """
+        Get AI response with tool calling support
 
-            logger.info(f"Sending to LLM with tools: {user_message[:100]}...")
+        Args:
+            user_message: User's spoken message
+            conversation_history: Previous conversation turns
+            lead_info: Lead information (name, email)
+            session: Call session (per-call tool state such as offered slots)
 
-            # Call OpenAI with function calling enabled
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=self._get_tools_definition(),
-                tool_choice="auto",  # Let model decide when to use tools
-                temperature=0.7,
-                max_tokens=200
+        Returns:
+            Tuple of (intent, response_text, tool_calls)
+        """
+        tool_calls_data = []
+        try:
+            route = self.router.choose(user_message, conversation_history, session)
+
+            # Stock utterances are answered from the response cache
+            cache_key = self.response_cache.make_key(
+                user_message, conversation_history, session, self._get_prompt_version(route.model)
             )
+            cached = self.response_cache.get(cache_key, session)
+            if cached is not None:
+                intent, ai_response = cached
+                logger.info(f"⚡ Response cache hit ({intent}): {ai_response[:100]}...")
+                if intent in (ConversationIntent.INTERESTED, ConversationIntent.SCHEDULE_MEETING):
+                    self._prefetch_availability(session)
+                get_llm_usage_stats().record_turn(0)
+                return intent, ai_response, None
+
+            turn_started = time.perf_counter()
+            messages = self._build_messages(user_message, conversation_history, lead_info, session)
+
+            logger.info(f"Sending to LLM with tools ({route.name}: {route.model}): {user_message[:100]}...")
+
+            # Call OpenAI with function calling enabled
+            with get_turn_metrics().span("first_completion"):
+                response = await self._create_turn_completion(
+                    route,
+                    messages=messages,
+                    tools=self._get_tools_definition(),
+                    tool_choice="auto",  # Let model decide when to use tools
+                    temperature=0.7
+                )
+            self._record_usage(response.usage, session, route)
+            completions = 1
 
             assistant_message = response.choices[0].message
-            tool_calls_data = []
 
             # Check if model wants to call any tools
             if assistant_message.tool_calls:
                 logger.info(f"LLM wants to call {len(assistant_message.tool_calls)} tool(s)")
 
-                # Execute each tool call
-                for tool_call in assistant_message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = json.loads(tool_call.function.arguments)
-
-                    # Execute the tool
-                    tool_result = await self._execute_tool(tool_name, tool_args)
-
-                    tool_calls_data.append({
-                        "tool": tool_name,
-                        "args": tool_args,
-                        "result": tool_result
-                    })
-
-                    # Add tool result to conversation for LLM context
-                    messages.append({
-                        "role": "assistant",
-                        "content": None,
-                        "tool_calls": [tool_call]
-                    })
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": json.dumps(tool_result)
-                    })
-
-                # Get final response after tool execution
-                final_response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=0.7,
-                    max_tokens=200
+                calls = [
+                    {
+                        "id": tool_call.id,
+                        "name": tool_call.function.name,
+                        "arguments": tool_call.function.arguments
+                    }
+                    for tool_call in assistant_message.tool_calls
+                ]
+                tool_calls_data = await self._run_tool_calls(
+                    calls, messages, session, content=assistant_message.content
                 )
 
-                ai_response = final_response.choices[0].message.content.strip()
+                # Slot offers can be spoken from a template; anything else
+                # needs the model to write the reply
+                ai_response = self._local_tool_reply(tool_calls_data, session)
+                if ai_response is None:
+                    # Get final response after tool execution (same tools in the
+                    # request so the cached prefix still matches; none may be called)
+                    with get_turn_metrics().span("second_completion"):
+                        final_response = await self._create_turn_completion(
+                            route,
+                            messages=messages,
+                            tools=self._get_tools_definition(),
+                            tool_choice="none",
+                            temperature=0.7
+                        )
+                    self._record_usage(final_response.usage, session, route)
+                    completions += 1
+
+                    ai_response = final_response.choices[0].message.content
 
             else:
                 # No tool calls, use direct response
-                ai_response = assistant_message.content.strip() if assistant_message.content else "I'm here to help!"
+                ai_response = assistant_message.content
 
-            # Classify intent based on response and tool usage
-            intent = self._classify_intent(ai_response, user_message, tool_calls_data)
+            # Intent comes with the structured reply; keywords are the fallback
+            structured = self._parse_turn_reply(ai_response, tool_calls_data)
+            salvaged = False
+            if structured is not None:
+                intent, ai_response = structured
+            else:
+                # Truncated or malformed structured output - never speak the raw JSON
+                salvaged = (ai_response or "").lstrip().startswith("{")
+                ai_response = _salvage_reply(ai_response)
+                if ai_response is None:
+                    logger.warning("⚠️ Completion had no usable reply (truncated or malformed) - using a canned reply")
+                    get_llm_usage_stats().record_turn(completions)
+                    intent, ai_response = self._fallback_reply(session, tool_calls_data)
+                    return intent, ai_response, tool_calls_data if tool_calls_data else None
+                intent = self._classify_intent(ai_response, user_message, tool_calls_data)
+            if intent in (ConversationIntent.INTERESTED, ConversationIntent.SCHEDULE_MEETING):
+                self._prefetch_availability(session)
 
             logger.info(f"LLM response ({intent}): {ai_response[:100]}...")
+            get_llm_usage_stats().record_turn(completions)
+            if session is not None:
+                session.llm_fallbacks = 0
+
+            # Only complete, plain conversational replies are reusable (tool results are live data)
+            if not tool_calls_data and not salvaged:
+                self.response_cache.put(
+                    cache_key, session, intent, ai_response, (time.perf_counter() - turn_started) * 1000
+                )
 
             return intent, ai_response, tool_calls_data if tool_calls_data else None
 
         except Exception as e:
             logger.error(f"LLM error: {str(e)}")
-            return ConversationIntent.END_CALL, "I apologize, but I'm having technical difficulties. Goodbye!", None
+            intent, ai_response = self._fallback_reply(session, tool_calls_data)
+            return intent, ai_response, tool_calls_data if tool_calls_data else None
+
+    async def stream_response(
+        self,
+        user_message: str,
+        conversation_history: List[Dict[str, str]],
+        lead_info: Optional[Dict] = None,
+        session: Optional[CallSession] = None,
+        turn: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream the AI response token by token (for the media-stream websocket)
+
+        Tool calls are accumulated from the stream, executed, and the follow-up
+        completion is streamed as well. When the stream is exhausted, `turn`
+        is filled with "response", "tool_calls", "intent" and "completions". While tools are
+        executing, turn["tools_running"] is True and the caller should let the
+        generator finish rather than cancel it.
+
+        Args:
+            user_message: User's spoken message
+            conversation_history: Previous conversation turns
+            lead_info: Lead information (name, email)
+            session: Call session (per-call tool state such as offered slots)
+            turn: Optional dict that receives the final turn result
+
+        Yields:
+            Response text fragments as they arrive
+        """
+        turn = turn if turn is not None else {}
+        route = self.router.choose(user_message, conversation_history, session)
+
+        cache_key = self.response_cache.make_key(
+            user_message, conversation_history, session, self._get_prompt_version(route.model)
+        )
+        cached = self.response_cache.get(cache_key, session)
+        if cached is not None:
+            turn["intent"], turn["response"] = cached
+            turn["tool_calls"] = None
+            turn["completions"] = 0
+            logger.info(f"⚡ Response cache hit ({turn['intent']}): {turn['response'][:100]}...")
+            if turn["intent"] in (ConversationIntent.INTERESTED, ConversationIntent.SCHEDULE_MEETING):
+                self._prefetch_availability(session)
+            get_llm_usage_stats().record_turn(0)
+            yield turn["response"]
+            return
+
+        turn_started = time.perf_counter()
+        messages = self._build_messages(user_message, conversation_history, lead_info, session)
+        response_parts: List[str] = []
+        tool_calls_data: List[Dict] = []
+        completions = 0
+        spoken = False
+
+        logger.info(f"Streaming LLM response with tools ({route.name}: {route.model}): {user_message[:100]}...")
+
+        try:
+            stream = self._create_stream(
+                route,
+                messages=messages,
+                tools=self._get_tools_definition(),
+                tool_choice="auto",
+                temperature=0.7
+            )
+            completions += 1
+
+            # Tool call fragments arrive split across chunks, keyed by index
+            pending_tool_calls: Dict[int, Dict[str, str]] = {}
+            async for chunk in stream:
+                if not chunk.choices:
+                    # Final chunk carries usage (stream_options.include_usage)
+                    self._record_usage(getattr(chunk, "usage", None), session, route)
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    response_parts.append(delta.content)
+                    spoken = True
+                    yield delta.content
+                for tool_delta in delta.tool_calls or []:
+                    entry = pending_tool_calls.setdefault(
+                        tool_delta.index, {"id": "", "name": "", "arguments": ""}
+                    )
+                    if tool_delta.id:
+                        entry["id"] = tool_delta.id
+                    if tool_delta.function and tool_delta.function.name:
+                        entry["name"] += tool_delta.function.name
+                    if tool_delta.function and tool_delta.function.arguments:
+                        entry["arguments"] += tool_delta.function.arguments
+
+            if pending_tool_calls:
+                logger.info(f"LLM wants to call {len(pending_tool_calls)} tool(s) (streaming)")
+                ordered_calls = [pending_tool_calls[i] for i in sorted(pending_tool_calls)]
+
+                # Callers must not cancel mid-tool (e.g. half-finished booking)
+                turn["tools_running"] = True
+                tool_calls_data = await self._run_tool_calls(
+                    ordered_calls, messages, session, content="".join(response_parts) or None
+                )
+
+                response_parts = []
+                local_reply = self._local_tool_reply(tool_calls_data, session)
+                if local_reply is not None:
+                    response_parts.append(local_reply)
+                    spoken = True
+                    yield local_reply
+                else:
+                    # Stream the follow-up response after tool execution
+                    final_stream = self._create_stream(
+                        route,
+                        messages=messages,
+                        tools=self._get_tools_definition(),
+                        tool_choice="none",
+                        temperature=0.7
+                    )
+                    completions += 1
+                    async for chunk in final_stream:
+                        if not chunk.choices:
+                            self._record_usage(getattr(chunk, "usage", None), session, route)
+                        elif chunk.choices[0].delta.content:
+                            response_parts.append(chunk.choices[0].delta.content)
+                            spoken = True
+                            yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            if spoken:
+                raise
+            # Nothing was said yet - answer with a canned reply instead of dead air
+            logger.error(f"LLM streaming error: {str(e)}")
+            turn["intent"], turn["response"] = self._fallback_reply(session, tool_calls_data)
+            turn["tool_calls"] = tool_calls_data or None
+            turn["completions"] = completions
+            yield turn["response"]
+            return
+
+        if session is not None:
+            session.llm_fallbacks = 0
+        ai_response = "".join(response_parts).strip() or "I'm here to help!"
+        turn["response"] = ai_response
+        turn["tool_calls"] = tool_calls_data or None
+        turn["intent"] = self._classify_intent(ai_response, user_message, tool_calls_data)
+        turn["completions"] = completions
+        if turn["intent"] in (ConversationIntent.INTERESTED, ConversationIntent.SCHEDULE_MEETING):
+            self._prefetch_availability(session)
+        get_llm_usage_stats().record_turn(completions)
+        if not tool_calls_data:
+            self.response_cache.put(
+                cache_key, session, turn["intent"], ai_response, (time.perf_counter() - turn_started) * 1000
+            )
+
+        logger.info(f"LLM streamed response ({turn['intent']}): {ai_response[:100]}...")
+
+    async def _create_turn_completion(self, route: Route, **kwargs):
+        """
+        chat.completions.create with the route's model and the structured turn reply format
+
+        Falls back to plain text (keyword intent classification) for the rest
+        of the process if the API rejects the response format.
+        """
+        kwargs.update(model=route.model, max_tokens=route.max_tokens)
+        if settings.structured_output_enabled and self._structured_output_supported:
+            try:
+                return await self._resilient_completion(route, response_format=TURN_RESPONSE_FORMAT, **kwargs)
+            except BadRequestError as e:
+                logger.warning(f"Structured output rejected, falling back to plain replies: {e}")
+                self._structured_output_supported = False
+        return await self._resilient_completion(route, **kwargs)
+
+    async def _resilient_completion(self, route: Route, **kwargs):
+        """
+        chat.completions.create under the live-call deadline, hedged after
+        the route's p95 latency and guarded by the circuit breaker
+
+        Raises:
+            LLMUnavailableError: If the circuit breaker is open
+            asyncio.TimeoutError: If no answer arrived within settings.llm_deadline_seconds
+        """
+        breaker = get_llm_circuit_breaker()
+        if not breaker.allow():
+            raise LLMUnavailableError("LLM circuit breaker is open")
+
+        governor = get_rate_governor()
+        estimated_tokens = estimate_request_tokens(kwargs["messages"], route.max_tokens)
+
+        async def attempt():
+            await governor.acquire(route.model, estimated_tokens)
+            started = time.perf_counter()
+            response = await self.client.chat.completions.create(**kwargs)
+            self.router.record_latency(route, (time.perf_counter() - started) * 1000)
+            governor.settle(route.model, estimated_tokens, getattr(response.usage, "total_tokens", None))
+            return response
+
+        try:
+            response = await hedged_call(
+                attempt, self._hedge_delay(route), settings.llm_deadline_seconds, get_hedge_stats()
+            )
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            if is_service_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()  # The API answered (e.g. 400)
+            raise
+        breaker.record_success()
+        return response
+
+    def _hedge_delay(self, route: Route) -> Optional[float]:
+        """Seconds to wait before hedging a completion (None = hedging disabled)"""
+        if not settings.llm_hedge_enabled:
+            return None
+        observed_ms = self.router.latency_quantile(
+            route, settings.llm_hedge_quantile, settings.llm_hedge_min_samples
+        )
+        delay_ms = observed_ms if observed_ms is not None else settings.llm_hedge_default_delay_ms
+        return max(delay_ms, settings.llm_hedge_min_delay_ms) / 1000
+
+    async def _create_stream(self, route: Route, **kwargs) -> AsyncIterator[Any]:
+        """
+        Streamed chat.completions.create with the route's model
+
+        The first chunk must arrive within settings.llm_deadline_seconds and
+        the outcome is reported to the circuit breaker. Yields the chunks and
+        records the route's time to first chunk.
+
+        Raises:
+            LLMUnavailableError: If the circuit breaker is open
+            asyncio.TimeoutError: If no chunk arrived within the deadline
+        """
+        breaker = get_llm_circuit_breaker()
+        if not breaker.allow():
+            raise LLMUnavailableError("LLM circuit breaker is open")
+
+        async def first_chunk():
+            # Streamed usage arrives last; the estimate stands
+            await get_rate_governor().acquire(
+                route.model, estimate_request_tokens(kwargs["messages"], route.max_tokens)
+            )
+            stream = await self.client.chat.completions.create(
+                model=route.model,
+                max_tokens=route.max_tokens,
+                stream=True,
+                extra_body=STREAM_USAGE_OPTIONS,
+                **kwargs
+            )
+            try:
+                return stream, await stream.__anext__()
+            except StopAsyncIteration:
+                return stream, None
+
+        started = time.perf_counter()
+        try:
+            stream, first = await asyncio.wait_for(first_chunk(), timeout=settings.llm_deadline_seconds)
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception as e:
+            if is_service_failure(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        breaker.record_success()
+        self.router.record_latency(route, (time.perf_counter() - started) * 1000, streamed=True)
+
+        if first is None:
+            return
+        yield first
+        async for chunk in stream:
+            yield chunk
+
+    def _fallback_reply(self, session: Optional[CallSession], tool_calls: Optional[List[Dict]] = None) -> Tuple[str, str]:
+        """
+        Canned reply for a turn that couldn't get a completion
+
+        Asks the lead to repeat themselves; after
+        settings.llm_max_fallback_replies such turns in a row, promises a
+        callback and ends the call. A booking made earlier in the turn is
+        confirmed instead.
+
+        Args:
+            session: Call session (language, fallback count)
+            tool_calls: Tools executed this turn before the failure
+
+        Returns:
+            Tuple of (intent, reply)
+        """
+        language = session.language if session else "en"
+        if _meeting_booked(tool_calls):
+            return ConversationIntent.MEETING_BOOKED, canned_reply(language, "booked")
+        if session is None:
+            return ConversationIntent.END_CALL, canned_reply(language, "callback")
+
+        session.llm_fallbacks += 1
+        if session.llm_fallbacks > settings.llm_max_fallback_replies:
+            logger.warning(f"LLM unavailable for {session.llm_fallbacks} turns on {session.call_sid} - ending call")
+            return ConversationIntent.END_CALL, canned_reply(language, "callback")
+        return ConversationIntent.NEEDS_INFO, canned_reply(language, "retry")
+
+    def _local_tool_reply(self, tool_calls: List[Dict], session: Optional[CallSession] = None) -> Optional[str]:
+        """
+        Render the spoken reply for a slot lookup without a second completion
+
+        Only used when settings.local_slot_reply_enabled is set and the turn
+        consisted of a successful check_calendar_availability with slots;
+        everything else needs free-form text from the model.
+
+        Args:
+            tool_calls: Tools executed this turn
+            session: Call session (language)
+
+        Returns:
+            Reply text, or None if the model should write the reply
+        """
+        if not settings.local_slot_reply_enabled or len(tool_calls) != 1:
+            return None
+
+        tool_call = tool_calls[0]
+        slots = tool_call["result"].get("available_slots") if tool_call["tool"] == "check_calendar_availability" else None
+        if not tool_call["result"].get("success") or not slots:
+            return None
+
+        language = session.language if session else "en"
+        template = SLOT_REPLY_TEMPLATES.get(language, SLOT_REPLY_TEMPLATES["en"])
+        # The tool result only has English display strings; the session keeps
+        # the same slots (in order) with their start times
+        if session is not None and len(session.offered_slots) == len(slots):
+            slots = [
+                _spoken_slot(datetime.fromisoformat(slot["start"]), template)
+                for slot in session.offered_slots
+            ]
+        if len(slots) == 1:
+            joined = slots[0]
+        else:
+            # Slot strings contain commas ("Tuesday, October 20 at ..."), so separate with ";"
+            joined = f"{'; '.join(slots[:-1])} {template['or']} {slots[-1]}"
+
+        logger.info("⚡ Speaking calendar slots from local template (no second completion)")
+        return template["reply"].format(slots=joined)
+
+    def _record_usage(
+        self,
+        usage: Any,
+        session: Optional[CallSession] = None,
+        route: Optional[Route] = None
+    ) -> None:
+        """
+        Record prompt/cached token counts for a completion
+
+        Args:
+            usage: `usage` block from the response (None if not reported)
+            session: Call session to attribute the tokens to
+            route: Route the completion used (per-route cost)
+        """
+        if usage is None:
+            return
+        if route is not None:
+            self.router.record_usage(route, usage)
+        prompt_tokens, cached_tokens, _ = get_llm_usage_stats().record(usage)
+        if session is not None:
+            session.llm_completions += 1
+            session.prompt_tokens += prompt_tokens
+            session.cached_prompt_tokens += cached_tokens
+        logger.debug(f"LLM usage: {prompt_tokens} prompt tokens ({cached_tokens} cached)")
 
     def _classify_intent(
         self,
@@ -715,26 +1682,11 @@ Their email address: NOT PROVIDED - you must ask for it before booking
         Returns:
             Intent classification
         """
-        ai_lower = ai_response.lower()
-        user_lower = user_message.lower()
-
         # Check if meeting was booked AND AI is explicitly ending the call
-        meeting_booked = False
-        if tool_calls:
-            for tool_call in tool_calls:
-                if tool_call["tool"] == "book_meeting" and tool_call["result"].get("success"):
-                    meeting_booked = True
-                    break
-
-        # Goodbye phrases that signal conversation is ending
-        goodbye_phrases = [
-            "goodbye", "bye", "talk to you then", "see you then",
-            "looking forward to our meeting", "have a great day",
-            "thank you for your time", "speak to you soon", "catch you later"
-        ]
+        meeting_booked = _meeting_booked(tool_calls)
 
         # Check if AI is saying goodbye
-        ai_saying_goodbye = any(phrase in ai_lower for phrase in goodbye_phrases)
+        ai_saying_goodbye = mentions("goodbye", ai_response)
 
         # If meeting was booked AND AI is saying goodbye, end the call
         if meeting_booked and ai_saying_goodbye:
@@ -746,7 +1698,7 @@ Their email address: NOT PROVIDED - you must ask for it before booking
             return ConversationIntent.SCHEDULE_MEETING
 
         # Check for explicit booking confirmation markers (without goodbye)
-        if any(word in ai_lower for word in ["confirmed", "calendar invite sent"]) and ai_saying_goodbye:
+        if mentions("booking_confirmed", ai_response) and ai_saying_goodbye:
             return ConversationIntent.MEETING_BOOKED
 
         # AI wants to end call without booking
@@ -754,8 +1706,7 @@ Their email address: NOT PROVIDED - you must ask for it before booking
             return ConversationIntent.END_CALL
 
         # User signals
-        not_interested = ["not interested", "no thanks", "not now", "busy", "don't call", "remove me"]
-        if any(keyword in user_lower for keyword in not_interested):
+        if mentions("not_interested", user_message):
             return ConversationIntent.NOT_INTERESTED
 
         # Scheduling signals
@@ -763,28 +1714,71 @@ Their email address: NOT PROVIDED - you must ask for it before booking
             return ConversationIntent.SCHEDULE_MEETING
 
         # Interested signals
-        interested = ["yes", "sure", "okay", "interested", "tell me more"]
-        if any(keyword in user_lower for keyword in interested):
+        if mentions("interested", user_message):
             return ConversationIntent.INTERESTED
 
-        # Questions = needs more info
-        if "?" in user_message:
-            return ConversationIntent.NEEDS_INFO
-
+        # Questions and everything else = needs more info
         return ConversationIntent.NEEDS_INFO
 
+    def _parse_turn_reply(
+        self,
+        content: Optional[str],
+        tool_calls: Optional[List[Dict]] = None
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Parse a structured (JSON schema) turn reply
+
+        The model's intent is reconciled with what actually happened:
+        MEETING_BOOKED needs a successful book_meeting this turn, and the
+        end_call flag decides between ending and continuing.
+
+        Args:
+            content: Message content from the completion
+            tool_calls: Tools executed this turn
+
+        Returns:
+            Tuple of (intent, reply), or None if content isn't a valid reply
+        """
+        try:
+            data = json.loads(content or "")
+            reply = data["reply"].strip()
+            intent = data["intent"]
+            end_call = bool(data["end_call"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+        if not reply or intent not in TURN_INTENTS:
+            return None
+
+        if intent == ConversationIntent.MEETING_BOOKED and not _meeting_booked(tool_calls):
+            intent = ConversationIntent.END_CALL if end_call else ConversationIntent.SCHEDULE_MEETING
+        elif not end_call and intent in (ConversationIntent.MEETING_BOOKED, ConversationIntent.END_CALL):
+            # Booked (or wrapping up) but still talking - keep the call open
+            intent = ConversationIntent.SCHEDULE_MEETING if intent == ConversationIntent.MEETING_BOOKED else ConversationIntent.NEEDS_INFO
+        elif end_call and intent in (
+            ConversationIntent.INTERESTED, ConversationIntent.SCHEDULE_MEETING, ConversationIntent.NEEDS_INFO
+        ):
+            intent = ConversationIntent.END_CALL
+
+        return intent, reply
+
     async def summarize_call(
         self,
-        transcript: str
+        transcript: str,
+        defer_if_busy: bool = False
     ) -> str:
         """
         Generate a summary of the call
 
         Args:
             transcript: Full conversation transcript as text
+            defer_if_busy: Raise RateBudgetExceeded instead of eating into the
+                OpenAI budget reserved for live calls (the caller retries later)
 
         Returns:
             Summary text
+
+        Raises:
+            RateBudgetExceeded: If defer_if_busy and the shared budget is tight
         """
         try:
             messages = [
@@ -798,15 +1792,31 @@ Their email address: NOT PROVIDED - you must ask for it before booking
                 }
             ]
 
+            route = self.router.route("summary")
+            governor = get_rate_governor()
+            estimated_tokens = estimate_request_tokens(messages, route.max_tokens)
+            if defer_if_busy:
+                retry_after = governor.reserve_background(route.model, estimated_tokens)
+                if retry_after:
+                    raise RateBudgetExceeded(retry_after)
+            else:
+                governor.charge(route.model, estimated_tokens)
+
+            started = time.perf_counter()
             response = await self.client.chat.completions.create(
-                model=self.model,
+                model=route.model,
                 messages=messages,
                 temperature=0.5,
-                max_tokens=150
+                max_tokens=route.max_tokens
             )
+            self.router.record_latency(route, (time.perf_counter() - started) * 1000)
+            self.router.record_usage(route, response.usage)
+            governor.settle(route.model, estimated_tokens, getattr(response.usage, "total_tokens", None))
 
             return response.choices[0].message.content.strip()
 
+        except RateBudgetExceeded:
+            raise
         except Exception as e:
             logger.error(f"Summarization error: {str(e)}")
             return "Call completed."
@@ -0,0 +1,365 @@
+"""
+Per-turn model routing for LLMService
+
+Each completion is sent to a named route that picks the model and
+max_tokens. The route is chosen from the conversation state:
+
+- recovery: the last booking attempt failed (bad datetime, calendar error)
+- tool: a calendar tool is likely this turn (the lead is answering a slot
+  offer, or the lead or the last AI line talks about scheduling)
+- small_talk: short utterances and objections
+- conversation: everything else
+- summary / history_summary: end-of-call summary and running history summary
+
+Routes are stored as JSON in the `llm_model_routes` setting, merged over
+DEFAULT_ROUTES, e.g.:
+
+    {"tool": {"model": "gpt-4o", "max_tokens": 250},
+     "recovery": {"model": "gpt-4o"}}
+
+Per-route latency and token cost are tracked for the internal metrics API.
+"""
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from backend.config import get_settings
+from backend.database import SessionLocal
+from backend.models.setting import Setting
+from backend.services.cache_service import get_cache_service
+from backend.services.call_session_store import CallSession
+from backend.utils.intent_keywords import mentions
+from backend.utils.latency_metrics import LatencyHistogram
+from backend.utils.llm_usage import parse_usage
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+ROUTES_SETTING_KEY = "llm_model_routes"
+ROUTES_CACHE_KEY = f"settings:{ROUTES_SETTING_KEY}"
+
+DEFAULT_ROUTES: Dict[str, Dict[str, Any]] = {
+    "small_talk": {"model": "gpt-4o-mini", "max_tokens": 200},
+    "conversation": {"model": "gpt-4o-mini", "max_tokens": 200},
+    "tool": {"model": "gpt-4o-mini", "max_tokens": 200},
+    "recovery": {"model": "gpt-4o-mini", "max_tokens": 250},
+    "summary": {"model": "gpt-4o-mini", "max_tokens": 150},
+    "history_summary": {"model": "gpt-4o-mini", "max_tokens": 200},
+}
+
+# USD per 1M tokens: (input, cached input, output). Routes may override
+# with input_cost_per_mtok / cached_input_cost_per_mtok / output_cost_per_mtok.
+MODEL_PRICES: Dict[str, tuple] = {
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4.1-nano": (0.10, 0.025, 0.40),
+    "gpt-4.1-mini": (0.40, 0.10, 1.60),
+    "gpt-4.1": (2.00, 0.50, 8.00),
+}
+
+
+@dataclass(frozen=True)
+class Route:
+    """Model settings for one kind of completion"""
+    name: str
+    model: str
+    max_tokens: int
+    input_cost_per_mtok: float = 0.0
+    cached_input_cost_per_mtok: float = 0.0
+    output_cost_per_mtok: float = 0.0
+
+    def cost(self, prompt_tokens: int, cached_tokens: int, completion_tokens: int) -> float:
+        """Cost of one completion in USD"""
+        return (
+            (prompt_tokens - cached_tokens) * self.input_cost_per_mtok
+            + cached_tokens * self.cached_input_cost_per_mtok
+            + completion_tokens * self.output_cost_per_mtok
+        ) / 1_000_000
+
+
+def _build_route(name: str, config: Dict[str, Any]) -> Route:
+    """Create a Route from its config dict (prices default to MODEL_PRICES)"""
+    model = config["model"]
+    max_tokens = int(config["max_tokens"])
+    if not isinstance(model, str) or not model or max_tokens <= 0:
+        raise ValueError(f"invalid model/max_tokens: {model!r}/{max_tokens!r}")
+    input_price, cached_price, output_price = MODEL_PRICES.get(model, (0.0, 0.0, 0.0))
+    return Route(
+        name=name,
+        model=model,
+        max_tokens=max_tokens,
+        input_cost_per_mtok=float(config.get("input_cost_per_mtok", input_price)),
+        cached_input_cost_per_mtok=float(config.get("cached_input_cost_per_mtok", cached_price)),
+        output_cost_per_mtok=float(config.get("output_cost_per_mtok", output_price)),
+    )
+
+
+def validate_routes(raw: str) -> Dict[str, Route]:
+    """
+    Strictly validate a routes setting value (for the settings API)
+
+    Args:
+        raw: JSON object of route name -> partial route config
+
+    Returns:
+        Resulting routes
+
+    Raises:
+        ValueError: If the JSON is invalid, a route is unknown or a config is invalid
+    """
+    overrides = json.loads(raw)
+    if not isinstance(overrides, dict):
+        raise ValueError("Model routes must be a JSON object")
+    unknown = set(overrides) - set(DEFAULT_ROUTES)
+    if unknown:
+        raise ValueError(f"Unknown model route(s): {', '.join(sorted(unknown))}")
+    routes = {}
+    for name, default in DEFAULT_ROUTES.items():
+        override = overrides.get(name) or {}
+        if not isinstance(override, dict):
+            raise ValueError(f"Route '{name}' must be a JSON object")
+        try:
+            routes[name] = _build_route(name, {**default, **override})
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid model route '{name}': {e}")
+    return routes
+
+
+def parse_routes(raw: Optional[str]) -> Dict[str, Route]:
+    """
+    Build routes from the setting's JSON, merged over DEFAULT_ROUTES
+
+    Unknown route names and invalid entries are logged and ignored.
+
+    Args:
+        raw: JSON object of route name -> partial route config (None = defaults)
+
+    Returns:
+        Dict of route name -> Route
+    """
+    overrides: Dict[str, Any] = {}
+    if raw:
+        try:
+            overrides = json.loads(raw)
+            if not isinstance(overrides, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as e:
+            logger.warning(f"Ignoring invalid {ROUTES_SETTING_KEY} setting: {e}")
+            overrides = {}
+
+    routes = {}
+    for name, default in DEFAULT_ROUTES.items():
+        override = overrides.get(name) or {}
+        try:
+            routes[name] = _build_route(name, {**default, **override})
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring invalid model route '{name}': {e}")
+            routes[name] = _build_route(name, default)
+
+    for name in set(overrides) - set(DEFAULT_ROUTES):
+        logger.warning(f"Ignoring unknown model route '{name}'")
+    return routes
+
+
+class RouteStats:
+    """Completions, latency and cost for one route"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency = LatencyHistogram()  # Whole completion (non-streamed)
+        self.first_token = LatencyHistogram()  # Time to first chunk (streamed)
+        self.completions = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+
+    def record_usage(self, route: Route, usage: Any) -> None:
+        prompt_tokens, cached_tokens, completion_tokens = parse_usage(usage)
+        with self._lock:
+            self.completions += 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_prompt_tokens += cached_tokens
+            self.completion_tokens += completion_tokens
+            self.cost_usd += route.cost(prompt_tokens, cached_tokens, completion_tokens)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "completions": self.completions,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prompt_tokens": self.cached_prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cost_usd": round(self.cost_usd, 6),
+                "mean_cost_usd": round(self.cost_usd / self.completions, 8) if self.completions else None,
+                "latency": self.latency.summary(),
+                "first_token_latency": self.first_token.summary(),
+            }
+
+
+class ModelRouter:
+    """
+    Chooses the route for each completion and keeps per-route stats.
+
+    Routes are re-read from the setting every
+    settings.system_prompt_refresh_seconds (like the system prompt), or
+    immediately via reload().
+    """
+
+    def __init__(self):
+        self._routes = self._load_routes()
+        self._loaded_at = time.monotonic()
+        self._stats: Dict[str, RouteStats] = {name: RouteStats() for name in DEFAULT_ROUTES}
+        self.started_at = time.time()
+
+    @property
+    def routes(self) -> Dict[str, Route]:
+        """Current routes (refreshed periodically)"""
+        if time.monotonic() - self._loaded_at > settings.system_prompt_refresh_seconds:
+            self.reload()
+        return self._routes
+
+    def reload(self) -> None:
+        """Reload routes from cache/database"""
+        self._routes = self._load_routes()
+        self._loaded_at = time.monotonic()
+
+    def _load_routes(self) -> Dict[str, Route]:
+        """
+        Load routes from the settings table (with Redis cache)
+
+        Returns:
+            Dict of route name -> Route (defaults if the setting is missing)
+        """
+        cache = get_cache_service()
+        raw = cache.get(ROUTES_CACHE_KEY)
+        if raw is None:
+            try:
+                db = SessionLocal()
+                try:
+                    setting = db.query(Setting).filter(Setting.key == ROUTES_SETTING_KEY).first()
+                finally:
+                    db.close()
+                # Cache the absence too ("{}"), so workers don't query on every refresh
+                raw = setting.value if setting and setting.value else "{}"
+                cache.set(ROUTES_CACHE_KEY, raw, ttl=300)
+            except Exception as e:
+                logger.warning(f"Failed to load model routes from database: {e}")
+                raw = None
+        return parse_routes(raw)
+
+    def route(self, name: str) -> Route:
+        """
+        Get a route by name
+
+        Args:
+            name: Route name (one of DEFAULT_ROUTES)
+
+        Returns:
+            Route
+        """
+        return self.routes[name]
+
+    def choose(
+        self,
+        user_message: str,
+        conversation_history: List[Dict[str, Any]],
+        session: Optional[CallSession] = None
+    ) -> Route:
+        """
+        Pick the route for a conversational turn
+
+        Args:
+            user_message: Caller's utterance
+            conversation_history: Conversation before this utterance
+            session: Call session (offered slots, booking failures)
+
+        Returns:
+            Route for the turn's completions
+        """
+        if not settings.model_routing_enabled:
+            return self.route("conversation")
+
+        if session is not None and session.booking_failed:
+            return self.route("recovery")
+
+        last_ai = next(
+            (m.get("content") or "" for m in reversed(conversation_history) if m.get("role") == "assistant"),
+            ""
+        )
+        # Offered slots only matter on the turn that answers the offer
+        answering_offer = (
+            session is not None
+            and bool(session.offered_slots)
+            and len(conversation_history) <= session.offered_at + 1
+        )
+        if (
+            answering_offer
+            or mentions("scheduling", user_message)
+            or mentions("scheduling", last_ai)
+        ):
+            return self.route("tool")
+
+        if len(user_message.split()) <= settings.small_talk_max_words or mentions("not_interested", user_message):
+            return self.route("small_talk")
+
+        return self.route("conversation")
+
+    def record_latency(self, route: Route, latency_ms: float, streamed: bool = False) -> None:
+        """
+        Record a completion's latency
+
+        Args:
+            route: Route the completion used
+            latency_ms: Whole completion, or time to first chunk if streamed
+            streamed: Whether latency_ms is a time-to-first-chunk
+        """
+        stats = self._stats[route.name]
+        (stats.first_token if streamed else stats.latency).record(latency_ms)
+
+    def latency_quantile(self, route: Route, quantile: float, min_samples: int) -> Optional[float]:
+        """
+        Observed whole-completion latency of a route
+
+        Args:
+            route: Route
+            quantile: Quantile in [0, 1]
+            min_samples: Minimum recorded completions for a meaningful value
+
+        Returns:
+            Latency in ms, or None if fewer than min_samples were recorded
+        """
+        histogram = self._stats[route.name].latency
+        if histogram.count < min_samples:
+            return None
+        return histogram.percentiles([quantile])[0]
+
+    def record_usage(self, route: Route, usage: Any) -> None:
+        """
+        Record a completion's tokens and cost
+
+        Args:
+            route: Route the completion used
+            usage: `usage` block from the response
+        """
+        if usage is not None:
+            self._stats[route.name].record_usage(route, usage)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-route configuration and stats"""
+        return {
+            "window_seconds": round(time.time() - self.started_at, 1),
+            "routing_enabled": settings.model_routing_enabled,
+            "routes": {
+                name: {"model": route.model, "max_tokens": route.max_tokens, **self._stats[name].snapshot()}
+                for name, route in self.routes.items()
+            },
+        }
+
+    def reset_stats(self) -> None:
+        """Start a new measurement window"""
+        self._stats = {name: RouteStats() for name in DEFAULT_ROUTES}
+        self.started_at = time.time()
@@ -0,0 +1,137 @@
+"""
+Process-wide OpenAI client
+
+One AsyncOpenAI client (and one httpx connection pool) per process, shared
+by every LLMService - the webhook routes and the Celery CallTask alike - so
+turns reuse warm keep-alive connections instead of paying a new TCP + TLS
+handshake.
+
+Connection reuse is measured with httpcore's trace extension: every request
+and every newly opened connection is counted.
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from backend.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class ConnectionStats:
+    """Counters fed by httpcore trace events"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+
+    async def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback (request.extensions["trace"])"""
+        if event_name.endswith("send_request_headers.started"):
+            with self._lock:
+                self.requests += 1
+        elif event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            with self._lock:
+                self.tls_handshakes += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            reused = max(0, self.requests - self.new_connections)
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "tls_handshakes": self.tls_handshakes,
+                "reused_connections": reused,
+                "reuse_ratio": round(reused / self.requests, 4) if self.requests else None,
+            }
+
+
+class _TracingTransport(httpx.AsyncHTTPTransport):
+    """AsyncHTTPTransport that reports connection events to ConnectionStats"""
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        super().__init__(**kwargs)
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions = {**request.extensions, "trace": self._stats.trace}
+        return await super().handle_async_request(request)
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+# Global client state (recreated after fork - Celery prefork workers)
+_openai_client: Optional[AsyncOpenAI] = None
+_client_pid: Optional[int] = None
+_connection_stats = ConnectionStats()
+_lock = threading.Lock()
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Get or create the process-wide AsyncOpenAI client.
+
+    Returns:
+        AsyncOpenAI instance with a tuned, shared connection pool
+    """
+    global _openai_client, _client_pid
+    if _openai_client is not None and _client_pid == os.getpid():
+        return _openai_client
+
+    with _lock:
+        if _openai_client is not None and _client_pid == os.getpid():
+            return _openai_client
+
+        http2 = settings.openai_http2
+        if http2 and not _http2_available():
+            logger.warning("openai_http2 is enabled but the 'h2' package is not installed - using HTTP/1.1")
+            http2 = False
+
+        limits = httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive_connections,
+            keepalive_expiry=settings.openai_keepalive_expiry_seconds
+        )
+        http_client = httpx.AsyncClient(
+            transport=_TracingTransport(_connection_stats, limits=limits, http2=http2),
+            limits=limits,
+            timeout=httpx.Timeout(settings.openai_timeout_seconds, connect=5.0),
+        )
+        _openai_client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
+        _client_pid = os.getpid()
+        logger.info(f"✅ Shared OpenAI client created (pid {_client_pid}, http2={http2})")
+        return _openai_client
+
+
+async def close_openai_client() -> None:
+    """Close the shared client's connection pool (call on shutdown)"""
+    global _openai_client
+    client, _openai_client = _openai_client, None
+    if client is not None and _client_pid == os.getpid():
+        await client.close()
+
+
+def get_openai_connection_stats() -> Dict[str, Any]:
+    """
+    Connection reuse counters for this process.
+
+    Returns:
+        Dict with requests, new_connections, tls_handshakes, reused_connections, reuse_ratio
+    """
+    return {"pid": os.getpid(), **_connection_stats.snapshot()}
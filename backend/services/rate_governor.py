@@ -0,0 +1,294 @@
+"""
+Cross-worker OpenAI request/token budget
+
+The FastAPI workers (live calls) and Celery (finalize_call summaries) share
+one OpenAI account. Without coordination, a burst of background work spends
+the per-minute limits and the resulting 429s land on live calls.
+
+The governor keeps two token buckets per model in Redis - requests per
+minute and tokens per minute - refilled continuously and updated atomically
+by a Lua script, so every process draws from the same budget:
+
+- live turns take budget whenever it is available; if it isn't, they wait
+  briefly (settings.openai_live_max_wait_ms) and then go anyway, pushing the
+  bucket negative so background work backs off
+- background work may only take budget while more than
+  settings.openai_background_reserve of both buckets would remain, and is
+  otherwise deferred (Celery retries it later)
+
+Token costs are estimated before the request and corrected once the
+response's usage is known. Falls back to a per-process bucket when Redis is
+unavailable.
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import get_settings
+from backend.services.cache_service import get_cache_service
+from backend.utils.llm_usage import estimate_tokens
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "openai_budget:"
+BUCKET_TTL_MS = 120000  # Idle buckets expire (they'd be full again anyway)
+
+# KEYS[1]: bucket hash {r, t, ts}
+# ARGV: rpm, tpm, requests, tokens, floor fraction, force (1/0)
+# Returns {granted, wait_ms, requests_left, tokens_left}
+TAKE_SCRIPT = """
+local rpm = tonumber(ARGV[1])
+local tpm = tonumber(ARGV[2])
+local req = tonumber(ARGV[3])
+local tok = tonumber(ARGV[4])
+local floor = tonumber(ARGV[5])
+local force = ARGV[6] == "1"
+
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+
+local state = redis.call("HMGET", KEYS[1], "r", "t", "ts")
+local r = tonumber(state[1]) or rpm
+local t = tonumber(state[2]) or tpm
+local elapsed = math.max(0, now - (tonumber(state[3]) or now))
+r = math.min(rpm, r + elapsed * rpm / 60000)
+t = math.min(tpm, t + elapsed * tpm / 60000)
+
+local granted = 0
+local wait = 0
+if force or (r - req >= floor * rpm and t - tok >= floor * tpm) then
+    r = r - req
+    t = t - tok
+    granted = 1
+else
+    local wait_r = math.max(0, floor * rpm + req - r) * 60000 / rpm
+    local wait_t = math.max(0, floor * tpm + tok - t) * 60000 / tpm
+    wait = math.ceil(math.max(wait_r, wait_t))
+end
+
+redis.call("HSET", KEYS[1], "r", tostring(r), "t", tostring(t), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], %d)
+return {granted, wait, math.floor(r), math.floor(t)}
+""" % BUCKET_TTL_MS
+
+
+class RateBudgetExceeded(Exception):
+    """Background work was deferred because the shared OpenAI budget is tight"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"OpenAI budget tight, retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def estimate_request_tokens(messages: List[Dict[str, Any]], max_tokens: int) -> int:
+    """
+    Tokens a completion will count against the TPM limit (estimate)
+
+    Args:
+        messages: Request messages
+        max_tokens: Completion token cap
+
+    Returns:
+        Estimated prompt tokens plus max_tokens
+    """
+    return sum(estimate_tokens(str(m.get("content") or "")) for m in messages) + max_tokens
+
+
+class RateGovernor:
+    """
+    Shared request/token buckets per model.
+
+    Attributes:
+        counters: live_granted, live_waited, live_overdrafts, background_granted,
+            background_deferred, live_wait_ms
+    """
+
+    def __init__(self, rpm: int = None, tpm: int = None, background_reserve: float = None):
+        self.cache = get_cache_service()
+        self.rpm = rpm or settings.openai_rpm_limit
+        self.tpm = tpm or settings.openai_tpm_limit
+        self.background_reserve = (
+            background_reserve if background_reserve is not None else settings.openai_background_reserve
+        )
+        self._script = None
+        self._lock = threading.Lock()
+        # Per-process buckets when Redis is unavailable: model -> [requests, tokens, monotonic ts]
+        self._local: Dict[str, List[float]] = {}
+        self.levels: Dict[str, Dict[str, int]] = {}
+        self.counters: Dict[str, float] = {
+            "live_granted": 0,
+            "live_waited": 0,
+            "live_overdrafts": 0,
+            "background_granted": 0,
+            "background_deferred": 0,
+            "live_wait_ms": 0.0,
+        }
+
+    @property
+    def redis(self):
+        return self.cache.redis_client
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def _take_local(self, model: str, requests: int, tokens: int, floor: float, force: bool) -> Tuple[bool, int, float, float]:
+        with self._lock:
+            now = time.monotonic()
+            r, t, ts = self._local.get(model, [self.rpm, self.tpm, now])
+            elapsed_ms = (now - ts) * 1000
+            r = min(self.rpm, r + elapsed_ms * self.rpm / 60000)
+            t = min(self.tpm, t + elapsed_ms * self.tpm / 60000)
+            granted, wait_ms = False, 0
+            if force or (r - requests >= floor * self.rpm and t - tokens >= floor * self.tpm):
+                r -= requests
+                t -= tokens
+                granted = True
+            else:
+                wait_r = max(0, floor * self.rpm + requests - r) * 60000 / self.rpm
+                wait_t = max(0, floor * self.tpm + tokens - t) * 60000 / self.tpm
+                wait_ms = int(max(wait_r, wait_t)) + 1
+            self._local[model] = [r, t, now]
+            return granted, wait_ms, r, t
+
+    def _take(self, model: str, tokens: int, floor: float = 0.0, force: bool = False, requests: int = 1) -> Tuple[bool, int]:
+        """
+        Take budget from the model's buckets
+
+        Args:
+            model: Model name (limits are per model)
+            tokens: Tokens to take (negative refunds)
+            floor: Fraction of each bucket that must remain afterwards
+            force: Take even if it drives the buckets negative
+            requests: Requests to take
+
+        Returns:
+            Tuple of (granted, ms until the request would fit)
+        """
+        # A request can never need more than a full bucket
+        tokens = min(tokens, int(self.tpm * (1 - floor)))
+        if self.redis:
+            try:
+                if self._script is None:
+                    self._script = self.redis.register_script(TAKE_SCRIPT)
+                granted, wait_ms, r, t = self._script(
+                    keys=[f"{KEY_PREFIX}{model}"],
+                    args=[self.rpm, self.tpm, requests, tokens, floor, "1" if force else "0"]
+                )
+                self.levels[model] = {"requests": int(r), "tokens": int(t)}
+                return bool(granted), int(wait_ms)
+            except Exception as e:
+                logger.error(f"OpenAI budget script error for '{model}': {e}")
+        granted, wait_ms, r, t = self._take_local(model, requests, tokens, floor, force)
+        self.levels[model] = {"requests": int(r), "tokens": int(t)}
+        return granted, wait_ms
+
+    async def acquire(self, model: str, tokens: int) -> None:
+        """
+        Take budget for a live-call completion
+
+        Waits at most settings.openai_live_max_wait_ms for budget, then
+        proceeds anyway (a late reply beats no reply).
+
+        Args:
+            model: Model name
+            tokens: Estimated tokens (see estimate_request_tokens)
+        """
+        if not settings.openai_governor_enabled:
+            return
+        started = time.monotonic()
+        deadline = started + settings.openai_live_max_wait_ms / 1000
+        waited = False
+        while True:
+            granted, wait_ms = self._take(model, tokens)
+            if granted:
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._take(model, tokens, force=True)
+                self._count("live_overdrafts")
+                logger.warning(f"⚠️ OpenAI budget exhausted for {model} - live turn proceeding anyway")
+                break
+            waited = True
+            await asyncio.sleep(min(wait_ms / 1000, remaining))
+
+        self._count("live_granted")
+        if waited:
+            self._count("live_waited")
+            self._count("live_wait_ms", (time.monotonic() - started) * 1000)
+
+    def reserve_background(self, model: str, tokens: int) -> float:
+        """
+        Try to take budget for background work (summaries)
+
+        Only succeeds while the buckets stay above the live-call reserve.
+
+        Args:
+            model: Model name
+            tokens: Estimated tokens
+
+        Returns:
+            0.0 if granted, otherwise seconds until it would fit
+        """
+        if not settings.openai_governor_enabled:
+            return 0.0
+        granted, wait_ms = self._take(model, tokens, floor=self.background_reserve)
+        if granted:
+            self._count("background_granted")
+            return 0.0
+        self._count("background_deferred")
+        return max(wait_ms / 1000, 0.001)
+
+    def charge(self, model: str, tokens: int) -> None:
+        """Take budget unconditionally (work that can't be deferred any longer)"""
+        if settings.openai_governor_enabled:
+            self._take(model, tokens, force=True)
+
+    def settle(self, model: str, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """
+        Correct the token bucket once a completion's usage is known
+
+        Args:
+            model: Model name
+            estimated_tokens: Tokens taken up front
+            actual_tokens: usage.total_tokens (None = keep the estimate)
+        """
+        if not settings.openai_governor_enabled or not actual_tokens:
+            return
+        difference = estimated_tokens - actual_tokens
+        if difference:
+            self._take(model, -difference, force=True, requests=0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Limits, last seen bucket levels and counters"""
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "enabled": settings.openai_governor_enabled,
+            "shared": self.redis is not None,
+            "rpm_limit": self.rpm,
+            "tpm_limit": self.tpm,
+            "background_reserve": self.background_reserve,
+            "levels": dict(self.levels),
+            **{name: round(value, 1) for name, value in counters.items()},
+        }
+
+
+# Global governor instance
+_rate_governor = None
+
+
+def get_rate_governor() -> RateGovernor:
+    """
+    Get or create the process-wide OpenAI budget governor.
+
+    Returns:
+        RateGovernor instance
+    """
+    global _rate_governor
+    if _rate_governor is None:
+        _rate_governor = RateGovernor()
+    return _rate_governor
@@ -0,0 +1,191 @@
+"""
+Response cache for deterministic conversation turns
+
+Short, stock exchanges ("who is this?", "how did you get my number?",
+"send me an email") get the same answer every time. The cache keys a reply
+by the normalized user utterance, the conversation stage (the AI line being
+answered, booking state, whether an email is on file, the call language and
+the running history summary) and the prompt version, and serves it without
+an LLM round trip.
+
+Lead name and email are replaced with placeholders before storing, so one
+entry serves every lead. Entries expire after a TTL and the cache is LRU
+bounded; a prompt change produces new keys and clears the cache.
+"""
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import get_settings
+from backend.services.call_session_store import CallSession
+
+settings = get_settings()
+
+# Private-use placeholders for lead details in stored replies
+NAME_TOKEN = "\ue001"
+EMAIL_TOKEN = "\ue002"
+
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+_WHITESPACE = re.compile(r"\s+")
+_FILLERS = re.compile(r"\b(?:um+|uh+|er+|hmm+|well|so|oh)\b")
+
+
+def _templatize(text: str, session: CallSession) -> str:
+    """Replace the lead's name and email with placeholders"""
+    if session.lead_email:
+        text = re.sub(re.escape(session.lead_email), EMAIL_TOKEN, text, flags=re.IGNORECASE)
+    if session.lead_name and session.lead_name != "there":
+        for name in sorted({session.lead_name, session.lead_name.split()[0]}, key=len, reverse=True):
+            if len(name) > 1:
+                text = re.sub(rf"\b{re.escape(name)}\b", NAME_TOKEN, text, flags=re.IGNORECASE)
+    return text
+
+
+def _personalize(text: str, session: CallSession) -> str:
+    """Fill placeholders back in for the current lead"""
+    first_name = session.lead_name.split()[0] if session.lead_name else "there"
+    return text.replace(NAME_TOKEN, first_name).replace(EMAIL_TOKEN, session.lead_email)
+
+
+def normalize_utterance(text: str) -> str:
+    """Lowercase, drop punctuation and filler words, collapse whitespace"""
+    text = _PUNCTUATION.sub(" ", text.lower())
+    text = _FILLERS.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class ResponseCache:
+    """
+    In-process TTL + LRU cache of (intent, reply) per conversation key.
+
+    Attributes:
+        hits / misses: Lookup counters since the last reset
+        latency_saved_ms: Sum of the original LLM latency of every hit
+    """
+
+    def __init__(self, max_entries: int = None, ttl: int = None):
+        self.max_entries = max_entries or settings.response_cache_max_entries
+        self.ttl = ttl or settings.response_cache_ttl_seconds
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved_ms = 0.0
+
+    def make_key(
+        self,
+        user_message: str,
+        conversation_history: List[Dict[str, Any]],
+        session: Optional[CallSession],
+        prompt_version: str
+    ) -> Optional[str]:
+        """
+        Build the cache key for a turn
+
+        Args:
+            user_message: Caller's utterance
+            conversation_history: Conversation before this utterance
+            session: Call session
+            prompt_version: Identifies the system prompt/model in use
+
+        Returns:
+            Key, or None if the turn isn't cacheable
+        """
+        if not settings.response_cache_enabled or session is None:
+            return None
+
+        utterance = normalize_utterance(_templatize(user_message, session))
+        if not utterance or len(utterance.split()) > settings.response_cache_max_words:
+            return None
+
+        # Stage: the AI line being answered, booking state and everything else
+        # the prompt carries per call (email on file, language, history summary)
+        last_ai = next(
+            (m.get("content") or "" for m in reversed(conversation_history) if m.get("role") == "assistant"),
+            ""
+        )
+        stage = "|".join([
+            normalize_utterance(_templatize(last_ai, session)),
+            "offered" if session.offered_slots else "",
+            session.outcome or "",
+            "email" if session.lead_email else "",
+            session.language,
+            str(session.summarized_count),
+            hashlib.sha256(session.summary.encode()).hexdigest()[:16] if session.summary else "",
+        ])
+
+        digest = hashlib.sha256(f"{prompt_version}\0{stage}\0{utterance}".encode()).hexdigest()
+        return digest
+
+    def get(self, key: Optional[str], session: CallSession) -> Optional[Tuple[str, str]]:
+        """
+        Look up a cached reply
+
+        Args:
+            key: Key from make_key() (None = not cacheable)
+            session: Call session (to personalize the reply)
+
+        Returns:
+            Tuple of (intent, reply) or None
+        """
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["expires_at"] < time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.latency_saved_ms += entry["latency_ms"]
+
+        return entry["intent"], _personalize(entry["reply"], session)
+
+    def put(self, key: Optional[str], session: CallSession, intent: str, reply: str, latency_ms: float) -> None:
+        """
+        Store a reply
+
+        Args:
+            key: Key from make_key()
+            session: Call session (to strip lead details)
+            intent: Turn intent
+            reply: Spoken reply
+            latency_ms: Time the LLM took to produce it
+        """
+        if key is None:
+            return
+
+        with self._lock:
+            self._entries[key] = {
+                "intent": intent,
+                "reply": _templatize(reply, session),
+                "latency_ms": latency_ms,
+                "expires_at": time.monotonic() + self.ttl,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries (e.g. after the system prompt changed)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate and latency saved"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "latency_saved_ms": round(self.latency_saved_ms, 1),
+            }
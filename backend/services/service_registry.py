@@ -0,0 +1,172 @@
+"""
+Process-wide service registry for the webhook hot path.
+
+Building CalendarService (token load + discovery build), ZoomService and
+LLMService (OpenAI client + system prompt lookup) on every Twilio webhook is
+pure setup cost. The registry builds them once per process and rebuilds a
+service only when its credentials or settings change.
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from backend.config import get_settings
+from backend.services.calendar_service import CalendarService
+from backend.services.llm_service import LLMService
+from backend.services.openai_client import close_openai_client
+from backend.services.zoom_service import ZoomService
+
+logger = logging.getLogger(__name__)
+
+# Same location CalendarService checks for production credentials
+SERVICE_ACCOUNT_FILE = Path('backend/service-account.json')
+
+
+def _file_mtime(path: Path) -> Optional[float]:
+    """Return file modification time, or None if the file does not exist"""
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class ServiceRegistry:
+    """
+    Holds one CalendarService, ZoomService and LLMService per process.
+
+    Each service is tagged with a fingerprint of the credentials it was built
+    from (credential file mtimes, Zoom keys). Accessing a service compares the
+    current fingerprint and rebuilds it only when something changed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self._calendar: Optional[CalendarService] = None
+        self._calendar_fingerprint: Optional[Tuple] = None
+
+        self._zoom: Optional[ZoomService] = None
+        self._zoom_fingerprint: Optional[Tuple] = None
+
+        self._llm: Optional[LLMService] = None
+
+    def _get_calendar_fingerprint(self) -> Tuple:
+        """Fingerprint of Google Calendar credentials on disk"""
+        settings = get_settings()
+        return (
+            _file_mtime(SERVICE_ACCOUNT_FILE),
+            _file_mtime(Path(settings.google_calendar_token_file)),
+            settings.google_calendar_id,
+            settings.google_delegated_user_email,
+        )
+
+    def _get_zoom_fingerprint(self) -> Tuple:
+        """Fingerprint of Zoom credentials"""
+        settings = get_settings()
+        return (settings.zoom_account_id, settings.zoom_client_id, settings.zoom_client_secret)
+
+    @property
+    def calendar(self) -> CalendarService:
+        """Shared CalendarService, rebuilt when credential files change"""
+        fingerprint = self._get_calendar_fingerprint()
+        if self._calendar is None or fingerprint != self._calendar_fingerprint:
+            with self._lock:
+                if self._calendar is None or fingerprint != self._calendar_fingerprint:
+                    if self._calendar is not None:
+                        logger.info("Calendar credentials changed - rebuilding CalendarService")
+                    self._calendar = CalendarService()
+                    # Re-read after build: OAuth refresh may rewrite the token file
+                    self._calendar_fingerprint = self._get_calendar_fingerprint()
+                    if self._llm is not None:
+                        self._llm.calendar_service = self._calendar
+        return self._calendar
+
+    @property
+    def zoom(self) -> ZoomService:
+        """Shared ZoomService, rebuilt when Zoom credentials change"""
+        fingerprint = self._get_zoom_fingerprint()
+        if self._zoom is None or fingerprint != self._zoom_fingerprint:
+            with self._lock:
+                if self._zoom is None or fingerprint != self._zoom_fingerprint:
+                    if self._zoom is not None:
+                        logger.info("Zoom credentials changed - rebuilding ZoomService")
+                    self._zoom = ZoomService()
+                    self._zoom_fingerprint = fingerprint
+                    if self._llm is not None:
+                        self._llm.zoom_service = self._zoom
+        return self._zoom
+
+    @property
+    def llm(self) -> LLMService:
+        """Shared LLMService wired to the shared calendar and Zoom services"""
+        calendar_service = self.calendar
+        zoom_service = self.zoom
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    self._llm = LLMService(
+                        calendar_service=calendar_service,
+                        zoom_service=zoom_service
+                    )
+        return self._llm
+
+    def warm_up(self) -> None:
+        """Build all services up front so the first call doesn't pay for it"""
+        self.llm
+        logger.info("✅ Service registry warmed up")
+
+    def reload_settings(self) -> None:
+        """
+        Reload settings-driven state (system prompt, model routes) after an update.
+
+        Called by the settings API so the change applies immediately in this
+        process; other workers pick it up on their next prompt refresh.
+        """
+        if self._llm is not None:
+            self._llm.reload_system_prompt()
+            self._llm.router.reload()
+            logger.info("Service registry reloaded LLM settings")
+
+    async def close(self) -> None:
+        """Release network resources held by shared services"""
+        try:
+            await close_openai_client()
+        except Exception as e:
+            logger.warning(f"Failed to close OpenAI client: {e}")
+        self._llm = None
+        self._calendar = None
+        self._zoom = None
+
+
+# Global registry instance
+_service_registry = None
+
+
+def get_service_registry() -> ServiceRegistry:
+    """
+    Get or create global service registry instance.
+
+    Returns:
+        ServiceRegistry instance
+    """
+    global _service_registry
+    if _service_registry is None:
+        _service_registry = ServiceRegistry()
+    return _service_registry
+
+
+def get_llm_service() -> LLMService:
+    """FastAPI dependency returning the shared LLMService"""
+    return get_service_registry().llm
+
+
+def get_calendar_service() -> CalendarService:
+    """FastAPI dependency returning the shared CalendarService"""
+    return get_service_registry().calendar
+
+
+def get_zoom_service() -> ZoomService:
+    """FastAPI dependency returning the shared ZoomService"""
+    return get_service_registry().zoom
@@ -0,0 +1,134 @@
+"""
+Sweep-line slot generation over busy intervals
+
+Busy intervals are parsed and sorted once and overlapping ones are merged;
+candidate slots and busy intervals are then walked together in a single
+pass, so generating slots is O(slots + busy) instead of re-checking every
+busy interval for every candidate.
+
+Candidates start on granularity boundaries (counted from midnight UTC) and
+must fit inside the working hours of their day. After a conflict the next
+candidate is the first boundary at or after the busy interval's end, so
+slots stay aligned; outside working hours the sweep jumps straight to the
+next working day.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+Interval = Tuple[datetime, datetime]
+
+
+def _parse(value: str) -> datetime:
+    # Normalized to UTC: slots inherit the tzinfo of the busy end they align
+    # to, and working hours are UTC regardless of the calendar's offsets
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def merge_busy(busy_times: Iterable[Dict[str, str]]) -> List[Interval]:
+    """
+    Parse, sort and merge busy intervals
+
+    Args:
+        busy_times: {"start", "end"} intervals (RFC 3339), any order
+
+    Returns:
+        Disjoint (start, end) intervals in order; touching intervals are merged
+    """
+    intervals = sorted((_parse(busy['start']), _parse(busy['end'])) for busy in busy_times)
+    merged: List[List[datetime]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def _align(moment: datetime, granularity: timedelta) -> datetime:
+    """First granularity boundary (from midnight) at or after moment"""
+    midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    steps = -((midnight - moment) // granularity)  # ceil division
+    return midnight + steps * granularity
+
+
+def generate_slots(
+    start: datetime,
+    end: datetime,
+    duration_minutes: int,
+    busy: List[Interval],
+    granularity_minutes: int = 30,
+    work_start_hour: int = 9,
+    work_end_hour: int = 17,
+    limit: Optional[int] = None
+) -> List[Interval]:
+    """
+    Free slots in [start, end) avoiding busy intervals
+
+    Args:
+        start: Range start (timezone-aware)
+        end: Range end; slots must start before it
+        duration_minutes: Slot length
+        busy: Merged busy intervals from merge_busy()
+        granularity_minutes: Spacing of candidate start times
+        work_start_hour: First working hour of the day (UTC)
+        work_end_hour: Slots must end by this hour (UTC)
+        limit: Stop after this many slots (None = all)
+
+    Returns:
+        (slot_start, slot_end) in order
+    """
+    duration = timedelta(minutes=duration_minutes)
+    granularity = timedelta(minutes=granularity_minutes)
+    day_open = timedelta(hours=work_start_hour)
+    day_close = timedelta(hours=work_end_hour)
+
+    slots: List[Interval] = []
+    index = 0
+    candidate = _align(start, granularity)
+
+    while candidate < end:
+        midnight = candidate.replace(hour=0, minute=0, second=0, microsecond=0)
+        if candidate < midnight + day_open:
+            candidate = _align(midnight + day_open, granularity)
+            continue
+        slot_end = candidate + duration
+        if slot_end > midnight + day_close:
+            candidate = _align(midnight + timedelta(days=1) + day_open, granularity)
+            continue
+
+        # Busy intervals that ended by now can't conflict with any later slot
+        while index < len(busy) and busy[index][1] <= candidate:
+            index += 1
+
+        if index < len(busy) and busy[index][0] < slot_end:
+            candidate = _align(busy[index][1], granularity)
+            continue
+
+        slots.append((candidate, slot_end))
+        if limit is not None and len(slots) >= limit:
+            break
+        candidate += granularity
+
+    return slots
+
+
+def format_slots(slots: Iterable[Interval]) -> List[Dict[str, str]]:
+    """
+    Slot dicts as offered to the model
+
+    Args:
+        slots: (slot_start, slot_end) from generate_slots()
+
+    Returns:
+        {"start", "end", "display"} per slot
+    """
+    return [
+        {
+            "start": slot_start.isoformat(),
+            "end": slot_end.isoformat(),
+            "display": slot_start.strftime("%A, %B %d at %I:%M %p")
+        }
+        for slot_start, slot_end in slots
+    ]
@@ -0,0 +1,341 @@
+"""
+Short-lived slot holds shared by concurrent calls
+
+Without coordination two live calls can offer, and both leads accept, the
+same free slot; the second booking then needs a rebook turn or a
+cancellation. Offered slots are now held in Redis:
+
+- offering a slot holds every cell it covers (settings.calendar_slot_granularity_minutes)
+  for settings.slot_hold_ttl_seconds; slots held by another call are skipped
+- booking is an atomic check-and-claim: it fails if another call holds or
+  booked any of the cells, otherwise turns them into a booked marker that
+  outlives the freebusy cache and slot index lag
+- the call's other holds are released when it books and when it hangs up
+
+Holds are per cell, so overlapping slots of different durations conflict.
+Each call's hold keys are tracked in a set for release. Lua scripts make
+check-and-set atomic across workers. Falls back to per-process holds when
+Redis is unavailable.
+"""
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from backend.config import get_settings
+from backend.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "slot_hold:"
+CALL_KEY_PREFIX = "slot_holds_by_call:"
+BOOKED_PREFIX = "booked:"
+
+# KEYS[1]: the call's hold set, KEYS[2..]: cell keys of one slot
+# ARGV: call sid, ttl ms
+HOLD_SCRIPT = """
+for i = 2, #KEYS do
+    local holder = redis.call("GET", KEYS[i])
+    if holder and holder ~= ARGV[1] then
+        return 0
+    end
+end
+for i = 2, #KEYS do
+    redis.call("SET", KEYS[i], ARGV[1], "PX", ARGV[2])
+    redis.call("SADD", KEYS[1], KEYS[i])
+end
+redis.call("PEXPIRE", KEYS[1], ARGV[2])
+return 1
+"""
+
+# KEYS[1]: the call's hold set, KEYS[2..]: cell keys of the meeting
+# ARGV: call sid, booked marker ttl ms
+CLAIM_SCRIPT = """
+for i = 2, #KEYS do
+    local holder = redis.call("GET", KEYS[i])
+    if holder and holder ~= ARGV[1] then
+        return 0
+    end
+end
+for i = 2, #KEYS do
+    redis.call("SET", KEYS[i], "booked:" .. ARGV[1], "PX", ARGV[2])
+    redis.call("SREM", KEYS[1], KEYS[i])
+end
+return 1
+"""
+
+# KEYS[1]: the call's hold set, KEYS[2..]: cell keys to keep
+# ARGV: call sid
+# Deletes the call's other holds (never booked markers); returns how many
+RELEASE_SCRIPT = """
+local keep = {}
+for i = 2, #KEYS do
+    keep[KEYS[i]] = true
+end
+local released = 0
+for _, key in ipairs(redis.call("SMEMBERS", KEYS[1])) do
+    if not keep[key] then
+        if redis.call("GET", key) == ARGV[1] then
+            redis.call("DEL", key)
+            released = released + 1
+        end
+        redis.call("SREM", KEYS[1], key)
+    end
+end
+return released
+"""
+
+# KEYS: cell keys of a meeting whose booking failed
+# ARGV: call sid
+UNCLAIM_SCRIPT = """
+for i = 1, #KEYS do
+    if redis.call("GET", KEYS[i]) == "booked:" .. ARGV[1] then
+        redis.call("DEL", KEYS[i])
+    end
+end
+return 1
+"""
+
+
+class SlotHolds:
+    """
+    Cross-worker slot holds.
+
+    Attributes:
+        counters: held, skipped (held by another call), claimed,
+            claim_conflicts, released
+    """
+
+    def __init__(self):
+        self.cache = get_cache_service()
+        self._scripts: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        # Per-process holds when Redis is unavailable: key -> (holder, monotonic expiry)
+        self._local: Dict[str, Tuple[str, float]] = {}
+        self._local_calls: Dict[str, Set[str]] = {}
+        self.counters: Dict[str, int] = {
+            "held": 0,
+            "skipped": 0,
+            "claimed": 0,
+            "claim_conflicts": 0,
+            "released": 0,
+        }
+
+    @property
+    def redis(self):
+        return self.cache.redis_client
+
+    @staticmethod
+    def cell_keys(calendar_id: str, start: datetime, end: datetime) -> List[str]:
+        """
+        Hold keys for every cell [start, end) touches
+
+        Args:
+            calendar_id: Calendar ID
+            start: Slot start (timezone-aware)
+            end: Slot end (timezone-aware)
+
+        Returns:
+            Keys in time order
+        """
+        cell = settings.calendar_slot_granularity_minutes * 60
+        first = int(start.timestamp()) // cell * cell
+        return [f"{KEY_PREFIX}{calendar_id}:{moment}" for moment in range(first, int(end.timestamp()), cell)]
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def _script(self, name: str, source: str, keys: List[str], args: List[Any]) -> int:
+        if name not in self._scripts:
+            self._scripts[name] = self.redis.register_script(source)
+        return int(self._scripts[name](keys=keys, args=args))
+
+    def _holder_local(self, key: str, now: float) -> Optional[str]:
+        entry = self._local.get(key)
+        return entry[0] if entry and entry[1] > now else None
+
+    def _set_local(self, call_sid: str, keys: List[str], value: str, ttl: float) -> bool:
+        """Per-process equivalent of HOLD_SCRIPT / CLAIM_SCRIPT"""
+        with self._lock:
+            now = time.monotonic()
+            if any(self._holder_local(key, now) not in (None, call_sid) for key in keys):
+                return False
+            if len(self._local) > 10000:
+                self._local = {k: v for k, v in self._local.items() if v[1] > now}
+            held = self._local_calls.setdefault(call_sid, set())
+            for key in keys:
+                self._local[key] = (value, now + ttl)
+                if value == call_sid:
+                    held.add(key)
+                else:
+                    held.discard(key)
+            return True
+
+    def _try_hold(self, call_sid: str, keys: List[str]) -> bool:
+        ttl = settings.slot_hold_ttl_seconds
+        if self.redis:
+            try:
+                return bool(self._script(
+                    "hold", HOLD_SCRIPT, [f"{CALL_KEY_PREFIX}{call_sid}", *keys], [call_sid, ttl * 1000]
+                ))
+            except Exception as e:
+                logger.error(f"Slot hold error for {call_sid}: {e}")
+        return self._set_local(call_sid, keys, call_sid, ttl)
+
+    def hold_offers(self, call_sid: str, calendar_id: str, slots: List[Dict], count: int) -> List[Dict]:
+        """
+        Hold up to `count` slots for a call, skipping slots other calls hold
+
+        The call's holds on slots it offered earlier but not now are released.
+
+        Args:
+            call_sid: Twilio Call SID (hold owner)
+            calendar_id: Calendar ID
+            slots: Candidate slots in preference order ({"start", "end", ...})
+            count: Slots to offer
+
+        Returns:
+            The held slots, in order (may be fewer than count)
+        """
+        if not settings.slot_holds_enabled:
+            return slots[:count]
+
+        offered: List[Dict] = []
+        offered_keys: List[str] = []
+        skipped = 0
+        for slot in slots:
+            if len(offered) >= count:
+                break
+            keys = self.cell_keys(
+                calendar_id, datetime.fromisoformat(slot['start']), datetime.fromisoformat(slot['end'])
+            )
+            if self._try_hold(call_sid, keys):
+                offered.append(slot)
+                offered_keys.extend(keys)
+            else:
+                skipped += 1
+
+        self._count("held", len(offered))
+        self._count("skipped", skipped)
+        if skipped:
+            logger.info(f"🔒 Skipped {skipped} slot(s) held by other calls for {call_sid}")
+        self.release_call(call_sid, keep=offered_keys)
+        return offered
+
+    def claim(self, call_sid: str, calendar_id: str, start: datetime, end: datetime) -> bool:
+        """
+        Atomically claim a meeting time for booking
+
+        Succeeds if no other call holds or booked any of its cells; the
+        cells then carry a booked marker for settings.slot_hold_booked_ttl_seconds.
+
+        Args:
+            call_sid: Twilio Call SID
+            calendar_id: Calendar ID
+            start: Meeting start (timezone-aware)
+            end: Meeting end (timezone-aware)
+
+        Returns:
+            False if the time is taken
+        """
+        if not settings.slot_holds_enabled:
+            return True
+
+        keys = self.cell_keys(calendar_id, start, end)
+        ttl = settings.slot_hold_booked_ttl_seconds
+        claimed = None
+        if self.redis:
+            try:
+                claimed = bool(self._script(
+                    "claim", CLAIM_SCRIPT, [f"{CALL_KEY_PREFIX}{call_sid}", *keys], [call_sid, ttl * 1000]
+                ))
+            except Exception as e:
+                logger.error(f"Slot claim error for {call_sid}: {e}")
+        if claimed is None:
+            claimed = self._set_local(call_sid, keys, f"{BOOKED_PREFIX}{call_sid}", ttl)
+
+        self._count("claimed" if claimed else "claim_conflicts")
+        return claimed
+
+    def release_claim(self, call_sid: str, calendar_id: str, start: datetime, end: datetime) -> None:
+        """
+        Drop a claim whose booking failed
+
+        Args:
+            call_sid: Twilio Call SID
+            calendar_id: Calendar ID
+            start: Meeting start (timezone-aware)
+            end: Meeting end (timezone-aware)
+        """
+        if not settings.slot_holds_enabled:
+            return
+        keys = self.cell_keys(calendar_id, start, end)
+        if self.redis:
+            try:
+                self._script("unclaim", UNCLAIM_SCRIPT, keys, [call_sid])
+                return
+            except Exception as e:
+                logger.error(f"Slot unclaim error for {call_sid}: {e}")
+        with self._lock:
+            for key in keys:
+                if self._local.get(key, (None,))[0] == f"{BOOKED_PREFIX}{call_sid}":
+                    del self._local[key]
+
+    def release_call(self, call_sid: str, keep: List[str] = ()) -> None:
+        """
+        Release a call's holds (booked markers stay)
+
+        Args:
+            call_sid: Twilio Call SID
+            keep: Hold keys to keep (the slots currently offered)
+        """
+        if not settings.slot_holds_enabled:
+            return
+        released = None
+        if self.redis:
+            try:
+                released = self._script("release", RELEASE_SCRIPT, [f"{CALL_KEY_PREFIX}{call_sid}", *keep], [call_sid])
+            except Exception as e:
+                logger.error(f"Slot release error for {call_sid}: {e}")
+        if released is None:
+            with self._lock:
+                held = self._local_calls.pop(call_sid, set())
+                kept = held & set(keep)
+                if kept:
+                    self._local_calls[call_sid] = kept
+                released = 0
+                for key in held - kept:
+                    if self._local.get(key, (None,))[0] == call_sid:
+                        del self._local[key]
+                        released += 1
+        self._count("released", released)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hold, skip and claim counters"""
+        with self._lock:
+            return {
+                "enabled": settings.slot_holds_enabled,
+                "shared": self.redis is not None,
+                "ttl_seconds": settings.slot_hold_ttl_seconds,
+                **self.counters,
+            }
+
+
+# Global slot holds instance
+_slot_holds = None
+
+
+def get_slot_holds() -> SlotHolds:
+    """
+    Get or create the process-wide slot holds.
+
+    Returns:
+        SlotHolds instance
+    """
+    global _slot_holds
+    if _slot_holds is None:
+        _slot_holds = SlotHolds()
+    return _slot_holds
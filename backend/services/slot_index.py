@@ -0,0 +1,423 @@
+"""
+Precomputed free-slot index per calendar
+
+Even with the freebusy cache, the first availability lookup of a call pays
+a Google round trip. A Celery beat job (refresh_slot_index) keeps, for every
+indexed calendar, a bitmap of busy cells (settings.calendar_slot_granularity_minutes
+each) covering today plus settings.slot_index_days, so check_calendar_availability
+can answer with one Redis read and no Google call.
+
+The bitmap is rebuilt from the calendar's events, which are kept in Redis
+too and refreshed incrementally with Google's events syncToken: a full
+listing reaches RESYNC_MARGIN_DAYS past the window, later runs only fetch
+what changed, and a new full listing is made when the window outgrows it or
+Google expires the token. Bookings made through this process are marked
+immediately; every booking is still confirmed against Google freebusy.
+
+Needs Redis (the index is written by Celery and read by the API workers);
+without it, or when the index is stale, lookups fall back to freebusy.
+
+Layout (per calendar):
+    slot_index:<calendar>:meta    hash: base, cells, cell_minutes, bits (hex),
+                                  horizon, sync_token, synced_at
+    slot_index:<calendar>:events  hash: event id -> "start|end" (epoch seconds)
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import get_settings
+from backend.services.cache_service import get_cache_service
+from backend.services.calendar_service import SyncTokenExpired
+from backend.services.slot_engine import Interval, format_slots, generate_slots
+from backend.utils.latency_metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "slot_index:"
+RESYNC_MARGIN_DAYS = 7  # Full listings reach this far past the window
+
+
+def _parse(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def event_interval(event: Dict[str, Any]) -> Optional[Interval]:
+    """
+    Time a Google event blocks
+
+    Args:
+        event: Event resource from events.list
+
+    Returns:
+        (start, end) in UTC, or None for cancelled, transparent ("free") and
+        declined events
+    """
+    if event.get('status') == 'cancelled' or event.get('transparency') == 'transparent':
+        return None
+    for attendee in event.get('attendees', []):
+        if attendee.get('self') and attendee.get('responseStatus') == 'declined':
+            return None
+
+    start, end = event.get('start', {}), event.get('end', {})
+    if 'dateTime' in start and 'dateTime' in end:
+        return _parse(start['dateTime']), _parse(end['dateTime'])
+    if 'date' in start and 'date' in end:
+        # All-day events block whole UTC days
+        return _parse(start['date']), _parse(end['date'])
+    return None
+
+
+def build_bitmap(intervals: List[Interval], base: datetime, cells: int, cell: timedelta) -> bytearray:
+    """
+    Mark every cell an interval overlaps as busy
+
+    Bit i (most significant bit first, as Redis SETBIT) covers
+    [base + i * cell, base + (i + 1) * cell).
+
+    Args:
+        intervals: Busy (start, end) intervals, any order
+        base: Start of cell 0
+        cells: Number of cells
+        cell: Cell length
+
+    Returns:
+        Bitmap of ceil(cells / 8) bytes
+    """
+    bitmap = bytearray((cells + 7) // 8)
+    for start, end in intervals:
+        first = max(0, (start - base) // cell)
+        last = min(cells, -((base - end) // cell))  # ceil: first cell at or after end
+        for i in range(first, last):
+            bitmap[i >> 3] |= 0x80 >> (i & 7)
+    return bitmap
+
+
+def busy_runs(bitmap: bytes, base: datetime, cells: int, cell: timedelta) -> List[Interval]:
+    """
+    Runs of consecutive busy cells as (start, end) intervals, in order
+
+    Args:
+        bitmap: Bitmap from build_bitmap()
+        base: Start of cell 0
+        cells: Number of cells
+        cell: Cell length
+
+    Returns:
+        Disjoint busy intervals (input for generate_slots)
+    """
+    runs: List[Interval] = []
+    run_start = None
+    for i in range(cells):
+        busy = bitmap[i >> 3] & (0x80 >> (i & 7))
+        if busy and run_start is None:
+            run_start = i
+        elif not busy and run_start is not None:
+            runs.append((base + run_start * cell, base + i * cell))
+            run_start = None
+    if run_start is not None:
+        runs.append((base + run_start * cell, base + cells * cell))
+    return runs
+
+
+class SlotIndex:
+    """
+    Redis-backed free-slot index, refreshed by Celery beat.
+
+    Attributes:
+        counters: lookups, served, stale, unavailable, full_syncs,
+            incremental_syncs, marked
+        lookup_latency: Histogram of index lookups (ms)
+    """
+
+    def __init__(self):
+        self.cache = get_cache_service()
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {
+            "lookups": 0,
+            "served": 0,
+            "stale": 0,
+            "unavailable": 0,
+            "full_syncs": 0,
+            "incremental_syncs": 0,
+            "marked": 0,
+        }
+        self.lookup_latency = LatencyHistogram()
+
+    @property
+    def redis(self):
+        return self.cache.redis_client
+
+    @staticmethod
+    def calendar_ids() -> List[str]:
+        """Calendars to index (settings.slot_index_calendar_ids, else the default calendar)"""
+        configured = [c.strip() for c in settings.slot_index_calendar_ids.split(",") if c.strip()]
+        return configured or [settings.google_calendar_id or 'primary']
+
+    @staticmethod
+    def _keys(calendar_id: str) -> Tuple[str, str]:
+        return f"{KEY_PREFIX}{calendar_id}:meta", f"{KEY_PREFIX}{calendar_id}:events"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def _write_bitmap(self, calendar_id: str, base: datetime, cells: int, cell_minutes: int, meta: Dict[str, Any] = None) -> int:
+        """
+        Rebuild the bitmap from the stored events and save it with meta
+
+        Events that ended before the window are dropped.
+
+        Returns:
+            Number of busy cells
+        """
+        meta_key, events_key = self._keys(calendar_id)
+        intervals: List[Interval] = []
+        expired: List[str] = []
+        for event_id, encoded in self.redis.hgetall(events_key).items():
+            start, end = (float(value) for value in encoded.split("|"))
+            if end <= base.timestamp():
+                expired.append(event_id)
+            else:
+                intervals.append((
+                    datetime.fromtimestamp(start, timezone.utc),
+                    datetime.fromtimestamp(end, timezone.utc)
+                ))
+
+        bitmap = build_bitmap(intervals, base, cells, timedelta(minutes=cell_minutes))
+        pipe = self.redis.pipeline()
+        if expired:
+            pipe.hdel(events_key, *expired)
+        pipe.hset(meta_key, mapping={
+            "base": int(base.timestamp()),
+            "cells": cells,
+            "cell_minutes": cell_minutes,
+            "bits": bitmap.hex(),
+            **(meta or {}),
+        })
+        pipe.execute()
+        return sum(bin(byte).count("1") for byte in bitmap)
+
+    def refresh(self, calendar_service, calendar_id: str) -> Dict[str, Any]:
+        """
+        Bring one calendar's index up to date (called by the beat task)
+
+        Args:
+            calendar_service: CalendarService to list events with
+            calendar_id: Calendar ID
+
+        Returns:
+            Dict with mode ("full"/"incremental"), changed events and busy cells
+        """
+        if not self.redis:
+            raise RuntimeError("Slot index needs Redis")
+
+        started = time.perf_counter()
+        meta_key, events_key = self._keys(calendar_id)
+        meta = self.redis.hgetall(meta_key)
+        cell_minutes = settings.calendar_slot_granularity_minutes
+        base = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        window_end = base + timedelta(days=settings.slot_index_days + 1)
+        cells = int((window_end - base) / timedelta(minutes=cell_minutes))
+
+        sync_token = meta.get("sync_token")
+        full = (
+            not sync_token
+            or int(meta.get("cell_minutes", 0)) != cell_minutes
+            or float(meta.get("horizon", 0)) < window_end.timestamp()
+        )
+
+        if not full:
+            try:
+                events, next_token = calendar_service.list_event_changes(calendar_id, sync_token=sync_token)
+            except SyncTokenExpired:
+                logger.info(f"📅 Sync token expired for {calendar_id} - full slot index sync")
+                full = True
+            else:
+                horizon = float(meta["horizon"])
+                updates: Dict[str, str] = {}
+                removals: List[str] = []
+                for event in events:
+                    interval = event_interval(event)
+                    if interval and interval[0].timestamp() < horizon:
+                        updates[event['id']] = f"{interval[0].timestamp()}|{interval[1].timestamp()}"
+                    else:
+                        removals.append(event['id'])
+                pipe = self.redis.pipeline()
+                if removals:
+                    pipe.hdel(events_key, *removals)
+                if updates:
+                    pipe.hset(events_key, mapping=updates)
+                pipe.execute()
+                self._count("incremental_syncs")
+
+        if full:
+            horizon = (window_end + timedelta(days=RESYNC_MARGIN_DAYS)).timestamp()
+            events, next_token = calendar_service.list_event_changes(
+                calendar_id, time_min=base, time_max=datetime.fromtimestamp(horizon, timezone.utc)
+            )
+            entries: Dict[str, str] = {}
+            for event in events:
+                interval = event_interval(event)
+                if interval:
+                    entries[event['id']] = f"{interval[0].timestamp()}|{interval[1].timestamp()}"
+            pipe = self.redis.pipeline()
+            pipe.delete(events_key)
+            if entries:
+                pipe.hset(events_key, mapping=entries)
+            pipe.execute()
+            self._count("full_syncs")
+
+        busy_cells = self._write_bitmap(calendar_id, base, cells, cell_minutes, meta={
+            "horizon": horizon,
+            # Google omits the token only on errors; keep the old one rather than drop to full syncs
+            "sync_token": next_token or sync_token or "",
+            "synced_at": time.time(),
+        })
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.info(
+            f"📅 Slot index {'full' if full else 'incremental'} sync for {calendar_id}: "
+            f"{len(events)} event(s), {busy_cells}/{cells} busy cells ({elapsed_ms:.0f} ms)"
+        )
+        return {"mode": "full" if full else "incremental", "events": len(events), "busy_cells": busy_cells}
+
+    def mark_busy(self, calendar_id: str, event_id: str, start: datetime, end: datetime) -> None:
+        """
+        Add an event booked by this process without waiting for the next sync
+
+        Args:
+            calendar_id: Calendar ID
+            event_id: Google event ID
+            start: Event start (timezone-aware)
+            end: Event end (timezone-aware)
+        """
+        if not settings.slot_index_enabled or not self.redis:
+            return
+        meta_key, events_key = self._keys(calendar_id)
+        try:
+            meta = self.redis.hgetall(meta_key)
+            if not meta.get("bits"):
+                return
+            self.redis.hset(events_key, event_id, f"{start.timestamp()}|{end.timestamp()}")
+            self._write_bitmap(
+                calendar_id,
+                datetime.fromtimestamp(int(meta["base"]), timezone.utc),
+                int(meta["cells"]),
+                int(meta["cell_minutes"])
+            )
+            self._count("marked")
+        except Exception as e:
+            logger.error(f"Slot index update error for {calendar_id}: {e}")
+
+    def is_fresh(self, calendar_id: str) -> bool:
+        """Whether the index is recent enough to answer lookups"""
+        if not settings.slot_index_enabled or not self.redis:
+            return False
+        try:
+            synced_at = self.redis.hget(self._keys(calendar_id)[0], "synced_at")
+        except Exception as e:
+            logger.error(f"Slot index read error for {calendar_id}: {e}")
+            return False
+        return synced_at is not None and time.time() - float(synced_at) <= settings.slot_index_max_age_seconds
+
+    def free_slots(
+        self,
+        calendar_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        duration_minutes: int,
+        limit: Optional[int] = None,
+        min_slots: int = 1
+    ) -> Optional[List[Dict]]:
+        """
+        Free slots from the index (same rules as CalendarService.compute_available_slots)
+
+        Args:
+            calendar_id: Calendar ID
+            start_date: Start of search range (timezone-aware)
+            end_date: End of search range (timezone-aware)
+            duration_minutes: Meeting duration
+            limit: Stop after this many slots (None = all)
+            min_slots: If the index covers only part of the range, the
+                slots found there must number at least this many
+
+        Returns:
+            Slots, or None if the index is unavailable, stale or doesn't
+            cover the request
+        """
+        if not settings.slot_index_enabled or not self.redis:
+            return None
+        started = time.perf_counter()
+        self._count("lookups")
+        try:
+            meta = self.redis.hgetall(self._keys(calendar_id)[0])
+        except Exception as e:
+            logger.error(f"Slot index read error for {calendar_id}: {e}")
+            meta = {}
+
+        if not meta.get("bits") or int(meta["cell_minutes"]) != settings.calendar_slot_granularity_minutes:
+            self._count("unavailable")
+            return None
+        if time.time() - float(meta["synced_at"]) > settings.slot_index_max_age_seconds:
+            self._count("stale")
+            return None
+
+        base = datetime.fromtimestamp(int(meta["base"]), timezone.utc)
+        cells = int(meta["cells"])
+        cell = timedelta(minutes=int(meta["cell_minutes"]))
+        covered_end = base + cells * cell
+        if start_date < base or start_date >= covered_end:
+            self._count("unavailable")
+            return None
+
+        window_end = min(end_date, covered_end)
+        slots = generate_slots(
+            start_date,
+            window_end,
+            duration_minutes,
+            busy_runs(bytes.fromhex(meta["bits"]), base, cells, cell),
+            granularity_minutes=settings.calendar_slot_granularity_minutes,
+            work_start_hour=settings.calendar_working_hours_start,
+            work_end_hour=settings.calendar_working_hours_end,
+            limit=limit
+        )
+        # A truncated window is only trustworthy if it already yields enough slots
+        if window_end < end_date and len(slots) < min_slots:
+            self._count("unavailable")
+            return None
+
+        self._count("served")
+        self.lookup_latency.record((time.perf_counter() - started) * 1000)
+        return format_slots(slots)
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup counters and latency, sync counters"""
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "enabled": settings.slot_index_enabled,
+            "calendars": self.calendar_ids(),
+            **counters,
+            "lookup_latency": self.lookup_latency.summary(),
+        }
+
+
+# Global slot index instance
+_slot_index = None
+
+
+def get_slot_index() -> SlotIndex:
+    """
+    Get or create the process-wide slot index.
+
+    Returns:
+        SlotIndex instance
+    """
+    global _slot_index
+    if _slot_index is None:
+        _slot_index = SlotIndex()
+    return _slot_index
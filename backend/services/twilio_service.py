@@ -3,10 +3,13 @@ Twilio integration service for outbound calling
 """
 from twilio.rest import Client
 from twilio.twiml.voice_response import VoiceResponse, Gather, Say
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+from datetime import datetime
+from functools import lru_cache
 import logging
 
 from backend.config import get_settings
+from backend.utils.twiml_renderer import TwimlTemplateCache
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -26,7 +29,8 @@ class TwilioService:
         self,
         to_phone_number: str,
         callback_url: str,
-        status_callback_url: str
+        status_callback_url: str,
+        recording_status_callback_url: Optional[str] = None
     ) -> Optional[str]:
         """
         Initiate an outbound call
@@ -35,11 +39,21 @@ class TwilioService:
             to_phone_number: Phone number to call (E.164 format)
             callback_url: URL for voice/TwiML instructions
             status_callback_url: URL for call status updates
+            recording_status_callback_url: URL notified when the recording is ready
 
         Returns:
             Call SID if successful, None otherwise
         """
         try:
+            recording_params = {}
+            if recording_status_callback_url:
+                # Twilio pushes the recording SID when it's ready (no polling needed)
+                recording_params = {
+                    "recording_status_callback": recording_status_callback_url,
+                    "recording_status_callback_method": 'POST',
+                    "recording_status_callback_event": ['completed'],
+                }
+
             call = self.client.calls.create(
                 to=to_phone_number,
                 from_=self.phone_number,
@@ -49,7 +63,8 @@ class TwilioService:
                 status_callback_method='POST',
                 record=True,  # Enable call recording
                 timeout=30,  # Ring timeout in seconds
-                machine_detection='DetectMessageEnd'  # Detect voicemail
+                machine_detection='DetectMessageEnd',  # Detect voicemail
+                **recording_params
             )
 
             logger.info(f"Call initiated to {to_phone_number}: SID={call.sid}")
@@ -74,15 +89,47 @@ class TwilioService:
             recordings = self.client.recordings.list(call_sid=call_sid)
             if recordings:
                 # Get the first recording
-                recording = recordings[0]
-                # Construct full URL
-                base_url = f"https://api.twilio.com/2010-04-01/Accounts/{settings.twilio_account_sid}"
-                return f"{base_url}/Recordings/{recording.sid}.mp3"
+                return self.build_recording_url(recordings[0].sid)
             return None
         except Exception as e:
             logger.error(f"Failed to fetch recording for call {call_sid}: {str(e)}")
             return None
 
+    def get_recording_urls(self, call_sids: List[str], created_after: datetime) -> Dict[str, str]:
+        """
+        Resolve recording URLs for many calls with a single list request
+
+        Args:
+            call_sids: Twilio Call SIDs to resolve
+            created_after: Only consider recordings created after this time
+
+        Returns:
+            Dict mapping Call SID to recording URL (calls without a recording are omitted)
+        """
+        wanted = set(call_sids)
+        urls: Dict[str, str] = {}
+        try:
+            for recording in self.client.recordings.list(date_created_after=created_after, page_size=1000):
+                if recording.call_sid in wanted and recording.call_sid not in urls:
+                    urls[recording.call_sid] = self.build_recording_url(recording.sid)
+        except Exception as e:
+            logger.error(f"Failed to list recordings: {str(e)}")
+        return urls
+
+    @staticmethod
+    def build_recording_url(recording_sid: str) -> str:
+        """
+        Build the public MP3 URL for a recording
+
+        Args:
+            recording_sid: Twilio Recording SID
+
+        Returns:
+            Recording URL
+        """
+        base_url = f"https://api.twilio.com/2010-04-01/Accounts/{settings.twilio_account_sid}"
+        return f"{base_url}/Recordings/{recording_sid}.mp3"
+
     def terminate_call(self, call_sid: str) -> bool:
         """
         Terminate an active call
@@ -106,15 +153,47 @@ class TwilioService:
         """
         Generate TwiML for initial greeting
 
+        The greeting is fully static, so it is rendered once per language.
+
         Args:
             language: Language code for greeting
 
         Returns:
             TwiML XML string
         """
-        # Get settings for API base URL
-        settings = get_settings()
+        return _render_greeting(language)
 
+    @staticmethod
+    def generate_twiml_response(text: str, language: str = "en", end_call: bool = False) -> str:
+        """
+        Generate TwiML for AI response
+
+        Uses a precompiled template per (language, end_call); only the
+        escaped text is inserted per turn.
+
+        Args:
+            text: Text to speak
+            language: Language code
+            end_call: Whether to end the call after this response
+
+        Returns:
+            TwiML XML string
+        """
+        return _response_templates.render(text, language, end_call)
+
+    @staticmethod
+    def build_twiml_greeting(language: str = "en") -> str:
+        """
+        Build greeting TwiML from the VoiceResponse object tree
+
+        Source of truth for generate_twiml_greeting().
+
+        Args:
+            language: Language code for greeting
+
+        Returns:
+            TwiML XML string
+        """
         response = VoiceResponse()
 
         # Language-specific greetings
@@ -162,9 +241,11 @@ class TwilioService:
         return str(response)
 
     @staticmethod
-    def generate_twiml_response(text: str, language: str = "en", end_call: bool = False) -> str:
+    def build_twiml_response(text: str, language: str = "en", end_call: bool = False) -> str:
         """
-        Generate TwiML for AI response
+        Build response TwiML from the VoiceResponse object tree
+
+        Source of truth for the templates behind generate_twiml_response().
 
         Args:
             text: Text to speak
@@ -174,9 +255,6 @@ class TwilioService:
         Returns:
             TwiML XML string
         """
-        # Get settings for API base URL
-        settings = get_settings()
-
         response = VoiceResponse()
 
         # Use English for trial account compatibility
@@ -217,3 +295,70 @@ class TwilioService:
 
         return str(response)
 
+    @staticmethod
+    def generate_twiml_media_stream(welcome_text: str, language: str = "en") -> str:
+        """
+        Generate TwiML that connects the call to the streaming websocket
+
+        Twilio handles speech recognition and TTS; the websocket receives
+        transcribed prompts and streams response text back token by token.
+
+        Args:
+            welcome_text: Opening line spoken when the stream connects
+            language: Language code
+
+        Returns:
+            TwiML XML string
+        """
+        settings = get_settings()
+
+        # ws(s):// version of the public API URL
+        ws_base_url = settings.api_base_url.replace("https://", "wss://", 1).replace("http://", "ws://", 1)
+
+        response = VoiceResponse()
+        connect = response.connect()
+        connect.add_child(
+            'ConversationRelay',
+            url=f'{ws_base_url}/api/webhooks/twilio/media-stream',
+            welcome_greeting=welcome_text,
+            language="en-US",  # Same TTS language as the Gather flow
+            interruptible="true"
+        )
+        # Reached when the websocket sends "end"
+        response.hangup()
+
+        return str(response)
+
+    @staticmethod
+    def generate_twiml_interim(text: str, redirect_url: str, language: str = "en") -> str:
+        """
+        Generate TwiML for a filler phrase while a slow turn finishes
+
+        Twilio speaks the filler, then requests redirect_url for the real reply.
+
+        Args:
+            text: Filler phrase to speak
+            redirect_url: Absolute continuation URL
+            language: Language code
+
+        Returns:
+            TwiML XML string
+        """
+        response = VoiceResponse()
+
+        # Use English for trial account compatibility
+        tts_language = "en-US"
+
+        response.say(text, language=tts_language)
+        response.redirect(redirect_url, method='POST')
+
+        return str(response)
+
+
+# Compiled once per (language, end_call); the spoken text is the only dynamic part
+_response_templates = TwimlTemplateCache(TwilioService.build_twiml_response)
+
+
+@lru_cache(maxsize=None)
+def _render_greeting(language: str) -> str:
+    return TwilioService.build_twiml_greeting(language)
@@ -0,0 +1,174 @@
+"""
+Idempotent webhook processing for Twilio retries.
+
+Twilio retries a webhook when the response is slow. Without protection a
+retried process-speech re-inserts the user turn, re-runs the LLM and can
+book the same meeting twice. The replay cache stores the rendered TwiML for
+a short TTL, keyed by CallSid + request identity, and returns it on retry.
+"""
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+
+from backend.config import get_settings
+from backend.services.cache_service import get_cache_service
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+KEY_PREFIX = "webhook_replay:"
+PENDING = "__pending__"
+
+
+class WebhookReplayCache:
+    """
+    Claim/store cache for webhook responses.
+
+    The first request for a key claims it (SET NX) and processes normally;
+    a retry that arrives while the original is running waits for its TwiML
+    instead of processing again. Falls back to an in-process dict when Redis
+    is unavailable.
+    """
+
+    def __init__(self, ttl: int = None, wait_seconds: float = None):
+        self.cache = get_cache_service()
+        self.ttl = ttl or settings.webhook_replay_ttl_seconds
+        self.wait_seconds = wait_seconds if wait_seconds is not None else settings.webhook_replay_wait_seconds
+
+        self._local: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def redis(self):
+        return self.cache.redis_client
+
+    @staticmethod
+    def make_key(call_sid: str, headers: Mapping[str, str], params: Mapping[str, str]) -> str:
+        """
+        Build the replay key for a webhook request
+
+        Prefers Twilio's idempotency token (identical across retries of the same
+        request); otherwise uses the request signature plus the form parameters.
+
+        Args:
+            call_sid: Twilio Call SID
+            headers: Request headers
+            params: Form parameters
+
+        Returns:
+            Cache key
+        """
+        token = headers.get("i-twilio-idempotency-token")
+        if not token:
+            digest = hashlib.sha256()
+            digest.update((headers.get("x-twilio-signature") or "").encode())
+            for name in sorted(params.keys()):
+                digest.update(f"\0{name}={params.get(name)}".encode())
+            token = digest.hexdigest()
+        return f"{KEY_PREFIX}{call_sid}:{token}"
+
+    def _local_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._local.get(key)
+            if entry and entry[1] < time.monotonic():
+                del self._local[key]
+                return None
+            return entry[0] if entry else None
+
+    def _local_set(self, key: str, value: str, nx: bool = False) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            # Opportunistic cleanup so the dict doesn't grow unbounded
+            if len(self._local) > 10000:
+                self._local = {k: v for k, v in self._local.items() if v[1] >= now}
+            existing = self._local.get(key)
+            if nx and existing and existing[1] >= now:
+                return False
+            self._local[key] = (value, now + self.ttl)
+            return True
+
+    def _get(self, key: str) -> Optional[str]:
+        if self.redis:
+            try:
+                return self.redis.get(key)
+            except Exception as e:
+                logger.error(f"Replay cache get error for '{key}': {e}")
+        return self._local_get(key)
+
+    def _set(self, key: str, value: str, nx: bool = False) -> bool:
+        if self.redis:
+            try:
+                return bool(self.redis.set(key, value, ex=self.ttl, nx=nx))
+            except Exception as e:
+                logger.error(f"Replay cache set error for '{key}': {e}")
+        return self._local_set(key, value, nx=nx)
+
+    async def claim(self, key: str) -> Tuple[bool, Optional[str]]:
+        """
+        Claim a webhook request for processing
+
+        Args:
+            key: Replay key from make_key()
+
+        Returns:
+            (True, None) if this request should be processed,
+            (False, twiml) for a retry whose original already finished,
+            (False, None) if the original is still running after the wait
+        """
+        if self._set(key, PENDING, nx=True):
+            return True, None
+
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            value = self._get(key)
+            if value is None:
+                # Original expired/released without a result - process it ourselves
+                if self._set(key, PENDING, nx=True):
+                    return True, None
+            elif value != PENDING:
+                return False, value
+
+            if time.monotonic() >= deadline:
+                return False, None
+            await asyncio.sleep(0.1)
+
+    def store(self, key: str, twiml: str) -> None:
+        """
+        Store the rendered response for replay
+
+        Args:
+            key: Replay key
+            twiml: Response body returned to Twilio
+        """
+        self._set(key, twiml)
+
+    def release(self, key: str) -> None:
+        """Drop a claim without a result (processing failed before rendering)"""
+        if self.redis:
+            try:
+                self.redis.delete(key)
+                return
+            except Exception as e:
+                logger.error(f"Replay cache delete error for '{key}': {e}")
+        with self._lock:
+            self._local.pop(key, None)
+
+
+# Global replay cache instance
+_webhook_replay_cache = None
+
+
+def get_webhook_replay_cache() -> WebhookReplayCache:
+    """
+    Get or create global webhook replay cache instance.
+
+    Returns:
+        WebhookReplayCache instance
+    """
+    global _webhook_replay_cache
+    if _webhook_replay_cache is None:
+        _webhook_replay_cache = WebhookReplayCache()
+    return _webhook_replay_cache
@@ -61,7 +61,7 @@ class ZoomService:
                 "Content-Type": "application/x-www-form-urlencoded"
             }
 
-            response = requests.post(url, headers=headers)
+            response = requests.post(url, headers=headers, timeout=settings.zoom_timeout_seconds)
             response.raise_for_status()
 
             data = response.json()
@@ -137,7 +137,7 @@ class ZoomService:
                 # Format: 2025-11-03T10:00:00Z
                 payload["start_time"] = start_time.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=settings.zoom_timeout_seconds)
             response.raise_for_status()
 
             meeting_data = response.json()
@@ -182,7 +182,7 @@ class ZoomService:
                 "Authorization": f"Bearer {self.access_token}"
             }
 
-            response = requests.delete(url, headers=headers)
+            response = requests.delete(url, headers=headers, timeout=settings.zoom_timeout_seconds)
             response.raise_for_status()
 
             logger.info(f"Zoom meeting deleted: {meeting_id}")
@@ -0,0 +1,151 @@
+"""
+Fakes for the external services a call talks to
+
+- FakeGoogleCalendar: the slice of the Google Calendar API client that
+  CalendarService uses (freebusy.query, events.insert, events.list with
+  sync tokens), backed by a list
+- TwilioWebhookClient: posts Gather, continuation and status callbacks the
+  way Twilio does
+- fake_openai_client(): AsyncOpenAI wired in-process to the benchmark fake
+  server (backend.benchmarks.fake_openai_server), which serves scripted
+  replies and tool calls
+"""
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httplib2
+import httpx
+from googleapiclient.errors import HttpError
+from openai import AsyncOpenAI
+
+from backend.benchmarks.fake_openai_server import create_app
+
+
+class _Request:
+    def __init__(self, result):
+        self._result = result
+
+    def execute(self, http=None):
+        return self._result() if callable(self._result) else self._result
+
+
+class FakeGoogleCalendar:
+    """
+    In-memory stand-in for googleapiclient's calendar v3 service
+
+    events.list supports full listings and syncToken listings of what
+    changed since; expire_sync_tokens() makes the next syncToken listing
+    fail with 410 Gone like Google does.
+
+    Attributes:
+        events_created: Live events, in insertion order
+        freebusy_queries: freebusy.query calls executed
+    """
+
+    def __init__(self):
+        self.events_created: List[Dict[str, Any]] = []
+        self.freebusy_queries = 0
+        self._changes: List[Dict[str, Any]] = []  # Every insert/cancel, for syncToken listings
+        self._tokens_expired = False
+
+    def _busy(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        self.freebusy_queries += 1
+        time_min = datetime.fromisoformat(body["timeMin"].replace("Z", "+00:00"))
+        time_max = datetime.fromisoformat(body["timeMax"].replace("Z", "+00:00"))
+        busy = [
+            {"start": event["start"]["dateTime"], "end": event["end"]["dateTime"]}
+            for event in self.events_created
+            if datetime.fromisoformat(event["start"]["dateTime"]) < time_max
+            and datetime.fromisoformat(event["end"]["dateTime"]) > time_min
+        ]
+        return {"calendars": {item["id"]: {"busy": busy} for item in body["items"]}}
+
+    def _list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if "syncToken" in params:
+            if self._tokens_expired:
+                self._tokens_expired = False
+                raise HttpError(httplib2.Response({"status": 410}), b'{"error": {"message": "Sync token expired"}}')
+            items = self._changes[int(params["syncToken"]):]
+        else:
+            time_min = datetime.fromisoformat(params["timeMin"].replace("Z", "+00:00"))
+            time_max = datetime.fromisoformat(params["timeMax"].replace("Z", "+00:00"))
+            items = [
+                event for event in self.events_created
+                if datetime.fromisoformat(event["start"]["dateTime"]) < time_max
+                and datetime.fromisoformat(event["end"]["dateTime"]) > time_min
+            ]
+        return {"items": list(items), "nextSyncToken": str(len(self._changes))}
+
+    def freebusy(self):
+        return self
+
+    def query(self, body: Dict[str, Any]) -> _Request:
+        return _Request(lambda: self._busy(body))
+
+    def events(self):
+        return self
+
+    def insert(self, calendarId: str, body: Dict[str, Any], sendUpdates: str = "none") -> _Request:
+        def create():
+            event = {**body, "id": f"evt_{uuid.uuid4().hex[:10]}"}
+            self.events_created.append(event)
+            self._changes.append(event)
+            return event
+        return _Request(create)
+
+    def list(self, **params) -> _Request:
+        return _Request(lambda: self._list(params))
+
+    def cancel(self, event_id: str) -> None:
+        """Delete an event (shows up as status "cancelled" in syncToken listings)"""
+        self.events_created = [event for event in self.events_created if event["id"] != event_id]
+        self._changes.append({"id": event_id, "status": "cancelled"})
+
+    def expire_sync_tokens(self) -> None:
+        """Fail the next syncToken listing with 410 Gone"""
+        self._tokens_expired = True
+
+
+class TwilioWebhookClient:
+    """Posts webhooks for one call like Twilio (form-encoded, idempotency token)"""
+
+    def __init__(self, http: httpx.AsyncClient, call_sid: str, prefix: str = "/api/webhooks"):
+        self.http = http
+        self.call_sid = call_sid
+        self.prefix = prefix
+
+    async def _post(self, path: str, form: Dict[str, str], token: Optional[str] = None) -> httpx.Response:
+        headers = {"I-Twilio-Idempotency-Token": token or uuid.uuid4().hex}
+        return await self.http.post(f"{self.prefix}{path}", data={"CallSid": self.call_sid, **form}, headers=headers)
+
+    async def answer(self) -> httpx.Response:
+        return await self._post("/twilio/voice", {"From": "+15550000000"})
+
+    async def say(self, speech: str, token: Optional[str] = None) -> httpx.Response:
+        return await self._post("/twilio/process-speech", {"SpeechResult": speech, "Confidence": "0.9"}, token)
+
+    async def continue_turn(self, attempt: int = 1, token: Optional[str] = None) -> httpx.Response:
+        """Follow the Redirect of an interim (filler) response"""
+        return await self._post(f"/twilio/process-speech/continue?attempt={attempt}", {}, token)
+
+    async def status(self, call_status: str, duration: int = 0) -> httpx.Response:
+        return await self._post("/twilio/status", {"CallStatus": call_status, "CallDuration": str(duration)})
+
+
+def fake_openai_client(faults: Optional[Dict[str, Any]] = None) -> AsyncOpenAI:
+    """
+    AsyncOpenAI client served in-process by the fake OpenAI server
+
+    Args:
+        faults: Overrides for the fake server's DEFAULT_FAULTS
+
+    Returns:
+        Client; the server's state (faults["script"], counters) is at
+        client.fake_app.state
+    """
+    app = create_app({"latency_ms": 1.0, "latency_sigma": 0.0, **(faults or {})})
+    http_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://fake-openai")
+    client = AsyncOpenAI(api_key="sk-test", base_url="http://fake-openai/v1", http_client=http_client)
+    client.fake_app = app
+    return client
@@ -0,0 +1,80 @@
+"""Speculative freebusy prefetch on the call session"""
+import json
+
+import pytest
+
+from backend.services.call_session_store import (
+    PREFETCH_FIELD,
+    SESSION_KEY_PREFIX,
+    CallSession,
+    CallSessionStore,
+    get_call_session_store,
+)
+
+BUSY = [{"start": "2026-11-03T10:00:00+00:00", "end": "2026-11-03T11:00:00+00:00"}]
+
+
+class _Calendar:
+    def get_busy_times(self, start_date, end_date, calendar_id=None, use_cache=True):
+        return BUSY
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_saved_with_the_session(fake_redis):
+    from backend.services.llm_service import LLMService
+
+    store = get_call_session_store()
+    session = CallSession(call_sid="CA_PREFETCH", call_id=1, lead_id=1)
+    store.save(session)  # The turn that started the prefetch
+    version = session.version
+
+    await LLMService(calendar_service=_Calendar())._fetch_busy_times(session)
+
+    # Stored in its own field; the session JSON isn't re-saved
+    stored = json.loads(fake_redis.hget(f"{SESSION_KEY_PREFIX}CA_PREFETCH", PREFETCH_FIELD))
+    assert stored["busy"] == BUSY
+    assert fake_redis.hget(f"{SESSION_KEY_PREFIX}CA_PREFETCH", "version") == version
+
+    # Another worker loading the session sees the prefetched busy times
+    assert CallSessionStore().get("CA_PREFETCH").prefetched_availability["busy"] == BUSY
+
+
+@pytest.mark.asyncio
+async def test_prefetch_survives_a_turn_saved_from_an_older_copy(fake_redis):
+    from backend.services.llm_service import LLMService
+
+    store = get_call_session_store()
+    session = CallSession(call_sid="CA_PREFETCH_2", call_id=1, lead_id=1)
+    store.save(session)
+    # Another worker is running the next turn on the copy without the prefetch
+    other = CallSessionStore()
+    turn = other.get("CA_PREFETCH_2")
+
+    await LLMService(calendar_service=_Calendar())._fetch_busy_times(session)
+    turn.messages.append({"role": "user", "content": "What times do you have?"})
+    other.save(turn)
+
+    current = CallSessionStore().get("CA_PREFETCH_2")
+    assert current.prefetched_availability["busy"] == BUSY
+    assert len(current.messages) == 1
+
+
+def test_clearing_the_prefetch_removes_the_field(fake_redis):
+    store = get_call_session_store()
+    session = CallSession(call_sid="CA_PREFETCH_3", call_id=1, lead_id=1)
+    store.save(session)
+    store.save_prefetch(session, {"start": "s", "end": "e", "busy": BUSY, "fetched_at": 0})
+
+    store.save_prefetch(session, None)
+
+    assert not fake_redis.hexists(f"{SESSION_KEY_PREFIX}CA_PREFETCH_3", PREFETCH_FIELD)
+    assert CallSessionStore().get("CA_PREFETCH_3").prefetched_availability is None
+
+
+def test_prefetch_for_an_ended_call_is_dropped(fake_redis):
+    store = get_call_session_store()
+    session = CallSession(call_sid="CA_PREFETCH_4", call_id=1, lead_id=1)
+
+    store.save_prefetch(session, {"start": "s", "end": "e", "busy": BUSY, "fetched_at": 0})
+
+    assert not fake_redis.exists(f"{SESSION_KEY_PREFIX}CA_PREFETCH_4")
@@ -0,0 +1,95 @@
+"""Compare-and-set session saves and write-behind persistence of conversation turns"""
+import json
+
+import pytest
+
+from backend.models import SpeakerRole
+from backend.services.call_session_store import PENDING_TURNS_KEY, SAVE_SCRIPT, CallSession, CallSessionStore
+
+
+@pytest.fixture
+def store(fake_redis):
+    return CallSessionStore()
+
+
+def test_concurrent_saves_from_two_workers_are_merged(fake_redis):
+    worker_a, worker_b = CallSessionStore(), CallSessionStore()
+    worker_a.save(CallSession(call_sid="CA_RACE", call_id=7, lead_id=1, messages=[
+        {"role": "assistant", "content": "Hi Dana"},
+    ]))
+
+    # Both workers start from the same copy
+    session_a = worker_a.get("CA_RACE")
+    session_b = worker_b.get("CA_RACE")
+    assert session_a.version == session_b.version
+
+    # A records a turn, then B (still on the old copy) stores a prefetch
+    worker_a.append_turn(session_a, SpeakerRole.USER, "What times do you have?")
+    assert worker_a.save(session_a)
+    session_b.prefetched_availability = {"start": "2026-11-04T09:00:00+00:00", "busy": []}
+    assert worker_b.save(session_b)
+
+    assert session_b.version != session_a.version
+    stored = CallSession.from_json(fake_redis.hget("call_session:CA_RACE", "data"))
+    assert [m["content"] for m in stored.messages] == ["Hi Dana", "What times do you have?"]
+    assert stored.prefetched_availability == session_b.prefetched_availability
+
+    # A notices the newer version instead of reusing its local copy
+    current = worker_a.get("CA_RACE")
+    assert current is not session_a
+    assert current.prefetched_availability == session_b.prefetched_availability
+    assert len(current.messages) == 2
+
+
+def test_save_fails_on_version_mismatch_without_overwriting(fake_redis):
+    store = CallSessionStore()
+    store.save(CallSession(call_sid="CA_CAS", call_id=7, lead_id=1))
+    version = fake_redis.hget("call_session:CA_CAS", "version")
+
+    assert store._script("save", SAVE_SCRIPT, ["call_session:CA_CAS"], ["stale", "new", "{}", 60]) == 0
+    assert fake_redis.hget("call_session:CA_CAS", "version") == version
+
+
+def _queue_turns(store: CallSessionStore, count: int) -> None:
+    session = CallSession(call_sid="CA_FLUSH", call_id=7, lead_id=1)
+    for i in range(count):
+        store.append_turn(session, SpeakerRole.USER if i % 2 else SpeakerRole.AI, f"line {i}")
+
+
+@pytest.mark.asyncio
+async def test_failed_write_goes_back_on_the_shared_queue(store, fake_redis, monkeypatch):
+    _queue_turns(store, 3)
+
+    async def unavailable(rows):
+        raise ConnectionError("database is down")
+
+    monkeypatch.setattr(store, "_write_rows", unavailable)
+    assert await store.flush() == 0
+
+    # Back in Redis (not only this process's memory), in the original order
+    queued = [json.loads(raw)["message"] for raw in fake_redis.lrange(PENDING_TURNS_KEY, 0, -1)]
+    assert queued == ["line 0", "line 1", "line 2"]
+    assert store._local_pending == []
+
+
+@pytest.mark.asyncio
+async def test_requeued_rows_are_written_before_newer_ones(store, fake_redis, monkeypatch):
+    _queue_turns(store, 2)
+    written = []
+
+    async def unavailable(rows):
+        raise ConnectionError("database is down")
+
+    async def write(rows):
+        written.extend(row["message"] for row in rows)
+
+    monkeypatch.setattr(store, "_write_rows", unavailable)
+    await store.flush()
+    fake_redis.rpush(PENDING_TURNS_KEY, json.dumps({
+        "call_id": 7, "role": "user", "message": "line 2", "created_at": "2026-11-03T10:00:00+00:00"
+    }))
+    monkeypatch.setattr(store, "_write_rows", write)
+
+    assert await store.flush() == 3
+    assert written == ["line 0", "line 1", "line 2"]
+    assert fake_redis.llen(PENDING_TURNS_KEY) == 0
@@ -0,0 +1,117 @@
+"""Per-day freebusy cache: hits, partial misses and invalidation by generation"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from backend.services import freebusy_cache
+from backend.services.freebusy_cache import FreebusyCache, days_between, split_by_day
+
+CALENDAR = "test-calendar"
+MONDAY = datetime(2026, 11, 2, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def cache(fake_redis, monkeypatch):
+    cache = FreebusyCache()
+    monkeypatch.setattr(freebusy_cache, "_freebusy_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def calendar(cache, monkeypatch):
+    from backend.services.calendar_service import CalendarService
+    from backend.tests.fakes import FakeGoogleCalendar
+
+    google = FakeGoogleCalendar()
+    monkeypatch.setattr(CalendarService, "_authenticate", lambda self: setattr(self, "service", google))
+    service = CalendarService()
+    service.google = google
+    return service
+
+
+def _book(calendar, start: datetime, minutes: int = 60) -> None:
+    calendar.google.insert(calendarId=CALENDAR, body={
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(minutes=minutes)).isoformat()},
+    }).execute()
+
+
+def test_days_between_and_split_by_day_keep_midnight_spanning_intervals_whole():
+    overnight = {"start": "2026-11-02T23:00:00Z", "end": "2026-11-03T01:00:00Z"}
+
+    assert days_between(MONDAY, MONDAY + timedelta(days=2)) == [date(2026, 11, 2), date(2026, 11, 3)]
+    assert split_by_day([overnight], [date(2026, 11, 2), date(2026, 11, 3), date(2026, 11, 4)]) == {
+        date(2026, 11, 2): [overnight],
+        date(2026, 11, 3): [overnight],
+        date(2026, 11, 4): [],
+    }
+
+
+def test_repeat_lookups_are_served_per_day_from_the_cache(calendar, cache):
+    _book(calendar, MONDAY.replace(hour=10))
+
+    first = calendar.get_busy_times(MONDAY, MONDAY + timedelta(days=3), CALENDAR)
+    second = calendar.get_busy_times(MONDAY + timedelta(hours=8), MONDAY + timedelta(days=2), CALENDAR)
+
+    assert first == second == [{"start": "2026-11-02T10:00:00+00:00", "end": "2026-11-02T11:00:00+00:00"}]
+    assert calendar.google.freebusy_queries == 1
+    assert (cache.hits, cache.misses) == (2, 3)
+
+
+def test_only_missing_days_are_fetched(calendar, cache):
+    calendar.get_busy_times(MONDAY, MONDAY + timedelta(days=2), CALENDAR)
+    _book(calendar, (MONDAY + timedelta(days=3)).replace(hour=9))  # Thursday
+
+    busy = calendar.get_busy_times(MONDAY, MONDAY + timedelta(days=4), CALENDAR)
+
+    assert [b["start"] for b in busy] == ["2026-11-05T09:00:00+00:00"]
+    assert calendar.google.freebusy_queries == 2
+    assert cache.hits == 2  # Monday and Tuesday
+
+
+def test_booking_invalidates_the_days_it_touches(calendar, cache):
+    assert calendar.get_busy_times(MONDAY, MONDAY + timedelta(days=2), CALENDAR) == []
+
+    calendar.create_meeting(
+        summary="Demo",
+        start_time=MONDAY.replace(hour=14),
+        end_time=MONDAY.replace(hour=14, minute=30),
+        attendee_email="dana@example.com",
+        calendar_id=CALENDAR,
+    )
+    busy = calendar.get_busy_times(MONDAY, MONDAY + timedelta(days=2), CALENDAR)
+
+    assert [b["start"] for b in busy] == ["2026-11-02T14:00:00+00:00"]
+    assert calendar.google.freebusy_queries == 2
+    assert cache.invalidations == 1
+    assert cache.hits == 1  # Tuesday stayed cached
+
+
+def test_fetch_started_before_an_invalidation_is_not_served(cache):
+    monday = date(2026, 11, 2)
+    _, generations = cache.get_days(CALENDAR, [monday])
+
+    # A booking lands while that freebusy query is in flight
+    cache.invalidate(CALENDAR, MONDAY.replace(hour=10), MONDAY.replace(hour=11))
+    cache.put_days(CALENDAR, {monday: []}, generations)
+
+    hits, misses = cache.get_days(CALENDAR, [monday])
+    assert hits == {}
+    assert misses == {monday: 1}
+
+    cache.put_days(CALENDAR, {monday: [{"start": "10", "end": "11"}]}, misses)
+    assert cache.get_days(CALENDAR, [monday])[0] == {monday: [{"start": "10", "end": "11"}]}
+
+
+def test_without_redis_generations_are_kept_in_process(monkeypatch):
+    from backend.services.cache_service import get_cache_service
+
+    monkeypatch.setattr(get_cache_service(), "redis_client", None)
+    cache = FreebusyCache()
+    monday = date(2026, 11, 2)
+    cache.put_days(CALENDAR, {monday: []}, {monday: 0})
+    assert cache.get_days(CALENDAR, [monday])[0] == {monday: []}
+
+    cache.invalidate(CALENDAR, MONDAY.replace(hour=10), MONDAY.replace(hour=11))
+
+    assert cache.get_days(CALENDAR, [monday]) == ({}, {monday: 1})
@@ -0,0 +1,97 @@
+"""Conversation history windowing and the background summary"""
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.call_session_store import SESSION_KEY_PREFIX, CallSession, CallSessionStore, get_call_session_store
+from backend.services.history_manager import ConversationHistoryManager
+from backend.services.model_router import ModelRouter
+
+
+class _FakeCompletions:
+    async def create(self, **kwargs):
+        message = SimpleNamespace(content="Lead runs a bakery and wants a demo.")
+        usage = SimpleNamespace(prompt_tokens=50, completion_tokens=10, total_tokens=60, prompt_tokens_details=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+@pytest.fixture
+def manager(fake_redis):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=_FakeCompletions()))
+    manager = ConversationHistoryManager(client, ModelRouter())
+    manager.token_budget = 10_000
+    return manager
+
+
+def _conversation(turns: int):
+    history = [{"role": "assistant", "content": "Hi, do you have a minute?"}]
+    for i in range(turns):
+        history += [
+            {"role": "user", "content": f"lead line {i}"},
+            {"role": "assistant", "content": f"ai line {i}"},
+        ]
+    return history
+
+
+def test_window_counts_lead_and_ai_exchanges(manager):
+    manager.max_turns = 3
+    history = _conversation(5)
+
+    window = manager.window(history)
+
+    assert len(window) == 6
+    assert window[0] == {"role": "user", "content": "lead line 2"}
+
+
+def test_short_calls_are_sent_whole(manager):
+    manager.max_turns = 3
+    history = _conversation(3)
+
+    assert manager.window(history) == history
+
+
+@pytest.mark.asyncio
+async def test_summary_is_saved_to_the_session_store(manager, fake_redis):
+    store = get_call_session_store()
+    session = CallSession(call_sid="CA_SUMMARY", call_id=1, lead_id=1, messages=_conversation(5))
+    store.save(session)  # The turn that scheduled the summary
+    version = session.version
+
+    await manager._update_summary(session, session.messages[:5], 5)
+
+    key = f"{SESSION_KEY_PREFIX}CA_SUMMARY"
+    assert fake_redis.hget(key, "summary") == "Lead runs a bakery and wants a demo."
+    assert fake_redis.hget(key, "summarized_count") == "5"
+    assert fake_redis.hget(key, "version") == version  # The session JSON isn't re-saved
+    assert CallSessionStore().get("CA_SUMMARY").summarized_count == 5
+
+
+@pytest.mark.asyncio
+async def test_summary_survives_a_turn_saved_from_an_older_copy(manager, fake_redis):
+    store = get_call_session_store()
+    session = CallSession(call_sid="CA_SUMMARY_2", call_id=1, lead_id=1, messages=_conversation(5))
+    store.save(session)
+    # Another worker is running the next turn on the copy without the summary
+    other = CallSessionStore()
+    turn = other.get("CA_SUMMARY_2")
+
+    await manager._update_summary(session, session.messages[:5], 5)
+    turn.messages += [{"role": "user", "content": "next"}, {"role": "assistant", "content": "reply"}]
+    other.save(turn)
+
+    current = CallSessionStore().get("CA_SUMMARY_2")
+    assert current.summary == "Lead runs a bakery and wants a demo."
+    assert current.summarized_count == 5
+    assert len(current.messages) == len(session.messages) + 2
+
+
+def test_an_older_summary_does_not_replace_a_newer_one(fake_redis):
+    store = get_call_session_store()
+    session = CallSession(call_sid="CA_SUMMARY_3", call_id=1, lead_id=1, messages=_conversation(9))
+    store.save(session)
+
+    store.save_summary(session, "Covers eight messages", 8)
+    store.save_summary(CallSessionStore().get("CA_SUMMARY_3"), "Covers four messages", 4)
+
+    current = CallSessionStore().get("CA_SUMMARY_3")
+    assert (current.summary, current.summarized_count) == ("Covers eight messages", 8)
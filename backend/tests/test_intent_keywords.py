@@ -0,0 +1,33 @@
+"""Keyword fallback for intent classification"""
+import pytest
+
+from backend.utils.intent_keywords import mentions
+
+
+@pytest.mark.parametrize("utterance", [
+    "No, I'm busy",
+    "Sorry, no, busy now",
+    "I'm busy. Not interested.",
+])
+def test_refusals_after_a_clause_break(utterance):
+    assert mentions("not_interested", utterance)
+
+
+@pytest.mark.parametrize("utterance", [
+    "I'm not busy",
+    "I am never busy on Fridays",
+])
+def test_negated_refusals(utterance):
+    assert not mentions("not_interested", utterance)
+
+
+def test_interest_after_a_clause_break():
+    assert mentions("interested", "I don't know, sure")
+
+
+def test_negated_interest():
+    assert not mentions("interested", "I'm not interested")
+
+
+def test_phrases_carry_their_own_negation():
+    assert mentions("not_interested", "No thanks")
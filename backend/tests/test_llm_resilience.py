@@ -0,0 +1,127 @@
+"""
+Deadlines, hedged requests, the circuit breaker and canned fallbacks,
+driven by the fake OpenAI server's injected latency and errors
+"""
+import asyncio
+import time
+
+import pytest
+from openai import APIStatusError
+
+from backend.services import llm_resilience
+from backend.services.call_session_store import CallSession
+from backend.services.llm_resilience import CircuitBreaker, HedgeStats, LLMUnavailableError, canned_reply, hedged_call
+
+MESSAGES = [{"role": "user", "content": "What times do you have?"}]
+
+
+@pytest.fixture
+def openai(monkeypatch):
+    from backend.services import llm_service
+    from backend.tests.fakes import fake_openai_client
+
+    client = fake_openai_client()
+    client.max_retries = 0  # Every injected failure reaches the resilience code
+    monkeypatch.setattr(llm_service, "get_openai_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    breaker = CircuitBreaker(window_seconds=30, min_requests=4, error_rate=0.5, open_seconds=0.2)
+    monkeypatch.setattr(llm_resilience, "_llm_circuit_breaker", breaker)
+    return breaker
+
+
+@pytest.fixture
+def llm(fake_redis, openai, breaker, monkeypatch):
+    from backend.services.llm_service import LLMService, settings
+
+    monkeypatch.setattr(settings, "llm_hedge_enabled", False)
+    monkeypatch.setattr(llm_resilience, "_hedge_stats", HedgeStats())
+    return LLMService()
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_sent_and_wins_when_the_first_request_stalls(openai):
+    faults = openai.fake_app.state.faults
+    faults["slow_ms"] = 3000.0
+    stats = HedgeStats()
+    sent = []
+
+    async def attempt():
+        # Only the first request hits the stall
+        faults["slow_rate"] = 0.0 if sent else 1.0
+        sent.append(time.perf_counter())
+        return await openai.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+
+    started = time.perf_counter()
+    response = await hedged_call(attempt, hedge_delay=0.05, deadline=2.0, stats=stats)
+
+    assert response.choices[0].message.content
+    assert time.perf_counter() - started < 1.0
+    assert len(sent) == 2 and sent[1] - sent[0] >= 0.05
+    assert openai.fake_app.state.counters["slow"] == 1
+    assert stats.snapshot()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_answers_with_the_canned_retry_reply(llm, openai, monkeypatch):
+    from backend.services.llm_service import ConversationIntent, settings
+
+    monkeypatch.setattr(settings, "llm_deadline_seconds", 0.1)
+    openai.fake_app.state.faults["latency_ms"] = 1000.0
+    session = CallSession(call_sid="CA_DEADLINE", call_id=1, lead_id=1, language="fr")
+
+    intent, reply, _ = await llm.get_response_with_tools("Quels créneaux avez-vous ?", [], session=session)
+
+    assert (intent, reply) == (ConversationIntent.NEEDS_INFO, canned_reply("fr", "retry"))
+    assert session.llm_fallbacks == 1
+    assert llm_resilience.get_hedge_stats().snapshot()["deadline_exceeded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_on_5xx_and_429_and_closes_after_a_probe(llm, openai, breaker):
+    faults = openai.fake_app.state.faults
+    counters = openai.fake_app.state.counters
+    route = llm.router.route("small_talk")
+
+    for error_rate, rate_limit_rate in ((1.0, 0.0), (1.0, 0.0), (0.0, 1.0), (0.0, 1.0)):
+        faults.update(error_rate=error_rate, rate_limit_rate=rate_limit_rate)
+        with pytest.raises(APIStatusError):
+            await llm._resilient_completion(route, model=route.model, messages=MESSAGES)
+    assert (counters["errors"], counters["rate_limited"]) == (2, 2)
+    assert breaker.state == "open"
+
+    # Open: refused without a request
+    with pytest.raises(LLMUnavailableError):
+        await llm._resilient_completion(route, model=route.model, messages=MESSAGES)
+    assert counters["requests"] == 4
+
+    # API recovers; after open_seconds one probe goes through and closes it
+    faults.update(error_rate=0.0, rate_limit_rate=0.0)
+    await asyncio.sleep(breaker.open_seconds)
+    response = await llm._resilient_completion(route, model=route.model, messages=MESSAGES)
+
+    assert response.choices[0].message.content
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["times_opened"] == 1
+
+
+@pytest.mark.asyncio
+async def test_call_is_ended_after_max_fallback_replies(llm, openai, breaker, monkeypatch):
+    from backend.services.llm_service import ConversationIntent, settings
+
+    monkeypatch.setattr(settings, "llm_max_fallback_replies", 2)
+    monkeypatch.setattr(breaker, "min_requests", 100)  # Every turn reaches the failing API
+    openai.fake_app.state.faults["error_rate"] = 1.0
+    session = CallSession(call_sid="CA_FALLBACK", call_id=1, lead_id=1, language="es")
+
+    replies = []
+    for turn in range(3):
+        intent, reply, _ = await llm.get_response_with_tools(f"¿Hola? {turn}", [], session=session)
+        replies.append((intent, reply))
+
+    retry = (ConversationIntent.NEEDS_INFO, canned_reply("es", "retry"))
+    assert replies == [retry, retry, (ConversationIntent.END_CALL, canned_reply("es", "callback"))]
+    assert openai.fake_app.state.counters["errors"] == 3
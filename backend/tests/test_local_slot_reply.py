@@ -0,0 +1,48 @@
+"""Slot offers spoken from the local template in the call language"""
+import pytest
+
+from backend.services.call_session_store import CallSession
+
+OFFERED = [
+    {"start": "2026-11-03T10:00:00+00:00", "end": "2026-11-03T10:30:00+00:00"},
+    {"start": "2026-11-04T14:30:00+00:00", "end": "2026-11-04T15:00:00+00:00"},
+]
+DISPLAY = ["Tuesday, November 03 at 10:00 AM", "Wednesday, November 04 at 02:30 PM"]
+TOOL_CALLS = [{"tool": "check_calendar_availability", "result": {"success": True, "available_slots": DISPLAY}}]
+
+
+@pytest.fixture
+def llm(fake_redis, monkeypatch):
+    from backend.services.llm_service import LLMService, settings
+
+    monkeypatch.setattr(settings, "local_slot_reply_enabled", True)
+    return LLMService()
+
+
+@pytest.mark.parametrize("language, expected", [
+    ("en", "I have Tuesday, November 3 at 10:00 AM or Wednesday, November 4 at 2:30 PM. Which works best for you?"),
+    ("he", "יש לי יום שלישי, 3 בנובמבר בשעה 10:00 או יום רביעי, 4 בנובמבר בשעה 14:30. מה הכי נוח לך?"),
+    ("fr", "J'ai mardi 3 novembre à 10h00 ou mercredi 4 novembre à 14h30. Qu'est-ce qui vous convient le mieux ?"),
+    ("es", "Tengo el martes 3 de noviembre a las 10:00 o el miércoles 4 de noviembre a las 14:30. ¿Cuál le viene mejor?"),
+    ("de", "Ich hätte Dienstag, 3. November um 10:00 Uhr oder Mittwoch, 4. November um 14:30 Uhr. Was passt Ihnen am besten?"),
+])
+def test_slots_are_spoken_in_the_call_language(llm, language, expected):
+    session = CallSession(call_sid="CA_SLOTS", call_id=1, lead_id=1, language=language, offered_slots=OFFERED)
+
+    assert llm._local_tool_reply(TOOL_CALLS, session) == expected
+
+
+def test_three_slots_are_separated_before_the_last_or(llm):
+    offered = OFFERED + [{"start": "2026-11-05T09:00:00+00:00", "end": "2026-11-05T09:30:00+00:00"}]
+    session = CallSession(call_sid="CA_SLOTS", call_id=1, lead_id=1, language="es", offered_slots=offered)
+    tool_calls = [{**TOOL_CALLS[0], "result": {"success": True, "available_slots": DISPLAY + ["Thursday"]}}]
+
+    reply = llm._local_tool_reply(tool_calls, session)
+
+    assert "a las 10:00; el miércoles 4 de noviembre a las 14:30 o el jueves 5 de noviembre a las 9:00" in reply
+
+
+def test_without_session_the_display_strings_are_used(llm):
+    assert llm._local_tool_reply(TOOL_CALLS) == (
+        "I have Tuesday, November 03 at 10:00 AM or Wednesday, November 04 at 02:30 PM. Which works best for you?"
+    )
@@ -0,0 +1,44 @@
+"""Per-turn model routing"""
+import pytest
+
+from backend.services.call_session_store import CallSession
+from backend.services.model_router import ModelRouter
+
+OFFER = "I have Tuesday at 10 or Wednesday at 2. Which works?"
+
+
+@pytest.fixture
+def router(fake_redis):
+    return ModelRouter()
+
+
+@pytest.fixture
+def session():
+    session = CallSession(call_sid="CA_A", call_id=1, lead_id=1)
+    session.messages = [
+        {"role": "assistant", "content": "Hi, do you have a minute?"},
+        {"role": "user", "content": "Sure, let's find a time"},
+    ]
+    # check_calendar_availability ran on the turn above
+    session.offered_slots = [{"start": "2026-11-03T10:00:00+00:00", "end": "2026-11-03T10:30:00+00:00"}]
+    session.offered_at = len(session.messages)
+    session.messages.append({"role": "assistant", "content": OFFER})
+    return session
+
+
+def test_answer_to_an_offer_takes_the_tool_route(router, session):
+    assert router.choose("the first one", session.messages, session).name == "tool"
+
+
+def test_offer_stops_routing_once_answered(router, session):
+    session.messages += [
+        {"role": "user", "content": "let me think about it"},
+        {"role": "assistant", "content": "Of course. Anything I can tell you in the meantime?"},
+    ]
+
+    assert router.choose("how much is it", session.messages, session).name == "small_talk"
+
+
+
+def test_small_talk_keeps_the_baseline_token_budget(router):
+    assert router.route("small_talk").max_tokens == router.route("conversation").max_tokens
@@ -0,0 +1,22 @@
+"""OpenAI budget governor counters"""
+import threading
+
+from backend.services.rate_governor import RateGovernor
+
+
+def test_counters_are_exact_across_threads(fake_redis):
+    governor = RateGovernor(rpm=10_000_000, tpm=10_000_000_000, background_reserve=0.0)
+
+    def reserve():
+        for _ in range(200):
+            governor.reserve_background("gpt-4o-mini", 10)
+
+    threads = [threading.Thread(target=reserve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = governor.snapshot()
+    assert snapshot["background_granted"] + snapshot["background_deferred"] == 1600
+    assert snapshot["background_granted"] == 1600
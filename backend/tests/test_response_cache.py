@@ -0,0 +1,39 @@
+"""Response cache keys"""
+import pytest
+
+from backend.services.call_session_store import CallSession
+from backend.services.response_cache import ResponseCache
+
+HISTORY = [{"role": "assistant", "content": "Hi Dana, do you have a minute?"}]
+
+
+def _session(**fields) -> CallSession:
+    return CallSession(call_sid="CA_A", call_id=1, lead_id=1, lead_name="Dana", **fields)
+
+
+def _key(session: CallSession) -> str:
+    return ResponseCache().make_key("who is this", HISTORY, session, "v1")
+
+
+def test_same_stage_shares_a_key():
+    assert _key(_session()) == _key(_session()) is not None
+
+
+@pytest.mark.parametrize("fields", [
+    {"lead_email": "dana@example.com"},
+    {"language": "fr"},
+    {"summary": "Dana runs a bakery.", "summarized_count": 6},
+])
+def test_prompt_state_changes_the_key(fields):
+    assert _key(_session(**fields)) != _key(_session())
+
+
+def test_summary_text_changes_the_key():
+    first = _session(summary="Dana runs a bakery.", summarized_count=6)
+    second = _session(summary="Dana asked about pricing.", summarized_count=6)
+
+    assert _key(first) != _key(second)
+
+
+def test_email_address_itself_is_not_part_of_the_key():
+    assert _key(_session(lead_email="a@example.com")) == _key(_session(lead_email="b@example.com"))
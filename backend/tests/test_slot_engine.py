@@ -0,0 +1,95 @@
+"""Sweep-line slot generation: busy interval merging, working hours, DST offsets"""
+from datetime import datetime, timedelta, timezone
+
+from backend.services.slot_engine import format_slots, generate_slots, merge_busy
+
+MONDAY = datetime(2026, 11, 2, tzinfo=timezone.utc)
+
+
+def _at(day: datetime, hour: int, minute: int = 0) -> datetime:
+    return day.replace(hour=hour, minute=minute)
+
+
+def _busy(start: datetime, end: datetime) -> dict:
+    return {"start": start.isoformat().replace("+00:00", "Z"), "end": end.isoformat().replace("+00:00", "Z")}
+
+
+def _starts(slots) -> list:
+    return [slot_start.strftime("%a %H:%M") for slot_start, _ in slots]
+
+
+def test_overlapping_and_adjacent_intervals_are_merged():
+    merged = merge_busy([
+        _busy(_at(MONDAY, 13), _at(MONDAY, 14)),
+        _busy(_at(MONDAY, 10), _at(MONDAY, 11)),
+        _busy(_at(MONDAY, 10, 30), _at(MONDAY, 11, 15)),  # Overlaps
+        _busy(_at(MONDAY, 11, 15), _at(MONDAY, 12)),  # Touches
+        _busy(_at(MONDAY, 10, 40), _at(MONDAY, 10, 50)),  # Contained
+    ])
+
+    assert merged == [(_at(MONDAY, 10), _at(MONDAY, 12)), (_at(MONDAY, 13), _at(MONDAY, 14))]
+
+
+def test_slots_skip_busy_time_and_realign_after_it():
+    busy = merge_busy([_busy(_at(MONDAY, 9, 10), _at(MONDAY, 10, 5))])
+
+    slots = generate_slots(_at(MONDAY, 0), _at(MONDAY, 12), 30, busy)
+
+    # 09:00 and 09:30 overlap the meeting; the next boundary after 10:05 is 10:30
+    assert _starts(slots) == ["Mon 10:30", "Mon 11:00", "Mon 11:30"]
+
+
+def test_slots_stay_inside_working_hours_and_jump_to_the_next_day():
+    slots = generate_slots(_at(MONDAY, 16), _at(MONDAY + timedelta(days=1), 9, 30), 60, [])
+
+    # 16:00-17:00 is the last slot that ends by 17:00; then 09:00 next morning
+    assert _starts(slots) == ["Mon 16:00", "Tue 09:00"]
+    assert all(slot_end - slot_start == timedelta(minutes=60) for slot_start, slot_end in slots)
+
+
+def test_range_start_is_rounded_up_to_the_granularity():
+    slots = generate_slots(_at(MONDAY, 9, 7), _at(MONDAY, 10, 30), 30, [], granularity_minutes=15)
+
+    assert _starts(slots) == ["Mon 09:15", "Mon 09:30", "Mon 09:45", "Mon 10:00", "Mon 10:15"]
+
+
+def test_limit_stops_the_sweep():
+    slots = generate_slots(MONDAY, MONDAY + timedelta(days=5), 30, [], limit=3)
+
+    assert _starts(slots) == ["Mon 09:00", "Mon 09:30", "Mon 10:00"]
+
+
+def test_busy_intervals_with_dst_offsets_block_the_right_utc_cells():
+    # Europe/Berlin leaves DST on 2026-10-25: +02:00 before, +01:00 after
+    saturday = datetime(2026, 10, 24, tzinfo=timezone.utc)
+    busy = merge_busy([
+        {"start": "2026-10-24T11:00:00+02:00", "end": "2026-10-24T12:00:00+02:00"},  # 09:00-10:00 UTC
+        {"start": "2026-10-26T10:00:00+01:00", "end": "2026-10-26T11:00:00+01:00"},  # 09:00-10:00 UTC
+        # Written with both offsets, overlapping in UTC across the switch night
+        {"start": "2026-10-25T01:30:00+02:00", "end": "2026-10-25T02:30:00+01:00"},
+        {"start": "2026-10-25T01:00:00+01:00", "end": "2026-10-25T03:00:00+01:00"},
+    ])
+
+    assert busy[1] == (
+        datetime(2026, 10, 24, 23, 30, tzinfo=timezone.utc),
+        datetime(2026, 10, 25, 2, 0, tzinfo=timezone.utc),
+    )
+
+    slots = generate_slots(saturday, saturday + timedelta(days=3), 60, busy)
+    first_per_day = {}
+    for slot_start, _ in slots:
+        first_per_day.setdefault(slot_start.date().isoformat(), slot_start.astimezone(timezone.utc).strftime("%H:%M"))
+
+    # Working hours are UTC, unaffected by the local clock change
+    assert first_per_day == {"2026-10-24": "10:00", "2026-10-25": "09:00", "2026-10-26": "10:00"}
+    assert len(slots) == 13 + 15 + 13
+
+
+def test_format_slots_keeps_iso_times():
+    formatted = format_slots([(_at(MONDAY, 10), _at(MONDAY, 10, 30))])
+
+    assert formatted == [{
+        "start": "2026-11-02T10:00:00+00:00",
+        "end": "2026-11-02T10:30:00+00:00",
+        "display": "Monday, November 02 at 10:00 AM",
+    }]
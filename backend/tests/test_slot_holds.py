@@ -0,0 +1,142 @@
+"""Slot holds: the Lua check-and-set scripts against (fake) Redis"""
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.services.slot_holds import BOOKED_PREFIX, SlotHolds
+
+CALENDAR = "test-calendar"
+START = datetime(2026, 11, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def _slot(start: datetime, minutes: int = 30) -> dict:
+    return {"start": start.isoformat(), "end": (start + timedelta(minutes=minutes)).isoformat()}
+
+
+@pytest.fixture
+def holds(fake_redis):
+    return SlotHolds()
+
+
+def test_offers_skip_slots_held_by_other_calls(holds):
+    candidates = [_slot(START + timedelta(minutes=30 * i)) for i in range(4)]
+
+    first = holds.hold_offers("CA_A", CALENDAR, candidates, 2)
+    second = holds.hold_offers("CA_B", CALENDAR, candidates, 2)
+
+    assert first == candidates[:2]
+    assert second == candidates[2:]
+    assert holds.counters["skipped"] == 2
+
+
+def test_overlapping_durations_conflict(holds):
+    holds.hold_offers("CA_A", CALENDAR, [_slot(START, 60)], 1)
+
+    assert holds.hold_offers("CA_B", CALENDAR, [_slot(START + timedelta(minutes=30))], 1) == []
+
+
+def test_racing_claims_have_one_winner(holds):
+    end = START + timedelta(minutes=30)
+    barrier = threading.Barrier(8)
+    results = {}
+
+    def claim(call_sid):
+        barrier.wait()
+        results[call_sid] = holds.claim(call_sid, CALENDAR, START, end)
+
+    threads = [threading.Thread(target=claim, args=(f"CA_{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    winners = [call_sid for call_sid, won in results.items() if won]
+    assert len(winners) == 1
+    assert holds.redis.get(SlotHolds.cell_keys(CALENDAR, START, end)[0]) == f"{BOOKED_PREFIX}{winners[0]}"
+
+
+def test_claim_respects_other_calls_holds(holds):
+    holds.hold_offers("CA_A", CALENDAR, [_slot(START)], 1)
+
+    assert not holds.claim("CA_B", CALENDAR, START, START + timedelta(minutes=30))
+    assert holds.claim("CA_A", CALENDAR, START, START + timedelta(minutes=30))
+
+
+def test_release_call_keeps_booked_markers(holds):
+    booked, other = _slot(START), _slot(START + timedelta(hours=1))
+    holds.hold_offers("CA_A", CALENDAR, [booked, other], 2)
+    booked_end = START + timedelta(minutes=30)
+    assert holds.claim("CA_A", CALENDAR, START, booked_end)
+
+    holds.release_call("CA_A")
+
+    booked_key = SlotHolds.cell_keys(CALENDAR, START, booked_end)[0]
+    other_key = SlotHolds.cell_keys(
+        CALENDAR, datetime.fromisoformat(other["start"]), datetime.fromisoformat(other["end"])
+    )[0]
+    assert holds.redis.get(booked_key) == f"{BOOKED_PREFIX}CA_A"
+    assert holds.redis.get(other_key) is None
+    assert not holds.redis.exists("slot_holds_by_call:CA_A")
+    # Another call can take the released slot but not the booked one
+    assert holds.hold_offers("CA_B", CALENDAR, [booked, other], 2) == [other]
+
+
+def test_release_call_keeps_current_offers(holds):
+    first, second = _slot(START), _slot(START + timedelta(hours=1))
+    holds.hold_offers("CA_A", CALENDAR, [first], 1)
+    holds.hold_offers("CA_A", CALENDAR, [second], 1)  # Re-offer releases the first
+
+    assert holds.hold_offers("CA_B", CALENDAR, [first, second], 2) == [first]
+
+
+def test_release_claim_drops_only_the_owners_marker(holds):
+    end = START + timedelta(minutes=30)
+    key = SlotHolds.cell_keys(CALENDAR, START, end)[0]
+    assert holds.claim("CA_A", CALENDAR, START, end)
+
+    holds.release_claim("CA_B", CALENDAR, START, end)
+    assert holds.redis.get(key) == f"{BOOKED_PREFIX}CA_A"
+
+    holds.release_claim("CA_A", CALENDAR, START, end)
+    assert holds.redis.get(key) is None
+
+
+def test_holds_expire(holds, fake_redis):
+    holds.hold_offers("CA_A", CALENDAR, [_slot(START)], 1)
+    key = SlotHolds.cell_keys(CALENDAR, START, START + timedelta(minutes=30))[0]
+
+    assert 0 < fake_redis.pttl(key) <= 300 * 1000
+
+
+class _UnconfirmableCalendar:
+    """CalendarService stand-in whose freebusy query fails (returns None)"""
+
+    created = 0
+
+    def get_busy_times(self, start_date, end_date, calendar_id=None, use_cache=True):
+        return None
+
+    def create_meeting(self, **kwargs):
+        self.created += 1
+        return {"event_id": "evt"}
+
+
+@pytest.mark.asyncio
+async def test_booking_is_refused_when_google_cannot_confirm(holds, monkeypatch):
+    from backend.services import llm_service
+    from backend.services.call_session_store import CallSession
+
+    monkeypatch.setattr(llm_service, "get_slot_holds", lambda: holds)
+    calendar = _UnconfirmableCalendar()
+    llm = llm_service.LLMService(calendar_service=calendar)
+    session = CallSession(call_sid="CA_A", call_id=1, lead_id=1)
+
+    result = await llm._book_meeting(
+        {"datetime": START.isoformat(), "guest_email": "lead@example.com", "guest_name": "Lead"}, session
+    )
+
+    assert not result["success"]
+    assert calendar.created == 0
+    # The claim was released: another call can book the time
+    assert holds.claim("CA_B", CALENDAR, START, START + timedelta(minutes=30))
@@ -0,0 +1,123 @@
+"""Free-slot index: cell bitmap, incremental sync and the 410 full resync"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.services.slot_index import SlotIndex, build_bitmap, busy_runs, event_interval
+
+CALENDAR = "test-calendar"
+BASE = datetime(2026, 11, 2, tzinfo=timezone.utc)
+CELL = timedelta(minutes=30)
+
+
+def _cells(bitmap: bytes, cells: int) -> list:
+    return [i for i in range(cells) if bitmap[i >> 3] & (0x80 >> (i & 7))]
+
+
+def test_bitmap_marks_every_cell_an_interval_touches():
+    bitmap = build_bitmap([
+        (BASE + timedelta(hours=10, minutes=10), BASE + timedelta(hours=11)),  # Cells 20-21
+        (BASE + timedelta(hours=11), BASE + timedelta(hours=11, minutes=30)),  # Cell 22, adjacent
+        (BASE - timedelta(hours=1), BASE + timedelta(minutes=15)),  # Clipped to cell 0
+        (BASE + timedelta(hours=23, minutes=45), BASE + timedelta(days=2)),  # Clipped to cell 47
+    ], BASE, 48, CELL)
+
+    assert len(bitmap) == 6
+    assert _cells(bitmap, 48) == [0, 20, 21, 22, 47]
+    assert busy_runs(bitmap, BASE, 48, CELL) == [
+        (BASE, BASE + CELL),
+        (BASE + timedelta(hours=10), BASE + timedelta(hours=11, minutes=30)),
+        (BASE + timedelta(hours=23, minutes=30), BASE + timedelta(days=1)),
+    ]
+
+
+def test_free_declined_and_cancelled_events_block_nothing():
+    timed = {"start": {"dateTime": "2026-11-02T11:00:00+01:00"}, "end": {"dateTime": "2026-11-02T12:00:00+01:00"}}
+
+    assert event_interval(timed) == (BASE + timedelta(hours=10), BASE + timedelta(hours=11))
+    assert event_interval({**timed, "transparency": "transparent"}) is None
+    assert event_interval({**timed, "status": "cancelled"}) is None
+    assert event_interval({**timed, "attendees": [{"self": True, "responseStatus": "declined"}]}) is None
+
+
+@pytest.fixture
+def google(fake_redis, monkeypatch):
+    from backend.services.calendar_service import CalendarService
+    from backend.tests.fakes import FakeGoogleCalendar
+
+    google = FakeGoogleCalendar()
+    monkeypatch.setattr(CalendarService, "_authenticate", lambda self: setattr(self, "service", google))
+    google.calendar_service = CalendarService()
+    return google
+
+
+@pytest.fixture
+def index(google):
+    return SlotIndex()
+
+
+def _tomorrow(hour: int) -> datetime:
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today + timedelta(days=1, hours=hour)
+
+
+def _insert(google, start: datetime, minutes: int = 60) -> str:
+    return google.insert(calendarId=CALENDAR, body={
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(minutes=minutes)).isoformat()},
+    }).execute()["id"]
+
+
+def _free_starts(index: SlotIndex, start: datetime, hours: int) -> list:
+    slots = index.free_slots(CALENDAR, start, start + timedelta(hours=hours), 30)
+    return [slot["start"][11:16] for slot in slots]
+
+
+def test_sync_sets_and_clears_cells(index, google):
+    event_id = _insert(google, _tomorrow(10))
+
+    assert index.refresh(google.calendar_service, CALENDAR)["mode"] == "full"
+    assert _free_starts(index, _tomorrow(9), 3) == ["09:00", "09:30", "11:00", "11:30"]
+
+    # Cancelled in Google: the incremental sync frees its cells
+    google.cancel(event_id)
+    result = index.refresh(google.calendar_service, CALENDAR)
+
+    assert (result["mode"], result["busy_cells"]) == ("incremental", 0)
+    assert _free_starts(index, _tomorrow(9), 3) == ["09:00", "09:30", "10:00", "10:30", "11:00", "11:30"]
+
+
+def test_booking_marks_cells_before_the_next_sync(index, google):
+    index.refresh(google.calendar_service, CALENDAR)
+
+    index.mark_busy(CALENDAR, "evt_booked", _tomorrow(9), _tomorrow(9) + timedelta(minutes=30))
+
+    assert _free_starts(index, _tomorrow(9), 1) == ["09:30"]
+    assert index.counters["marked"] == 1
+
+
+def test_expired_sync_token_triggers_a_full_resync(index, google):
+    _insert(google, _tomorrow(10))
+    index.refresh(google.calendar_service, CALENDAR)
+    _insert(google, _tomorrow(12))
+
+    google.expire_sync_tokens()  # Next syncToken listing gets 410 Gone
+    result = index.refresh(google.calendar_service, CALENDAR)
+
+    assert result == {"mode": "full", "events": 2, "busy_cells": 4}
+    assert (index.counters["full_syncs"], index.counters["incremental_syncs"]) == (2, 0)
+    assert _free_starts(index, _tomorrow(9), 4) == ["09:00", "09:30", "11:00", "11:30"]
+
+    # The new token from the full listing works again
+    assert index.refresh(google.calendar_service, CALENDAR)["mode"] == "incremental"
+
+
+def test_stale_or_missing_index_is_not_used(index, google, monkeypatch):
+    from backend.services import slot_index
+
+    assert index.free_slots(CALENDAR, _tomorrow(9), _tomorrow(12), 30) is None
+    index.refresh(google.calendar_service, CALENDAR)
+
+    monkeypatch.setattr(slot_index.settings, "slot_index_max_age_seconds", -1)
+    assert index.free_slots(CALENDAR, _tomorrow(9), _tomorrow(12), 30) is None
+    assert (index.counters["unavailable"], index.counters["stale"]) == (1, 1)
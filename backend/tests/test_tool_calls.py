@@ -0,0 +1,32 @@
+"""Executing the model's tool calls"""
+import json
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_malformed_arguments_fail_only_that_call(fake_redis, monkeypatch):
+    from backend.services.llm_service import LLMService
+
+    llm = LLMService()
+    executed = []
+
+    async def execute(tool_name, tool_args, session=None):
+        executed.append((tool_name, tool_args))
+        return {"success": True, "available_slots": []}
+
+    monkeypatch.setattr(llm, "_execute_tool", execute)
+    calls = [
+        {"id": "call_1", "name": "book_meeting", "arguments": '{"datetime": "2026-11-03T10:'},
+        {"id": "call_2", "name": "check_calendar_availability", "arguments": '{"num_slots": 3}'},
+    ]
+    messages = []
+
+    tool_calls = await llm._run_tool_calls(calls, messages)
+
+    assert executed == [("check_calendar_availability", {"num_slots": 3})]
+    assert "Invalid arguments for book_meeting" in tool_calls[0]["result"]["error"]
+    assert tool_calls[1]["result"]["success"]
+    # The echoed assistant message stays valid JSON for the follow-up request
+    assert messages[0]["tool_calls"][0]["function"]["arguments"] == "{}"
+    assert "Invalid arguments" in json.loads(messages[1]["content"])["error"]
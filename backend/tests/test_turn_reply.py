@@ -0,0 +1,34 @@
+"""Structured turn replies that don't parse must never be spoken as JSON"""
+import pytest
+
+from backend.services.llm_service import _salvage_reply
+
+
+def test_plain_text_is_kept():
+    assert _salvage_reply("  Sure, tomorrow works.  ") == "Sure, tomorrow works."
+
+
+def test_malformed_json_with_complete_reply():
+    content = '{"reply": "Great, I will send the invite.", "intent": "INTER'
+    assert _salvage_reply(content) == "Great, I will send the invite."
+
+
+def test_truncated_reply_keeps_complete_sentences():
+    content = '{"reply": "Sure, I can help. We work with teams like yours and'
+    assert _salvage_reply(content) == "Sure, I can help."
+
+
+def test_truncated_escapes_are_decoded():
+    content = '{"reply": "He said \\"hi\\". Then \\u05'
+    assert _salvage_reply(content) == 'He said "hi".'
+
+
+@pytest.mark.parametrize("content", [
+    '{"reply": "Sure, we work with teams like',
+    '{"intent": "INTERESTED"',
+    '{"reply": ',
+    "",
+    None,
+])
+def test_nothing_usable(content):
+    assert _salvage_reply(content) is None
@@ -0,0 +1,66 @@
+"""Precompiled TwiML templates render exactly what the VoiceResponse builders do"""
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from backend.services.twilio_service import TwilioService
+from backend.utils.twiml_renderer import TwimlTemplate, TwimlTemplateCache, escape_text
+
+TEXTS = [
+    "Does Tuesday at 10 work for you?",
+    "Tom & Jerry's \"best\" <deal> is > 5 & < 10",
+    "מחר ב-10:00 & ביום שלישי \"בבוקר\"",
+    "'single' and \"double\" quotes, &amp; already escaped",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("language", ["en", "he"])
+def test_gather_template_matches_builder(text, language):
+    rendered = TwilioService.generate_twiml_response(text, language, end_call=False)
+
+    assert rendered == TwilioService.build_twiml_response(text, language, end_call=False).replace(
+        "<Say language=\"en-US\" />", "<Say language=\"en-US\"></Say>"
+    )
+    gather = ET.fromstring(rendered).find("Gather")
+    assert (gather.find("Say").text or "") == text
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_say_hangup_template_matches_builder(text):
+    rendered = TwilioService.generate_twiml_response(text, "en", end_call=True)
+
+    assert rendered == TwilioService.build_twiml_response(text, "en", end_call=True).replace(
+        "<Say language=\"en-US\" />", "<Say language=\"en-US\"></Say>"
+    )
+    root = ET.fromstring(rendered)
+    assert [child.tag for child in root] == ["Say", "Hangup"]
+    assert (root.find("Say").text or "") == text
+
+
+@pytest.mark.parametrize("text", TEXTS[:4])
+def test_redirect_template_matches_builder(text):
+    url = "https://calls.example.com/api/webhooks/twilio/process-speech/continue?attempt=2&lang=en"
+    templates = TwimlTemplateCache(TwilioService.generate_twiml_interim)
+
+    rendered = templates.render(text, url, "en")
+
+    assert rendered == TwilioService.generate_twiml_interim(text, url, "en")
+    assert "attempt=2&amp;lang=en" in rendered  # Escaped once, in the static part
+    root = ET.fromstring(rendered)
+    assert root.find("Say").text == text
+    assert root.find("Redirect").text == url
+
+
+def test_escape_text_matches_element_tree():
+    text = "a & b < c > d \"e\" 'f'"
+    element = ET.Element("Say")
+    element.text = text
+
+    assert ET.tostring(element, encoding="unicode") == f"<Say>{escape_text(text)}</Say>"
+
+
+def test_builder_must_use_the_text_once():
+    with pytest.raises(ValueError):
+        TwimlTemplate.compile(lambda text: f"<Response><Say>{text}</Say><Say>{text}</Say></Response>")
@@ -0,0 +1,223 @@
+"""
+A whole Gather call against the Twilio, OpenAI and Google Calendar fakes:
+answer -> lead asks for times -> slots offered -> booking -> status callback,
+plus slow turns answered with a filler and picked up on the continuation
+
+Runs the real webhook routes, LLMService and CalendarService; only the
+external APIs are fake. State lives in fakeredis and a SQLite database.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from sqlalchemy import func, select
+
+from backend.models import Call, CallOutcome, ConversationHistory, Lead, Meeting
+
+CALL_SID = "CA_FLOW"
+
+
+@pytest_asyncio.fixture
+async def flow(tmp_path, fake_redis, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    from backend.api.routes import webhooks
+    from backend.database import get_async_db
+    from backend.models.base import Base
+    from backend.services import call_session_store, llm_service
+    from backend.services.calendar_service import CalendarService
+    from backend.services.service_registry import get_llm_service
+    from backend.tests.fakes import FakeGoogleCalendar, TwilioWebhookClient, fake_openai_client
+
+    # Database
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'calls.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    monkeypatch.setattr(webhooks, "AsyncSessionLocal", sessions)
+    monkeypatch.setattr(call_session_store, "AsyncSessionLocal", sessions)
+
+    async with sessions() as db:
+        lead = Lead(name="Dana Levi", phone="+15551234567", email="dana@example.com", language="en")
+        db.add(lead)
+        await db.flush()
+        call = Call(lead_id=lead.id, twilio_call_sid=CALL_SID, language="en")
+        db.add(call)
+        await db.commit()
+
+    # Google Calendar and OpenAI
+    google = FakeGoogleCalendar()
+    monkeypatch.setattr(CalendarService, "_authenticate", lambda self: setattr(self, "service", google))
+    openai = fake_openai_client()
+    monkeypatch.setattr(llm_service, "get_openai_client", lambda: openai)
+    llm = llm_service.LLMService(calendar_service=CalendarService())
+
+    # Celery isn't running; record the finalize task instead
+    finalized = []
+    monkeypatch.setattr(
+        webhooks, "finalize_call", SimpleNamespace(apply_async=lambda args, countdown: finalized.append(args))
+    )
+
+    async def db_dependency():
+        async with sessions() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(webhooks.router, prefix="/api/webhooks")
+    app.dependency_overrides[get_async_db] = db_dependency
+    app.dependency_overrides[get_llm_service] = lambda: llm
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield SimpleNamespace(
+            twilio=TwilioWebhookClient(http, CALL_SID),
+            script=openai.fake_app.state.faults["script"],
+            faults=openai.fake_app.state.faults,
+            openai_counters=openai.fake_app.state.counters,
+            google=google,
+            sessions=sessions,
+            call_id=call.id,
+            finalized=finalized,
+        )
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_gather_reply_book_and_hang_up(flow):
+    from backend.services.call_session_store import get_call_session_store
+
+    store = get_call_session_store()
+
+    response = await flow.twilio.answer()
+    assert response.status_code == 200
+    assert "Dana" in response.text and "<Gather" in response.text
+
+    # Lead asks for times: the model checks the calendar, then offers them
+    flow.script.extend([
+        {"tool_calls": [{
+            "name": "check_calendar_availability",
+            "arguments": json.dumps({"preferred_date": "tomorrow", "num_slots": 2}),
+        }]},
+        {"reply": "I have two times tomorrow. Which one works for you?", "intent": "SCHEDULE_MEETING"},
+    ])
+    response = await flow.twilio.say("Sure, what times do you have?", token="turn-1")
+    assert "I have two times tomorrow" in response.text
+    assert "<Gather" in response.text
+    assert flow.script == []
+    offered = store.get(CALL_SID).offered_slots
+    assert len(offered) == 2
+
+    # Twilio retries the same request: replayed, no new completion
+    requests = flow.openai_counters["requests"]
+    retry = await flow.twilio.say("Sure, what times do you have?", token="turn-1")
+    assert retry.text == response.text
+    assert flow.openai_counters["requests"] == requests
+
+    # Lead picks the first slot: the model books it and says goodbye
+    flow.script.extend([
+        {"tool_calls": [{
+            "name": "book_meeting",
+            "arguments": json.dumps({
+                "datetime": offered[0]["start"],
+                "guest_email": "dana@example.com",
+                "guest_name": "Dana Levi",
+            }),
+        }]},
+        {
+            "reply": "You're booked, the invite is on its way. Talk to you then!",
+            "intent": "MEETING_BOOKED",
+            "end_call": True,
+        },
+    ])
+    response = await flow.twilio.say("The first one works", token="turn-2")
+    assert "You're booked" in response.text
+    assert "<Gather" not in response.text and "<Hangup" in response.text
+    assert [event["start"]["dateTime"] for event in flow.google.events_created] == [offered[0]["start"]]
+
+    # Call ends
+    response = await flow.twilio.status("completed", duration=95)
+    assert response.json() == {"status": "ok"}
+    assert flow.finalized == [[flow.call_id]]
+    assert store.get(CALL_SID) is None
+
+    async with flow.sessions() as db:
+        call = await db.get(Call, flow.call_id)
+        meeting = await db.scalar(select(Meeting).where(Meeting.call_id == flow.call_id))
+        turns = await db.scalar(
+            select(func.count()).select_from(ConversationHistory).where(ConversationHistory.call_id == flow.call_id)
+        )
+    assert call.outcome == CallOutcome.INTERESTED
+    assert call.ended_at is not None and call.duration == 95
+    assert meeting.calendar_event_id == flow.google.events_created[0]["id"]
+    assert meeting.guest_email == "dana@example.com"
+    assert turns == 5  # Opening line + two lead turns + two replies
+
+
+@pytest_asyncio.fixture
+async def slow_turns(flow, monkeypatch):
+    """Interim responses on, with the fake OpenAI slower than the latency budget"""
+    from backend.config import get_settings
+
+    monkeypatch.setattr(get_settings(), "interim_response_enabled", True)
+    monkeypatch.setattr(get_settings(), "interim_latency_budget_ms", 50)
+    flow.faults["latency_ms"] = 300.0
+    await flow.twilio.answer()
+    flow.script.append({"reply": "Tuesday at ten works for me.", "intent": "SCHEDULE_MEETING"})
+    return flow
+
+
+async def _reply_parked(fake_redis) -> None:
+    from backend.services.call_session_store import PENDING_REPLY_KEY_PREFIX
+
+    for _ in range(100):
+        if fake_redis.exists(f"{PENDING_REPLY_KEY_PREFIX}{CALL_SID}"):
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError("background turn never parked its reply")
+
+
+@pytest.mark.asyncio
+async def test_slow_turn_answers_with_a_filler(slow_turns, fake_redis):
+    from backend.api.routes.webhooks import INTERIM_PHRASES
+
+    response = await slow_turns.twilio.say("Do you have anything on Tuesday?")
+
+    assert INTERIM_PHRASES["en"] in response.text
+    assert "process-speech/continue?attempt=1" in response.text
+    assert "Tuesday at ten" not in response.text
+    await _reply_parked(fake_redis)  # Let the background turn finish
+
+
+@pytest.mark.asyncio
+async def test_continuation_serves_the_parked_reply_once(slow_turns, fake_redis):
+    from backend.services.call_session_store import get_call_session_store
+
+    await slow_turns.twilio.say("Do you have anything on Tuesday?")
+    await _reply_parked(fake_redis)
+
+    response = await slow_turns.twilio.continue_turn(attempt=1)
+
+    assert "Tuesday at ten works for me." in response.text
+    assert "<Gather" in response.text
+    assert get_call_session_store().pop_pending_reply(CALL_SID) is None
+    # The background turn's save kept the conversation
+    assert get_call_session_store().get(CALL_SID).messages[-1]["content"] == "Tuesday at ten works for me."
+
+
+@pytest.mark.asyncio
+async def test_early_continuation_gets_another_filler(slow_turns, fake_redis):
+    from backend.api.routes.webhooks import INTERIM_PHRASES
+
+    await slow_turns.twilio.say("Do you have anything on Tuesday?")
+
+    early = await slow_turns.twilio.continue_turn(attempt=1)
+    assert INTERIM_PHRASES["en"] in early.text
+    assert "process-speech/continue?attempt=2" in early.text
+
+    await _reply_parked(fake_redis)
+    response = await slow_turns.twilio.continue_turn(attempt=2)
+    assert "Tuesday at ten works for me." in response.text
@@ -0,0 +1,105 @@
+"""Twilio retries of the Gather webhook are answered from the replay cache"""
+import asyncio
+
+import pytest
+
+from backend.api.routes.webhooks import _replay_or_process
+
+FORM = {"CallSid": "CA_REPLAY", "SpeechResult": "Tuesday works"}
+
+
+class _TwilioRequest:
+    """The parts of a Starlette request _replay_or_process uses"""
+
+    def __init__(self, form, token="idem-1"):
+        self._form = form
+        self.headers = {"i-twilio-idempotency-token": token}
+
+    async def form(self):
+        return self._form
+
+
+class _Turn:
+    """Stands in for the LLM turn; counts how often it runs"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, form_data):
+        self.calls += 1
+        await self.release.wait()
+        return f"<Response><Say>Reply {self.calls} to {form_data['SpeechResult']}</Say></Response>"
+
+
+@pytest.fixture
+def turn(fake_redis):
+    return _Turn()
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_the_cached_twiml(turn):
+    first = await _replay_or_process(_TwilioRequest(FORM), turn)
+    retry = await _replay_or_process(_TwilioRequest(FORM), turn)
+
+    assert turn.calls == 1
+    assert retry.body == first.body
+    assert b"Reply 1" in retry.body
+
+
+@pytest.mark.asyncio
+async def test_new_gather_on_the_same_call_is_processed(turn):
+    await _replay_or_process(_TwilioRequest(FORM, token="idem-2"), turn)
+    await _replay_or_process(_TwilioRequest({**FORM, "SpeechResult": "Actually, Wednesday"}, token="idem-3"), turn)
+
+    assert turn.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_waits_for_the_first_result(turn):
+    turn.release.clear()
+    original = asyncio.create_task(_replay_or_process(_TwilioRequest(FORM, token="idem-4"), turn))
+    await asyncio.sleep(0.05)
+    duplicate = asyncio.create_task(_replay_or_process(_TwilioRequest(FORM, token="idem-4"), turn))
+    await asyncio.sleep(0.2)
+    assert not duplicate.done()  # Waiting, not answered with a filler
+
+    turn.release.set()
+    first, second = await asyncio.gather(original, duplicate)
+
+    assert turn.calls == 1
+    assert second.body == first.body
+
+
+@pytest.mark.asyncio
+async def test_failed_turn_releases_the_claim(turn):
+    async def failing(form_data):
+        raise RuntimeError("LLM unavailable")
+
+    with pytest.raises(RuntimeError):
+        await _replay_or_process(_TwilioRequest(FORM, token="idem-5"), failing)
+    response = await _replay_or_process(_TwilioRequest(FORM, token="idem-5"), turn)
+
+    assert turn.calls == 1
+    assert b"Reply 1" in response.body
+
+
+@pytest.mark.asyncio
+async def test_duplicate_still_in_flight_gets_a_filler_in_the_call_language(turn, monkeypatch):
+    from backend.services.call_session_store import CallSession, get_call_session_store
+    from backend.services.webhook_idempotency import get_webhook_replay_cache
+
+    get_call_session_store().save(CallSession(call_sid="CA_REPLAY_FR", call_id=1, lead_id=1, language="fr"))
+    monkeypatch.setattr(get_webhook_replay_cache(), "wait_seconds", 0.2)
+    form = {**FORM, "CallSid": "CA_REPLAY_FR"}
+    turn.release.clear()
+    original = asyncio.create_task(_replay_or_process(_TwilioRequest(form, token="idem-6"), turn))
+    await asyncio.sleep(0.05)
+
+    duplicate = await _replay_or_process(_TwilioRequest(form, token="idem-6"), turn)
+    turn.release.set()
+    await original
+
+    assert "Pardon" in duplicate.body.decode()
+    assert turn.calls == 1
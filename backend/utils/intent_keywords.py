@@ -0,0 +1,99 @@
+"""
+Compiled keyword matchers for intent classification
+
+Fallback for turns where the model's structured intent is unavailable
+(streamed replies, local templates, malformed JSON). Matches whole words or
+phrases in all supported call languages, and ignores single-word keywords
+negated within the same clause ("I'm not busy" is not a refusal, "No, I'm
+busy" is). The "scheduling" group also drives model routing
+(backend.services.model_router).
+"""
+import re
+from typing import Dict, Iterable, Pattern
+
+KEYWORDS: Dict[str, Iterable[str]] = {
+    "goodbye": [
+        # en
+        "goodbye", "bye", "talk to you then", "see you then",
+        "looking forward to our meeting", "have a great day",
+        "thank you for your time", "speak to you soon", "catch you later",
+        # he / fr / es / de
+        "להתראות", "ביי", "יום טוב",
+        "au revoir", "bonne journée", "à bientôt",
+        "adiós", "hasta luego", "que tenga un buen día",
+        "auf wiedersehen", "tschüss", "schönen tag",
+    ],
+    "not_interested": [
+        "not interested", "no thanks", "not now", "busy", "don't call", "remove me",
+        "לא מעוניין", "לא מעוניינת", "תסירו אותי",
+        "pas intéressé", "pas intéressée", "non merci", "ne m'appelez plus",
+        "no me interesa", "no gracias", "no estoy interesado", "no me llame",
+        "kein interesse", "nein danke", "rufen sie nicht mehr an",
+    ],
+    "interested": [
+        "yes", "sure", "okay", "interested", "tell me more",
+        "כן", "בטח", "מעוניין", "מעוניינת",
+        "oui", "d'accord", "intéressé", "intéressée",
+        "sí", "claro", "vale", "me interesa",
+        "ja", "gerne", "klar", "interessiert",
+    ],
+    "booking_confirmed": [
+        "confirmed", "calendar invite sent",
+    ],
+    "scheduling": [
+        "schedule", "book", "meeting", "appointment", "available", "availability",
+        "calendar", "what time", "tomorrow", "next week", "this week",
+        "monday", "tuesday", "wednesday", "thursday", "friday", "morning", "afternoon",
+        "פגישה", "לקבוע", "זמין", "זמינה", "מחר", "שבוע הבא",
+        "rendez-vous", "réunion", "disponible", "demain", "la semaine prochaine",
+        "reunión", "cita", "agendar", "mañana", "la próxima semana",
+        "termin", "besprechung", "verfügbar", "morgen", "nächste woche",
+    ],
+}
+
+# Words that flip the meaning of the keyword right after them
+NEGATORS = {
+    "not", "no", "never", "don't", "dont", "isn't", "aren't", "wasn't",
+    "לא", "pas", "jamais", "nunca", "nicht", "kein", "keine", "nie",
+}
+
+# Keywords are matched as whole words/phrases; \w is Unicode-aware in Python 3
+_PATTERNS: Dict[str, Pattern[str]] = {
+    kind: re.compile(
+        r"(?<!\w)(?:" + "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)) + r")(?!\w)",
+        re.IGNORECASE
+    )
+    for kind, words in KEYWORDS.items()
+}
+
+_WORD = re.compile(r"[\w']+")
+
+# Negation doesn't carry across a clause break ("No, I'm busy" is a refusal)
+_CLAUSE_BREAK = re.compile(r"[,.;!?¡¿]")
+
+
+def _negated(text: str, position: int) -> bool:
+    """True if one of the two words before position, within the same clause, is a negator"""
+    clause = _CLAUSE_BREAK.split(text[max(0, position - 40):position])[-1]
+    preceding = _WORD.findall(clause.lower())
+    return any(word in NEGATORS for word in preceding[-2:])
+
+
+def mentions(kind: str, text: str) -> bool:
+    """
+    Check whether text contains a keyword of the given kind
+
+    Single-word keywords preceded by a negator don't count; phrases are
+    taken as written (they may contain their own negation, e.g. "no thanks").
+
+    Args:
+        kind: Keyword group ("goodbye", "not_interested", "interested", "booking_confirmed", "scheduling")
+        text: Text to search
+
+    Returns:
+        True if a (non-negated) keyword is present
+    """
+    for match in _PATTERNS[kind].finditer(text):
+        if " " in match.group(0) or not _negated(text, match.start()):
+            return True
+    return False
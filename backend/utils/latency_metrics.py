@@ -0,0 +1,186 @@
+"""
+In-process latency histograms for speech turns
+
+Each stage of a turn (form parse, session lookup, completions, tools,
+TwiML render, commit) is timed with a span and recorded into a log-bucketed
+histogram (HDR-style: constant relative error, fixed memory per stage), so
+p50/p95/p99 can be read without keeping every sample.
+
+Usage:
+    metrics = get_turn_metrics()
+    with metrics.span("first_completion"):
+        ...
+    with metrics.span("check_calendar_availability", group="tools"):
+        ...
+"""
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+# Relative bucket width: ~1% error on reported percentiles
+BUCKET_GROWTH = 1.01
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+# Values below this (ms) share the first bucket
+MIN_TRACKABLE_MS = 0.01
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram.
+
+    Bucket i covers [MIN * growth^i, MIN * growth^(i+1)), so every recorded
+    value is reported within BUCKET_GROWTH relative error. Thread-safe.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    @staticmethod
+    def _bucket(value_ms: float) -> int:
+        if value_ms <= MIN_TRACKABLE_MS:
+            return 0
+        return int(math.log(value_ms / MIN_TRACKABLE_MS) / _LOG_GROWTH)
+
+    @staticmethod
+    def _bucket_value(index: int) -> float:
+        """Midpoint of a bucket (geometric)"""
+        return MIN_TRACKABLE_MS * BUCKET_GROWTH ** (index + 0.5)
+
+    def record(self, value_ms: float) -> None:
+        """
+        Record one latency sample
+
+        Args:
+            value_ms: Duration in milliseconds
+        """
+        index = self._bucket(value_ms)
+        with self._lock:
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+            self.count += 1
+            self.total_ms += value_ms
+            self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+            self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def percentiles(self, quantiles: List[float]) -> List[Optional[float]]:
+        """
+        Get latency at the given quantiles
+
+        Args:
+            quantiles: Quantiles in [0, 1], e.g. [0.5, 0.95, 0.99]
+
+        Returns:
+            Latency (ms) for each quantile, None if nothing was recorded
+        """
+        with self._lock:
+            if not self.count:
+                return [None for _ in quantiles]
+            buckets = sorted(self._buckets.items())
+            count, min_ms, max_ms = self.count, self.min_ms, self.max_ms
+
+        results = []
+        for q in quantiles:
+            target = max(1, math.ceil(q * count))
+            seen = 0
+            for index, bucket_count in buckets:
+                seen += bucket_count
+                if seen >= target:
+                    # Clamp to observed range so p0/p100 are exact
+                    results.append(min(max(self._bucket_value(index), min_ms), max_ms))
+                    break
+        return results
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """Count, mean, min/max and p50/p95/p99 (ms, rounded)"""
+        p50, p95, p99 = self.percentiles([0.50, 0.95, 0.99])
+
+        def _round(value):
+            return round(value, 2) if value is not None else None
+
+        return {
+            "count": self.count,
+            "mean_ms": _round(self.total_ms / self.count) if self.count else None,
+            "min_ms": _round(self.min_ms),
+            "p50_ms": _round(p50),
+            "p95_ms": _round(p95),
+            "p99_ms": _round(p99),
+            "max_ms": _round(self.max_ms),
+        }
+
+
+class LatencyMetrics:
+    """
+    Named groups of latency histograms (e.g. "stages" and "tools").
+    """
+
+    def __init__(self):
+        self._groups: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def histogram(self, name: str, group: str = "stages") -> LatencyHistogram:
+        """Get or create the histogram for a name within a group"""
+        with self._lock:
+            histograms = self._groups.setdefault(group, {})
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = LatencyHistogram()
+            return histogram
+
+    def record(self, name: str, value_ms: float, group: str = "stages") -> None:
+        """Record a duration directly"""
+        self.histogram(name, group).record(value_ms)
+
+    @contextmanager
+    def span(self, name: str, group: str = "stages") -> Iterator[None]:
+        """
+        Time a block of code (sync or async body) and record it
+
+        Args:
+            name: Stage or tool name
+            group: Histogram group
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000, group)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """Summaries for every histogram, by group"""
+        with self._lock:
+            groups = {group: dict(histograms) for group, histograms in self._groups.items()}
+        return {
+            group: {name: histogram.summary() for name, histogram in sorted(histograms.items())}
+            for group, histograms in groups.items()
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded samples"""
+        with self._lock:
+            self._groups = {}
+            self.started_at = time.time()
+
+
+# Global turn metrics instance
+_turn_metrics = None
+
+
+def get_turn_metrics() -> LatencyMetrics:
+    """
+    Get or create the process-wide turn latency metrics.
+
+    Returns:
+        LatencyMetrics instance
+    """
+    global _turn_metrics
+    if _turn_metrics is None:
+        _turn_metrics = LatencyMetrics()
+    return _turn_metrics
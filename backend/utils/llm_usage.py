@@ -0,0 +1,140 @@
+"""
+LLM token usage and prompt-cache accounting
+
+OpenAI caches long shared prompt prefixes automatically; the response
+`usage.prompt_tokens_details.cached_tokens` says how much of the prompt was
+served from cache. These counters make the hit ratio visible per process
+and per call.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# Completed calls kept for the per-call view
+RECENT_CALLS = 200
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read a field from an SDK model or a plain dict (older SDKs keep unknown fields as dicts)"""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Cheap token estimate (~4 characters per token)"""
+    return len(text or "") // 4 + 1
+
+
+def parse_usage(usage: Any) -> Tuple[int, int, int]:
+    """
+    Extract token counts from a completion's usage block
+
+    Args:
+        usage: `response.usage` (model, dict or None)
+
+    Returns:
+        Tuple of (prompt_tokens, cached_prompt_tokens, completion_tokens)
+    """
+    prompt_tokens = _field(usage, "prompt_tokens") or 0
+    completion_tokens = _field(usage, "completion_tokens") or 0
+    cached_tokens = _field(_field(usage, "prompt_tokens_details"), "cached_tokens") or 0
+    return prompt_tokens, cached_tokens, completion_tokens
+
+
+class LlmUsageStats:
+    """Process-wide token counters plus a window of recently finished calls"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.completion_tokens = 0
+        self.turns = 0
+        self.completions_per_turn: Dict[int, int] = {}
+        self.recent_calls: Deque[Dict[str, Any]] = deque(maxlen=RECENT_CALLS)
+
+    def record(self, usage: Any) -> Tuple[int, int, int]:
+        """
+        Record one completion's usage
+
+        Args:
+            usage: `response.usage` from the OpenAI SDK
+
+        Returns:
+            Tuple of (prompt_tokens, cached_prompt_tokens, completion_tokens)
+        """
+        prompt_tokens, cached_tokens, completion_tokens = parse_usage(usage)
+        with self._lock:
+            self.requests += 1
+            self.prompt_tokens += prompt_tokens
+            self.cached_prompt_tokens += cached_tokens
+            self.completion_tokens += completion_tokens
+        return prompt_tokens, cached_tokens, completion_tokens
+
+    def record_turn(self, completions: int) -> None:
+        """
+        Record how many completions a conversational turn needed
+
+        Args:
+            completions: Completions made for the turn (0 if answered locally)
+        """
+        with self._lock:
+            self.turns += 1
+            self.completions_per_turn[completions] = self.completions_per_turn.get(completions, 0) + 1
+
+    def finish_call(self, call_sid: str, prompt_tokens: int, cached_prompt_tokens: int, completions: int) -> None:
+        """Keep a finished call's totals for the per-call view"""
+        with self._lock:
+            self.recent_calls.append({
+                "call_sid": call_sid,
+                "completions": completions,
+                "prompt_tokens": prompt_tokens,
+                "cached_prompt_tokens": cached_prompt_tokens,
+                "cache_hit_ratio": _ratio(cached_prompt_tokens, prompt_tokens),
+                "finished_at": time.time(),
+            })
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Totals and recent calls"""
+        with self._lock:
+            return {
+                "window_seconds": round(time.time() - self.started_at, 1),
+                "requests": self.requests,
+                "prompt_tokens": self.prompt_tokens,
+                "cached_prompt_tokens": self.cached_prompt_tokens,
+                "completion_tokens": self.completion_tokens,
+                "cache_hit_ratio": _ratio(self.cached_prompt_tokens, self.prompt_tokens),
+                "turns": self.turns,
+                "completions_per_turn": dict(sorted(self.completions_per_turn.items())),
+                "mean_completions_per_turn": _ratio(
+                    sum(count * turns for count, turns in self.completions_per_turn.items()), self.turns
+                ),
+                "recent_calls": list(self.recent_calls),
+            }
+
+
+def _ratio(part: int, total: int) -> Optional[float]:
+    return round(part / total, 4) if total else None
+
+
+# Global usage stats instance
+_llm_usage_stats = None
+
+
+def get_llm_usage_stats() -> LlmUsageStats:
+    """
+    Get or create the process-wide LLM usage stats.
+
+    Returns:
+        LlmUsageStats instance
+    """
+    global _llm_usage_stats
+    if _llm_usage_stats is None:
+        _llm_usage_stats = LlmUsageStats()
+    return _llm_usage_stats
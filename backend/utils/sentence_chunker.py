@@ -0,0 +1,72 @@
+"""
+Sentence chunking for streamed LLM output
+
+Groups streamed tokens into sentence-sized pieces so TTS can start speaking
+the first sentence while the rest of the response is still being generated.
+"""
+import re
+from typing import List
+
+# Sentence end: terminal punctuation followed by whitespace, or a line break
+SENTENCE_END = re.compile(r'(?<=[.!?。！？])\s+|\n+')
+
+
+class SentenceChunker:
+    """
+    Accumulates streamed text and releases complete sentences.
+
+    Very short fragments ("Hi.", "Sure!") are merged with the next sentence
+    so TTS doesn't get a burst of tiny utterances.
+
+    Attributes:
+        min_chars: Minimum chunk length before it is released
+    """
+
+    def __init__(self, min_chars: int = 12):
+        """
+        Initialize chunker.
+
+        Args:
+            min_chars: Minimum chunk length before it is released
+        """
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> List[str]:
+        """
+        Add streamed text and return any chunks that are now complete.
+
+        Args:
+            text: Newly streamed text fragment
+
+        Returns:
+            List of complete sentence chunks (possibly empty)
+        """
+        self._buffer += text
+        chunks = []
+
+        while True:
+            match = None
+            for candidate in SENTENCE_END.finditer(self._buffer):
+                if candidate.start() >= self.min_chars:
+                    match = candidate
+                    break
+            if match is None:
+                break
+
+            chunk = self._buffer[:match.start()].strip()
+            self._buffer = self._buffer[match.end():]
+            if chunk:
+                chunks.append(chunk)
+
+        return chunks
+
+    def flush(self) -> str:
+        """
+        Return whatever text remains at the end of the stream.
+
+        Returns:
+            Remaining text (may be empty)
+        """
+        remaining, self._buffer = self._buffer.strip(), ""
+        return remaining
@@ -0,0 +1,105 @@
+"""
+Precompiled TwiML templates
+
+Most of a TwiML reply (Gather attributes, fallback prompts, Hangup) is the
+same on every turn; only the spoken text changes. A template renders the
+VoiceResponse object tree once with a placeholder, splits the XML around it,
+and afterwards produces the document by string concatenation with the text
+XML-escaped. Output is identical to str(VoiceResponse) for the same inputs
+(empty text renders as <Say></Say> rather than <Say />, which is equivalent).
+"""
+import threading
+from typing import Callable, Dict, Hashable, Tuple
+
+# Private-use codepoints: never produced by TTS text or the LLM
+PLACEHOLDER = "\ue000TWIML_TEXT\ue000"
+
+
+def escape_text(text: str) -> str:
+    """
+    Escape text for use as XML element content
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Escaped text
+    """
+    # Same escaping ElementTree applies to element text
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+class TwimlTemplate:
+    """TwiML document split around a single dynamic text slot"""
+
+    __slots__ = ("prefix", "suffix")
+
+    def __init__(self, prefix: str, suffix: str):
+        self.prefix = prefix
+        self.suffix = suffix
+
+    @classmethod
+    def compile(cls, build: Callable[[str], str]) -> "TwimlTemplate":
+        """
+        Compile a template from a TwiML builder
+
+        Args:
+            build: Function returning the TwiML string for a given text
+
+        Returns:
+            Compiled template
+        """
+        xml = build(PLACEHOLDER)
+        parts = xml.split(PLACEHOLDER)
+        if len(parts) != 2:
+            raise ValueError("TwiML builder must use the text exactly once")
+        return cls(parts[0], parts[1])
+
+    def render(self, text: str) -> str:
+        """Render the document for the given text"""
+        return self.prefix + escape_text(text) + self.suffix
+
+
+class TwimlTemplateCache:
+    """
+    Lazily compiled templates keyed by the static inputs of a builder.
+
+    Example:
+        cache = TwimlTemplateCache(lambda text, language, end_call: ...)
+        cache.render("Hello", "en", False)
+    """
+
+    def __init__(self, build: Callable[..., str]):
+        """
+        Args:
+            build: Builder taking (text, *key) and returning TwiML
+        """
+        self._build = build
+        self._templates: Dict[Tuple[Hashable, ...], TwimlTemplate] = {}
+        self._lock = threading.Lock()
+
+    def get(self, *key: Hashable) -> TwimlTemplate:
+        """Get (compiling on first use) the template for a key"""
+        template = self._templates.get(key)
+        if template is None:
+            with self._lock:
+                template = self._templates.get(key)
+                if template is None:
+                    template = TwimlTemplate.compile(lambda text: self._build(text, *key))
+                    self._templates[key] = template
+        return template
+
+    def render(self, text: str, *key: Hashable) -> str:
+        """Render text into the template for a key"""
+        return self.get(*key).render(text)
+
+    def clear(self) -> None:
+        """Drop compiled templates (e.g. after the API base URL changes)"""
+        with self._lock:
+            self._templates = {}
@@ -36,5 +36,20 @@ celery_app.conf.update(
     worker_max_tasks_per_child=50,  # Restart worker after 50 tasks
 )
 
+# Periodic tasks (run with `celery -A workers.celery_app beat`)
+celery_app.conf.beat_schedule = {
+    # Safety net for calls whose recordingStatusCallback was missed
+    'resolve-missing-recordings': {
+        'task': 'backend.workers.tasks.resolve_missing_recordings',
+        'schedule': 15 * 60,  # Every 15 minutes
+    },
+    # Free-slot index read by check_calendar_availability
+    'refresh-slot-index': {
+        'task': 'backend.workers.tasks.refresh_slot_index',
+        'schedule': settings.slot_index_refresh_seconds,
+        'options': {'expires': settings.slot_index_refresh_seconds},  # Drop runs that queued behind a slow one
+    },
+}
+
 if __name__ == '__main__':
     celery_app.start()
@@ -11,6 +11,8 @@ from backend.database import get_db_context
 from backend.models import Lead, Call, CallOutcome, LeadStatus, Meeting, MeetingStatus, ConversationHistory, SpeakerRole, Setting
 from backend.services import TwilioService, CalendarService
 from backend.services.llm_service import LLMService, ConversationIntent
+from backend.services.rate_governor import RateBudgetExceeded
+from backend.services.slot_index import get_slot_index
 from backend.services.zoom_service import ZoomService
 from backend.config import get_settings
 
@@ -123,12 +125,14 @@ def initiate_call(self, lead_id: int):
             # Construct callback URLs
             callback_url = f"{settings.api_base_url}/api/webhooks/twilio/voice"
             status_callback_url = f"{settings.api_base_url}/api/webhooks/twilio/status"
+            recording_status_callback_url = f"{settings.api_base_url}/api/webhooks/twilio/recording-status"
 
             # Initiate Twilio call
             call_sid = self.twilio.initiate_call(
                 to_phone_number=lead.phone,
                 callback_url=callback_url,
-                status_callback_url=status_callback_url
+                status_callback_url=status_callback_url,
+                recording_status_callback_url=recording_status_callback_url
             )
 
             if call_sid:
@@ -158,11 +162,14 @@ def initiate_call(self, lead_id: int):
 
 
 
-@celery_app.task(base=CallTask, bind=True)
+@celery_app.task(base=CallTask, bind=True, max_retries=5)
 def finalize_call(self, call_id: int):
     """
     Finalize call with tool usage summary
 
+    The summary is background work: while the shared OpenAI budget is tight
+    the task is retried later, and only the last attempt summarizes regardless.
+
     Args:
         call_id: Call ID
     """
@@ -194,7 +201,7 @@ def finalize_call(self, call_id: int):
             import asyncio
             loop = asyncio.get_event_loop()
             summary = loop.run_until_complete(
-                self.llm.summarize_call(transcript_text)
+                self.llm.summarize_call(transcript_text, defer_if_busy=self.request.retries < self.max_retries)
             )
 
             if meeting:
@@ -213,12 +220,83 @@ def finalize_call(self, call_id: int):
                 "meeting_id": meeting.id if meeting else None
             }
 
+    except RateBudgetExceeded as e:
+        logger.info(f"Deferring summary for call {call_id}: {e}")
+        raise self.retry(exc=e, countdown=max(1, round(e.retry_after)))
     except Exception as e:
         logger.error(f"Error finalizing call: {str(e)}")
         return {"success": False, "error": str(e)}
 
 
+@celery_app.task(base=CallTask, bind=True)
+def resolve_missing_recordings(self, lookback_hours: int = 24):
+    """
+    Backfill recording URLs for ended calls whose recording callback never arrived
+
+    Resolves all of them with one Twilio list request instead of one
+    request per call.
+
+    Args:
+        lookback_hours: How far back to look for ended calls
+    """
+    try:
+        since = datetime.utcnow() - timedelta(hours=lookback_hours)
+
+        with get_db_context() as db:
+            calls = db.query(Call).filter(
+                Call.ended_at >= since,
+                Call.recording_url.is_(None),
+                Call.twilio_call_sid.isnot(None)
+            ).all()
+
+            if not calls:
+                return {"success": True, "resolved": 0}
+
+            urls = self.twilio.get_recording_urls(
+                [call.twilio_call_sid for call in calls],
+                created_after=since
+            )
+
+            for call in calls:
+                if call.twilio_call_sid in urls:
+                    call.recording_url = urls[call.twilio_call_sid]
+
+            logger.info(f"Resolved {len(urls)}/{len(calls)} missing recording URLs")
+            return {"success": True, "resolved": len(urls), "pending": len(calls) - len(urls)}
+
+    except Exception as e:
+        logger.error(f"Error resolving recordings: {str(e)}")
+        return {"success": False, "error": str(e)}
+
+
+@celery_app.task(base=CallTask, bind=True)
+def refresh_slot_index(self):
+    """
+    Sync the free-slot index of every indexed calendar (runs on beat)
+
+    Incremental via Google events sync tokens; see services/slot_index.py.
+    """
+    if not settings.slot_index_enabled:
+        return {"success": True, "skipped": True}
+
+    index = get_slot_index()
+    results = {}
+    for calendar_id in index.calendar_ids():
+        try:
+            results[calendar_id] = index.refresh(self.calendar, calendar_id)
+        except Exception as e:
+            logger.error(f"Error refreshing slot index for {calendar_id}: {str(e)}")
+            results[calendar_id] = {"error": str(e)}
+
+    return {
+        "success": all("error" not in result for result in results.values()),
+        "calendars": results
+    }
+
+
 __all__ = [
     "initiate_call",
-    "finalize_call"
+    "finalize_call",
+    "resolve_missing_recordings",
+    "refresh_slot_index"
 ]